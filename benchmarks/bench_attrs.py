@@ -0,0 +1,90 @@
+"""Microbenchmark of the attribute formatter table against singledispatchmethod.
+
+Run from the repository root with `python benchmarks/bench_attrs.py`.
+"""
+import json
+import sys
+import timeit
+from functools import singledispatchmethod
+from pathlib import Path
+from typing import Union
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from sweetpotato.components import View
+from sweetpotato.core.base_management import Function, Props, State
+
+ATTRIBUTES: int = 100_000  #: Number of formatted attributes.
+
+
+class DispatchedView(View):
+    """View formatting attributes through singledispatchmethod, as before the table."""
+
+    @property
+    def attrs(self) -> str:
+        return " ".join([self._dispatch_attr(v, k) for k, v in self._attrs.items()])
+
+    @singledispatchmethod
+    def _dispatch_attr(self, attr, key) -> AttributeError:
+        raise AttributeError(f"{attr} {key} not in allowed types")
+
+    @_dispatch_attr.register(State)
+    @_dispatch_attr.register(Props)
+    def _(self, attr: Union[State, Props], _) -> str:
+        return self._make_state_or_prop_attrs(attr)
+
+    @_dispatch_attr.register(dict)
+    @_dispatch_attr.register(Function)
+    def _(self, attr: Union[dict, Function], key: str) -> str:
+        return self._make_key_w_attr(key, attr)
+
+    @_dispatch_attr.register(str)
+    def _(self, attr: str, key: str):
+        return self._make_key_w_attr(key, f"`{attr}`")
+
+    @_dispatch_attr.register(bool)
+    def _(self, attr: bool, key: str) -> str:
+        return self._make_key_w_attr(key, json.dumps(attr))
+
+
+def components(component_class: type) -> list[View]:
+    """Returns components holding `ATTRIBUTES` attributes of mixed types in total."""
+    state = State({"count": 0})
+    setter = Function(value="1", name="setCount", is_functional=True)
+    kwargs = {
+        "style": {"flex": 1},
+        "accessibilityHint": "row",
+        "nativeID": "row",
+        "accessibilityLabel": "row",
+        "accessible": True,
+        "collapsable": False,
+        "focusable": True,
+        "onLayout": setter,
+        "pointerEvents": "box-none",
+    }
+    per_component = len(kwargs) + 1
+    return [
+        component_class(state=state, **kwargs)
+        for _ in range(ATTRIBUTES // per_component)
+    ]
+
+
+def main() -> None:
+    """Times formatting the attributes of every component."""
+    table = components(View)
+    dispatched = components(DispatchedView)
+    assert [c.attrs for c in table] == [c.attrs for c in dispatched]
+    results = {}
+    for name, tree in (("singledispatch", dispatched), ("table", table)):
+        results[name] = min(
+            timeit.repeat(lambda: [c.attrs for c in tree], number=1, repeat=7)
+        )
+        sys.stdout.write(f"{name:>14}: {results[name] * 1e3:8.2f} ms\n")
+    sys.stdout.write(
+        f"{'speedup':>14}: {results['singledispatch'] / results['table']:8.2f}x\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
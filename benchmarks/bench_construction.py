@@ -0,0 +1,44 @@
+"""Benchmark of bulk component construction with and without prop validation.
+
+Run from the repository root with `python benchmarks/bench_construction.py`.
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from sweetpotato.components import Image, Text, View
+from sweetpotato.core.base import no_validation
+
+COMPONENTS: int = 100_000  #: Number of components constructed per run.
+
+
+def construct() -> list[View]:
+    """Constructs rows of a View holding a Text and an Image, three components each."""
+    return [
+        View(
+            style={"flexDirection": "row"},
+            children=[
+                Text(text="row", numberOfLines=1),
+                Image(source={"uri": "a.png"}),
+            ],
+        )
+        for _ in range(COMPONENTS // 3)
+    ]
+
+
+def main() -> None:
+    """Times construction with validation and in a no validation context."""
+    validated = min(timeit.repeat(construct, number=1, repeat=5))
+    with no_validation():
+        unvalidated = min(timeit.repeat(construct, number=1, repeat=5))
+    sys.stdout.write(
+        f"{COMPONENTS} components: validated {validated * 1e3:8.2f} ms, "
+        f"no validation {unvalidated * 1e3:8.2f} ms ({validated / unvalidated:4.2f}x)\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
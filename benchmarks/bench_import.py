@@ -0,0 +1,71 @@
+"""Benchmark of the import time of sweetpotato modules.
+
+Imports each module in fresh interpreters with `python -X importtime` and reports the
+best cumulative time of the module and its slowest sweetpotato submodules. Exits with
+status 1 if `sweetpotato.app` takes longer than `BUDGET_MS`. Run from the repository
+root with `python benchmarks/bench_import.py [module ...]`.
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parent.parent / "src"
+MODULES: tuple[str, ...] = (
+    "sweetpotato.app",
+    "sweetpotato.components",
+)  #: Timed modules.
+BUDGET_MS: float = 120.0  #: Budget of the cumulative import time of `sweetpotato.app`.
+REPEAT: int = 5  #: Number of fresh interpreters per module.
+SLOWEST: int = 5  #: Number of slowest submodules reported.
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Returns self and cumulative import time, in microseconds, of each imported module."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SOURCE,
+        env=os.environ | {"PYTHONPATH": str(SOURCE)},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in output.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if own.strip().isdigit():
+            times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def main() -> int:
+    """Times the import of each module, returning 1 if the budget is exceeded."""
+    status = 0
+    for module in sys.argv[1:] or MODULES:
+        runs = [import_times(module) for _ in range(REPEAT)]
+        best = min(runs, key=lambda times: times[module][1])
+        total = best[module][1] / 1e3
+        budget = ""
+        if module == "sweetpotato.app":
+            budget = f", budget {BUDGET_MS:.0f} ms"
+            if total > BUDGET_MS:
+                budget += " exceeded"
+                status = 1
+        sys.stdout.write(f"{module}: {total:.1f} ms{budget}, {len(best)} modules\n")
+        submodules = sorted(
+            (
+                (times[0], name)
+                for name, times in best.items()
+                if name.startswith("sweetpotato") and name != module
+            ),
+            reverse=True,
+        )
+        for own, name in submodules[:SLOWEST]:
+            sys.stdout.write(f"    {name:<45} {own / 1e3:6.1f} ms\n")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
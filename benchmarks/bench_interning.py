@@ -0,0 +1,71 @@
+"""Benchmark of interned leaves on a repetitive tree.
+
+Measures building the tree and streaming its rendition, along with the memory it
+holds, with and without interning. Run from the repository root with
+`python benchmarks/bench_interning.py`.
+"""
+import gc
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from sweetpotato.components import Image, Text, View
+from sweetpotato.core.interning import intern
+from sweetpotato.core.renderer import Renderer
+
+ROWS: int = 2_000  #: Number of rows, each holding repeated leaves.
+
+
+def tree(leaf: Callable) -> View:
+    """Returns a catalogue screen of rows of repeated leaves and one distinct Text."""
+    rows = []
+    for index in range(ROWS):
+        children = [
+            leaf(Image(source={"uri": "bullet.png"})),
+            leaf(Text(text="—")),
+            Text(text=f"row {index}"),
+            leaf(Text(text="—")),
+            leaf(View(style={"height": 1})),
+        ]
+        rows.append(View(children=children))
+    return View(children=rows)
+
+
+def measure(leaf: Callable) -> tuple[float, float, int, str]:
+    """Returns build and render seconds, allocated bytes and the rendition."""
+    gc.collect()
+    tracemalloc.start()
+    screen = tree(leaf)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del screen
+    gc.collect()
+    start = time.perf_counter()
+    screen = tree(leaf)
+    built = time.perf_counter()
+    buffer = io.StringIO()
+    rendered = time.perf_counter()
+    Renderer(buffer).render(screen)
+    return built - start, time.perf_counter() - rendered, allocated, buffer.getvalue()
+
+
+def main() -> None:
+    """Compares plain and interned leaves."""
+    leaves = (("plain", lambda component: component), ("interned", intern))
+    results = {name: measure(leaf) for name, leaf in leaves}
+    assert results["plain"][3] == results["interned"][3]
+    for name, (build, render, allocated, _) in results.items():
+        sys.stdout.write(
+            f"{name:>9}: build {build * 1e3:7.2f} ms, render {render * 1e3:7.2f} ms, "
+            f"held {allocated / 2 ** 20:6.2f} MiB\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark of parallel builds against a serial one.
+
+Builds generated screens serially and on a pool of forked workers. Builds whose
+workers would be spawned are written serially, pickling the screens is timed on its
+own, it is what shipping them to spawned workers would cost.
+Run from the repository root with `python benchmarks/bench_parallel.py`.
+"""
+import os
+import pickle
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from sweetpotato.components import Image, Text, View
+from sweetpotato.config import settings
+from sweetpotato.core.base import ComponentRegistry, RootComponent
+from sweetpotato.core.build import Build
+from sweetpotato.core.traversal import preorder
+
+SCREENS: int = 8  #: Number of generated screens.
+ROWS: int = 5000  #: Number of rows per screen.
+JOBS: int = 4  #: Number of worker processes.
+
+
+def screen(number: int) -> RootComponent:
+    """Returns a generated screen of rows of leaves."""
+    rows = [
+        View(
+            style={"flexDirection": "row"},
+            children=[Image(source={"uri": "icon.png"}), Text(text=f"row {index}")],
+        )
+        for index in range(ROWS)
+    ]
+    return RootComponent(
+        component_name=f"Generated{number}", children=[View(children=rows)]
+    )
+
+
+def cold() -> None:
+    """Drops memoized renditions of every registered screen."""
+    for root in ComponentRegistry._registry.values():
+        for component in preorder(root._children, RootComponent._nested_children):
+            component._render_cache = component._parts_cache = None
+
+
+def main() -> None:
+    """Times serial and forked builds of generated screens."""
+    settings.FORMATTER = None
+    screens = [screen(number) for number in range(SCREENS)]
+    with tempfile.TemporaryDirectory() as directory:
+        for name, jobs, start_method in (
+            ("serial", 1, Build.start_method),
+            ("fork", JOBS, "fork"),
+        ):
+            with mock.patch.object(Build, "start_method", start_method):
+                elapsed = min(
+                    timeit.repeat(
+                        lambda jobs=jobs: Build.write_files(
+                            use_cache=False,
+                            incremental=False,
+                            jobs=jobs,
+                            output_dir=directory,
+                        ),
+                        cold,
+                        number=1,
+                        repeat=3,
+                    )
+                )
+            sys.stdout.write(f"{name:>8}: {elapsed * 1e3:8.2f} ms\n")
+    pickling = min(
+        timeit.repeat(lambda: [pickle.dumps(s) for s in screens], number=1, repeat=3)
+    )
+    sys.stdout.write(
+        f"  pickle: {pickling * 1e3:8.2f} ms, "
+        f"{sum(len(pickle.dumps(s)) for s in screens) / 2**20:.2f} MiB, "
+        f"{SCREENS * (ROWS * 3 + 1)} components, {os.cpu_count()} CPUs\n"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark of streaming rendering against nested string building.
+
+Run from the repository root with `python benchmarks/bench_render.py`.
+"""
+import io
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from sweetpotato.components import Text, View
+from sweetpotato.core.renderer import render
+from sweetpotato.core.traversal import preorder
+
+NODES: int = 10_000  #: Number of components per screen.
+
+
+def nested_repr(component) -> str:
+    """Renders a component the way nested `__repr__`/`children` calls did."""
+    if not component.is_composite:
+        return component._render_parts()[0]
+    if component._children:
+        children = "".join(map(nested_repr, component._children))
+        return f"<{component.component_name} {component.attrs}>{children}</{component.component_name}>"
+    return f"<{component.component_name} {component.attrs}/>"
+
+
+def deep_screen(nodes: int, width: int) -> View:
+    """Builds a screen of nested Views, each holding `width` Text leaves."""
+    component = View(children=[Text(text="leaf") for _ in range(width)])
+    for _ in range(nodes // (width + 1) - 1):
+        component = View(
+            children=[component, *(Text(text="leaf") for _ in range(width))]
+        )
+    return component
+
+
+def wide_screen(nodes: int) -> View:
+    """Builds a screen of a single View holding Text leaves."""
+    return View(children=[Text(text="leaf") for _ in range(nodes - 1)])
+
+
+def cold(screen: View) -> View:
+    """Drops memoized renditions of every component in screen."""
+    for component in preorder(
+        [screen], lambda c: c._children if c.is_composite else None
+    ):
+        component._render_cache = component._parts_cache = None
+    return screen
+
+
+def last_leaf(screen: View) -> Text:
+    """Returns the last leaf of screen in document order."""
+    leaf = screen
+    while leaf.is_composite:
+        leaf = leaf._children[-1]
+    return leaf
+
+
+def main() -> None:
+    """Times both strategies on deep and wide 10k-node screens."""
+    sys.setrecursionlimit(10 * NODES)
+    screens = (
+        ("wide", wide_screen(NODES)),
+        ("deep-250", deep_screen(NODES, width=39)),
+        ("deep-2000", deep_screen(NODES, width=4)),
+    )
+    for name, screen in screens:
+        assert nested_repr(screen) == render(cold(screen))
+        leaf = last_leaf(screen)
+        nested = min(
+            timeit.repeat(lambda: nested_repr(cold(screen)), number=5, repeat=5)
+        )
+        streamed = min(
+            timeit.repeat(
+                lambda: render(cold(screen), io.StringIO()), number=5, repeat=5
+            )
+        )
+        memoized = min(timeit.repeat(lambda: render(cold(screen)), number=5, repeat=5))
+        edited = min(
+            timeit.repeat(
+                lambda: (leaf._attrs.update(testID="edited"), render(screen)),
+                setup=lambda: render(screen),
+                number=1,
+                repeat=25,
+            )
+        )
+        sys.stdout.write(
+            f"{name:>9}: nested {nested / 5 * 1e3:8.2f} ms, "
+            f"streamed {streamed / 5 * 1e3:8.2f} ms ({nested / streamed:5.2f}x), "
+            f"memoized {memoized / 5 * 1e3:8.2f} ms, "
+            f"one-node edit {edited * 1e3:8.2f} ms\n"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Benchmark suite timing the phases of a build on synthetic apps.
+
+Scenarios are apps of wide and deep screens, many navigator screens, heavy State and
+Props usage and UI Kitten, navigation and authentication wrapping, see
+:mod:`benchmarks.suite.apps`. Construction, `_set_parent`, rendering, serialization and
+writing are timed on each, see :mod:`benchmarks.suite.runner`. Node is not needed,
+screens are written unformatted.
+
+Run from the repository root with `python -m benchmarks.suite`, results are saved with
+`--output results.json` and compared to saved results with `--baseline results.json`,
+exiting with status 1 if a phase is slower than the baseline by more than `--threshold`.
+`--scale 0.1` runs the suite on apps a tenth of the size.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src"))
@@ -0,0 +1,6 @@
+"""Runs the benchmark suite, see `python -m benchmarks.suite --help`."""
+import sys
+
+from benchmarks.suite.runner import main
+
+sys.exit(main())
@@ -0,0 +1,159 @@
+"""Synthetic apps the suite is run on, each stressing one shape of component tree.
+
+Every app is created by a function taking a scale, `1.0` for the default size, into the
+current component registry. Apps are created from scratch on each call, so they can be
+timed repeatedly, in the settings of their scenario.
+"""
+from typing import Any, Callable, NamedTuple
+
+from sweetpotato.components import Button, Image, Text, TextInput, View
+from sweetpotato.core.base import RootComponent
+from sweetpotato.core.base_management import Props, State
+from sweetpotato.core.context_wrappers import ContextWrapper
+
+WIDE_ROWS: int = 3_000  #: Rows of the wide screen, three components each.
+DEEP_LEVELS: int = 1_000  #: Levels of nested Views of the deep screen.
+NAVIGATOR_SCREENS: int = 300  #: Screens of the navigator.
+STATEFUL_SCREENS: int = 40  #: Class components of the stateful app.
+STATE_VALUES: int = 25  #: State values of each stateful class component.
+WRAPPED_SCREENS: int = 100  #: Tab screens of the wrapped app.
+
+
+class Scenario(NamedTuple):
+    """Synthetic app and the settings it is created and written in.
+
+    Attributes:
+        name: Name of scenario.
+        description: What the app stresses.
+        create: Function creating the app at a scale into the component registry.
+        settings: Settings of the scenario by name, the others keep their value.
+    """
+
+    name: str
+    description: str
+    create: Callable[[float], None]
+    settings: dict[str, Any] = {}
+
+
+def _scaled(count: int, scale: float) -> int:
+    return max(1, round(count * scale))
+
+
+def wide(scale: float) -> None:
+    """Creates an app of one screen holding a long list of rows."""
+    rows = [
+        View(
+            style={"flexDirection": "row", "padding": 4},
+            children=[
+                Image(source={"uri": f"https://example.com/{index}.png"}),
+                Text(text=f"row {index}", numberOfLines=1),
+            ],
+        )
+        for index in range(_scaled(WIDE_ROWS, scale))
+    ]
+    ContextWrapper().wrap(View(style={"flex": 1}, children=rows))
+
+
+def deep(scale: float) -> None:
+    """Creates an app of one screen of Views nested in one another."""
+    component = View(children=[Text(text="leaf")])
+    for level in range(_scaled(DEEP_LEVELS, scale)):
+        component = View(
+            style={"margin": level % 4}, children=[Text(text="level"), component]
+        )
+    ContextWrapper().wrap(component)
+
+
+def navigator(scale: float) -> None:
+    """Creates an app of a stack navigator holding many screens."""
+    # pylint: disable=import-outside-toplevel
+    from sweetpotato.navigation import create_native_stack_navigator
+
+    stack = create_native_stack_navigator("stack")
+    for index in range(_scaled(NAVIGATOR_SCREENS, scale)):
+        stack.screen(
+            screen_name=f"Screen {index}",
+            children=[
+                View(
+                    style={"flex": 1, "alignItems": "center"},
+                    children=[
+                        Text(text=f"Screen {index}"),
+                        Button(
+                            title="Next", onPress=f"() => navigate('Screen{index + 1}')"
+                        ),
+                    ],
+                )
+            ],
+        )
+    ContextWrapper().wrap(stack)
+
+
+def stateful(scale: float) -> None:
+    """Creates an app of class components with many state values and props."""
+    screens = []
+    for index in range(_scaled(STATEFUL_SCREENS, scale)):
+        state = State({f"value{key}": key for key in range(STATE_VALUES)})
+        RootComponent.register(state)
+        props = Props(state)
+        rows = []
+        for key in state.values:
+            setter, value = state.use_state(key, increment=1)
+            rows.append(
+                View(
+                    state=state,
+                    children=[
+                        Text(text=f"{key}: {value}, was {props[key]}"),
+                        Button(title=f"Increment {key}", onPress=setter),
+                    ],
+                )
+            )
+        screens.append(
+            RootComponent(
+                component_name=f"Counter {index}",
+                state=state,
+                children=[View(style={"flex": 1}, children=rows)],
+            )
+        )
+    ContextWrapper().wrap(View(children=screens))
+
+
+def wrapped(scale: float) -> None:
+    """Creates a UI Kitten app of tab screens, with navigation and authentication."""
+    # pylint: disable=import-outside-toplevel
+    from sweetpotato.navigation import create_bottom_tab_navigator
+    from sweetpotato.ui_kitten import Button as KittenButton
+    from sweetpotato.ui_kitten import Layout
+    from sweetpotato.ui_kitten import Text as KittenText
+
+    tab = create_bottom_tab_navigator("tab")
+    for index in range(_scaled(WRAPPED_SCREENS, scale)):
+        tab.screen(
+            screen_name=f"Tab {index}",
+            children=[
+                Layout(
+                    style={"flex": 1, "justifyContent": "center"},
+                    children=[
+                        KittenText(text=f"Tab {index}"),
+                        TextInput(placeholder="Search"),
+                        KittenButton(title="Logout", onPress="() => this.logout()"),
+                    ],
+                )
+            ],
+        )
+    ContextWrapper().wrap(tab, theme="dark")
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("wide", "one screen of many sibling rows", wide),
+    Scenario("deep", "one screen of deeply nested Views", deep),
+    Scenario(
+        "navigator", "many stack navigator screens", navigator, {"USE_NAVIGATION": True}
+    ),
+    Scenario("stateful", "class components with heavy State and Props usage", stateful),
+    Scenario(
+        "wrapped",
+        "UI Kitten, navigation and authentication wrapping",
+        wrapped,
+        {"USE_UI_KITTEN": True, "USE_NAVIGATION": True, "USE_AUTHENTICATION": True},
+    ),
+)  #: Scenarios of the suite, in the order they are run.
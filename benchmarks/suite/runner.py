@@ -0,0 +1,341 @@
+"""Times the phases of a build on the synthetic apps, and compares results to a baseline.
+
+Each phase is timed `warmup + repeat` times on the app of a scenario. Before each run the
+state the phase works on is reset, the garbage is collected and the garbage collector is
+disabled while timing, as in :mod:`timeit`. The minimum of the runs, the least disturbed
+by the rest of the machine, is what results are compared on, the median and maximum are
+kept to tell how noisy a run was.
+
+Phases:
+
+* `construct`: creation of the app, components, screens and context wrapping.
+* `set_parent`: collection of imports, functions and styles of every screen.
+* `render`: streaming of the children of every screen, renditions dropped beforehand.
+* `serialize`: serialization of every screen, renditions dropped beforehand.
+* `write`: a full, unformatted build of the app into a temporary expo project.
+"""
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
+
+from sweetpotato.core.base import RootComponent
+from sweetpotato.core.build import Build
+from sweetpotato.core.renderer import Renderer
+from sweetpotato.core.traversal import preorder
+from sweetpotato.core.variants import Variant
+
+from benchmarks.suite.apps import SCENARIOS, Scenario
+
+FORMAT: int = 1  #: Version of the results format.
+REPEAT: int = 7  #: Timed runs of each phase.
+WARMUP: int = 1  #: Untimed runs of each phase before the timed ones.
+THRESHOLD: float = (
+    0.10  #: Slowdown of the minimum over the baseline reported as regression.
+)
+
+Results = dict[str, dict[str, dict[str, Union[float, list[float]]]]]
+
+
+def measure(
+    run: Callable[[], object],
+    setup: Optional[Callable[[], object]] = None,
+    repeat: int = REPEAT,
+    warmup: int = WARMUP,
+) -> dict[str, Union[float, list[float]]]:
+    """Returns the minimum, median and maximum time of run, in seconds, and every run.
+
+    Args:
+        run: Timed function.
+        setup: Untimed function resetting the state run works on, called before each run.
+        repeat: Number of timed runs.
+        warmup: Number of untimed runs first.
+    """
+    runs = []
+    enabled = gc.isenabled()
+    for index in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+        finally:
+            if enabled:
+                gc.enable()
+        if index >= warmup:
+            runs.append(elapsed)
+    return {
+        "min": min(runs),
+        "median": statistics.median(runs),
+        "max": max(runs),
+        "runs": runs,
+    }
+
+
+def cold(roots: Iterable[RootComponent]) -> None:
+    """Drops memoized renditions of every component of the screens."""
+    for root in roots:
+        children = root._children
+        for component in preorder(
+            children, lambda c: c._children if c.is_composite else None
+        ):
+            component._render_cache = component._parts_cache = None
+
+
+def collected(roots: list[RootComponent]) -> Callable[[], None]:
+    """Returns a function resetting what `_set_parent` collected on the screens."""
+    lengths = []
+    for root in roots:
+        composites = sum(
+            child.is_composite
+            for child in preorder(root._children, root._nested_children)
+        )
+        lengths.append(
+            (len(root._functions) - composites, len(root._variables) - composites)
+        )
+
+    def reset() -> None:
+        for root, (functions, variables) in zip(roots, lengths):
+            root._imports, root._styles = {}, []
+            del root._functions[functions:], root._variables[variables:]
+
+    return reset
+
+
+def run_scenario(
+    scenario: Scenario, scale: float = 1.0, repeat: int = REPEAT, warmup: int = WARMUP
+) -> dict[str, dict[str, Union[float, list[float]]]]:
+    """Returns the timings of each phase on the app of a scenario.
+
+    The app is created into an empty component registry, in the settings of the
+    scenario with formatting off, both restored afterwards.
+    """
+    timings = {}
+    with tempfile.TemporaryDirectory() as directory:
+        variant = Variant(
+            scenario.name, directory, settings={**scenario.settings, "FORMATTER": None}
+        )
+        with variant.applied() as registry:
+            timings["construct"] = measure(
+                lambda: scenario.create(scale), registry.clear, repeat, warmup
+            )
+            roots = list(registry.values())
+            timings["set_parent"] = measure(
+                lambda: [root._set_parent(root._children) for root in roots],
+                collected(roots),
+                repeat,
+                warmup,
+            )
+            registry.clear()
+            scenario.create(scale)
+            roots = list(registry.values())
+            renderer = Renderer(io.StringIO())
+            timings["render"] = measure(
+                lambda: [renderer.render_children(root._children) for root in roots],
+                lambda: cold(roots),
+                repeat,
+                warmup,
+            )
+            timings["serialize"] = measure(
+                lambda: [root.serialize() for root in roots],
+                lambda: cold(roots),
+                repeat,
+                warmup,
+            )
+            timings["write"] = measure(
+                lambda: Build.write_files(
+                    use_cache=False,
+                    incremental=False,
+                    jobs=1,
+                    output_dir=variant.output_dir,
+                ),
+                lambda: cold(roots),
+                repeat,
+                warmup,
+            )
+    return timings
+
+
+def environment() -> dict:
+    """Returns the interpreter, machine and revision results were taken on."""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        revision = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "revision": revision,
+    }
+
+
+def run(
+    scenarios: Optional[Iterable[str]] = None,
+    scale: float = 1.0,
+    repeat: int = REPEAT,
+    warmup: int = WARMUP,
+) -> dict:
+    """Runs scenarios, all of them by default, and returns their results.
+
+    Results hold the environment and configuration of the run, and the timings of each
+    phase by scenario, see :func:`measure`.
+    """
+    names = set(scenarios) if scenarios else None
+    results: Results = {}
+    for scenario in SCENARIOS:
+        if names is None or scenario.name in names:
+            results[scenario.name] = run_scenario(scenario, scale, repeat, warmup)
+    return {
+        "format": FORMAT,
+        "environment": environment(),
+        "config": {"scale": scale, "repeat": repeat, "warmup": warmup},
+        "results": results,
+    }
+
+
+def save(report: dict, path: Union[str, Path]) -> None:
+    """Writes results to a JSON file."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+        file.write("\n")
+
+
+def load(path: Union[str, Path]) -> dict:
+    """Reads results from a JSON file, raising `ValueError` for another format version."""
+    with open(path, encoding="utf-8") as file:
+        report = json.load(file)
+    if report.get("format") != FORMAT:
+        raise ValueError(
+            f"{path} holds results of format {report.get('format')}, not {FORMAT}."
+        )
+    return report
+
+
+def compare(
+    report: dict, baseline: dict, threshold: float = THRESHOLD
+) -> list[tuple[str, str, float, float, bool]]:
+    """Compares the minimum time of each phase to a baseline.
+
+    Phases missing from the baseline are not compared.
+
+    Args:
+        report: Results of the run.
+        baseline: Results compared to, taken at the same scale.
+        threshold: Relative slowdown reported as regression, `0.1` for 10%.
+
+    Returns:
+        Scenario, phase, baseline and current minimum in seconds and whether the phase
+        regressed, of each compared phase.
+
+    Raises:
+        ValueError: If the results were taken at different scales.
+    """
+    if report["config"]["scale"] != baseline["config"]["scale"]:
+        raise ValueError(
+            f"Results at scale {report['config']['scale']} can't be compared to a baseline "
+            f"at scale {baseline['config']['scale']}."
+        )
+    compared = []
+    for scenario, timings in report["results"].items():
+        for phase, timing in timings.items():
+            base = baseline["results"].get(scenario, {}).get(phase)
+            if base is not None:
+                current, previous = timing["min"], base["min"]
+                compared.append(
+                    (
+                        scenario,
+                        phase,
+                        previous,
+                        current,
+                        current > previous * (1 + threshold),
+                    )
+                )
+    return compared
+
+
+def table(report: dict, compared: Optional[list] = None) -> str:
+    """Returns a plain text table of results, and of their comparison to a baseline."""
+    changes = {(scenario, phase): row for scenario, phase, *row in compared or ()}
+    header = f"{'scenario':<10} {'phase':<11} {'min ms':>10} {'median ms':>10}"
+    if compared is not None:
+        header += f" {'base ms':>10} {'change':>8}"
+    lines = [header]
+    for scenario, timings in report["results"].items():
+        for phase, timing in timings.items():
+            line = (
+                f"{scenario:<10} {phase:<11} {timing['min'] * 1e3:>10.2f} "
+                f"{timing['median'] * 1e3:>10.2f}"
+            )
+            if (scenario, phase) in changes:
+                previous, current, regressed = changes[scenario, phase]
+                line += f" {previous * 1e3:>10.2f} {current / previous - 1:>+8.1%}"
+                line += " REGRESSED" if regressed else ""
+            lines.append(line)
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Runs the suite from the command line, returns 1 if a phase regressed."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description=__doc__.split("\n", 1)[0]
+    )
+    parser.add_argument(
+        "-s",
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="scenario to run, every scenario by default, may be repeated",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="size of the apps")
+    parser.add_argument(
+        "--repeat", type=int, default=REPEAT, help="timed runs per phase"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=WARMUP, help="untimed runs per phase"
+    )
+    parser.add_argument("-o", "--output", help="JSON file the results are written to")
+    parser.add_argument("-b", "--baseline", help="JSON file of results compared to")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=THRESHOLD,
+        help=f"slowdown reported as regression, {THRESHOLD} by default",
+    )
+    args = parser.parse_args(argv)
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load(args.baseline)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        if baseline["config"]["scale"] != args.scale:
+            parser.error(
+                f"{args.baseline} was taken at scale {baseline['config']['scale']}."
+            )
+    report = run(args.scenario, args.scale, args.repeat, args.warmup)
+    if args.output:
+        save(report, args.output)
+    compared = compare(report, baseline, args.threshold) if baseline else None
+    sys.stdout.write(table(report, compared))
+    return int(any(regressed for *_, regressed in compared or ()))
@@ -3,7 +3,8 @@
 Todos:
     * Add module docstrings
 """
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 
 from sweetpotato.components import View
 from sweetpotato.core.base_management import State
@@ -29,8 +30,8 @@ class App:
 
     Args:
         component: Top level component, default is the sweetpotato welcome screen.
-        context: Context wrapper for application.
-        build: Build tools for application.
+        context: Context wrapper for application, a new `ContextWrapper` by default.
+        build: Build tools for application, a new `Build` by default.
         theme: Theme of @eva-design/eva, one of dark, light.
         kwargs: Arbitrary keyword arguments.
 
@@ -41,30 +42,48 @@ class App:
     def __init__(
         self,
         component: Optional[CompositeVar] = None,
-        context: Optional[ContextWrapper] = ContextWrapper(),
-        build: Optional[Build] = Build(),
+        context: Optional[ContextWrapper] = None,
+        build: Optional[Build] = None,
         theme: Optional[str] = None,
-        state: Optional[State] = State(),
+        state: Optional[State] = None,
         is_functional: Optional[bool] = False,
         **kwargs,
     ) -> None:
-        self._context = context
-        self._build = build
+        self._context = context if context is not None else ContextWrapper()
+        self._build = build if build is not None else Build()
         self._context.wrap(
             component if component else default_screen(),
             theme=theme,
-            state=state,
+            state=state if state is not None else State(),
             is_functional=is_functional,
             **kwargs,
         )
 
-    def run(self, platform: Optional[str] = "") -> None:
+    def run(
+        self,
+        platform: Optional[str] = "",
+        use_cache: bool = True,
+        watch: bool = False,
+        profile_memory: bool = False,
+    ) -> None:
         """Starts a React Native expo client through a subprocess.
 
         Args:
             platform: Platform for expo to run application on, one of ios, android, and web.
+            use_cache: Whether to serve unchanged screens from the render cache,
+                passing `--no-cache` on the command line also disables it.
+            watch: Whether to keep expo running and rebuild changed screens whenever
+                the app's Python modules change, until interrupted.
+            profile_memory: Whether to profile the memory of the build, printing a
+                summary and writing the profile to `memory.json` in the cache folder.
         """
-        self._build.run(platform=platform)
+        self._build.require()
+        self._build.run(
+            platform=platform,
+            use_cache=use_cache,
+            watch=watch,
+            profile_memory=profile_memory,
+        )
 
     def publish(self, platform: str) -> None:
         """Publishes app to specified platform / application store.
@@ -72,11 +91,26 @@ class App:
         Args:
             platform: Platform for app to be published on.
         """
+        self._build.require(["eas"])
         self._build.publish(platform=platform)
 
-    def write_files(self) -> None:
-        """Writes js files without running the application."""
-        self._build.write_files()
+    def write_files(
+        self,
+        use_cache: bool = True,
+        output_dir: Optional[Union[str, Path]] = None,
+        profile_memory: bool = False,
+    ) -> None:
+        """Writes js files without running the application.
+
+        Args:
+            use_cache: Whether to serve unchanged screens from the render cache.
+            output_dir: Expo project to write to, the bundled project by default.
+            profile_memory: Whether to profile the memory of the build, printing a
+                summary and writing the profile to `memory.json` in the cache folder.
+        """
+        self._build.write_files(
+            use_cache=use_cache, output_dir=output_dir, profile_memory=profile_memory
+        )
 
     def show(self) -> str:
         """Returns string .js rendition of application.
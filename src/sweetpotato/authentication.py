@@ -76,6 +76,8 @@ class AuthenticationProvider(Composite):
         kwargs: Arbitrary keyword arguments.
     """
 
+    __slots__ = ()
+
     is_context = True
 
     def __init__(
@@ -110,6 +112,11 @@ class AuthenticationProvider(Composite):
 
         self._children.append(stack)
 
-    def __repr__(self) -> str:
-        authenticated = "".join(map(repr, [self._children[0]]))
-        return f"{'{'}this.state.authenticated ? {authenticated} : {self._children[1]}{'}'}"
+    def _render_parts(self) -> tuple:
+        return (
+            "{this.state.authenticated ? ",
+            self._children[0],
+            " : ",
+            self._children[1],
+            "}",
+        )
@@ -7,6 +7,7 @@ Todo:
 """
 from typing import Optional, Union
 
+from sweetpotato.core import styles as style_utils
 from sweetpotato.core.base import Component, Composite
 from sweetpotato.props.components_props import (
     ACTIVITY_INDICATOR_PROPS,
@@ -28,6 +29,8 @@ class ActivityIndicator(Component):
     See https://reactnative.dev/docs/activityindicator.
     """
 
+    __slots__ = ()
+
     props: set = ACTIVITY_INDICATOR_PROPS  #: Set of allowed props for component.
 
 
@@ -44,6 +47,8 @@ class Text(Component):
         text = Text(text="foo")
     """
 
+    __slots__ = ()
+
     props: set = TEXT_PROPS  #: Set of allowed props for component.
 
     def __init__(self, text: Optional[str] = None, **kwargs) -> None:
@@ -56,6 +61,8 @@ class TextInput(Component):
     See https://reactnative.dev/docs/textinput.
     """
 
+    __slots__ = ()
+
     props: set = TEXT_INPUT_PROPS  #: Set of allowed props for component.
 
 
@@ -68,6 +75,8 @@ class Button(Composite):
         button = Button(title="foo")
     """
 
+    __slots__ = ()
+
     props: set = BUTTON_PROPS  #: Set of allowed props for component.
 
 
@@ -80,6 +89,8 @@ class Image(Component):
         image = Image(source={"uri": image_source})
     """
 
+    __slots__ = ()
+
     props: set = IMAGE_PROPS  #: Set of allowed props for component.
 
 
@@ -89,6 +100,8 @@ class FlatList(Component):
     See https://reactnative.dev/docs/flatlist.
     """
 
+    __slots__ = ()
+
     props: set = FLAT_LIST_PROPS  #: Set of allowed props for component.
 
 
@@ -98,6 +111,8 @@ class SafeAreaProvider(Composite):
     See https://docs.expo.dev/versions/latest/sdk/safe-area-context/.
     """
 
+    __slots__ = ()
+
     package: str = "react-native-safe-area-context"  #: Default package for component.
     props: set = SAFE_AREA_PROVIDER_PROPS  #: Set of allowed props for component.
 
@@ -108,6 +123,8 @@ class ScrollView(Component):
     See https://reactnative.dev/docs/scrollview.
     """
 
+    __slots__ = ()
+
     props: set = SCROLL_VIEW_PROPS  #: Set of allowed props for component.
 
 
@@ -123,9 +140,7 @@ class StyleSheet:
         styles = StyleSheet.create({
             "container": {"flex": 1, "justifyContent": "center", "alignItems": "center"}
         })
-
-    Todo:
-        * Implement compose and flatten methods.
+        row = StyleSheet.compose(styles.container, {"flexDirection": "row"})
     """
 
     def __init__(self, styles: dict[str, dict[str, Union[str, int]]]) -> None:
@@ -140,13 +155,30 @@ class StyleSheet:
         """
         return cls(styles)
 
-    def compose(self) -> None:
-        """Not implemented."""
-        raise NotImplementedError
+    @staticmethod
+    def compose(style1: style_utils.Style, style2: style_utils.Style) -> dict:
+        """Merges two styles at build time, the second taking precedence.
 
-    def flatten(self) -> None:
-        """Not implemented."""
-        raise NotImplementedError
+        Args:
+            style1: Style, or list of styles.
+            style2: Style, or list of styles.
+
+        Returns:
+            Merged style, memoized by the identities of the given styles.
+        """
+        return style_utils.compose(style1, style2)
+
+    @staticmethod
+    def flatten(style: style_utils.Style) -> dict:
+        """Merges a list of styles into one style at build time.
+
+        Args:
+            style: Style, or possibly nested list of styles, later ones take precedence.
+
+        Returns:
+            Merged style, memoized by the identities of the given styles.
+        """
+        return style_utils.flatten(style)
 
     def __getattr__(self, item: str) -> dict:
         return self.styles[item]
@@ -158,6 +190,8 @@ class TouchableOpacity(Composite):
     See https://reactnative.dev/docs/touchableopacity.
     """
 
+    __slots__ = ()
+
     props: set = TOUCHABLE_OPACITY_PROPS  #: Set of allowed props for component.
 
 
@@ -167,4 +201,6 @@ class View(Composite):
     See https://reactnative.dev/docs/view.
     """
 
+    __slots__ = ()
+
     props: set = VIEW_PROPS  #: Set of allowed props for component.
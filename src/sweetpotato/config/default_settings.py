@@ -2,14 +2,47 @@
 
 For the full list of settings and their values, see
 https://sweetpotato.readthedocs.io/en/latest/settings.html
+
+Settings derived from other settings, like the authentication functions, are computed
+on first access rather than when the settings are imported.
 """
+import importlib
 from pathlib import Path
+from typing import Any, Callable, Optional
 
-import sweetpotato.functions.authentication_functions as auth_functions
-import sweetpotato.functions.navigation_functions as nav_functions
 from sweetpotato import defaults
 from sweetpotato.core import ThreadSafe
 
+_PACKAGE = Path(__file__).parent.parent  #: Directory of the sweetpotato package.
+
+
+class _Derived:
+    """Setting computed from other settings on first access, then stored on the class.
+
+    Args:
+        compute: Function of the settings class returning the value.
+    """
+
+    def __init__(self, compute: Callable[[type], Any]) -> None:
+        self.compute = compute
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        value = self.compute(owner)
+        setattr(owner, self.name, value)
+        return value
+
+
+def _auth_functions():
+    return importlib.import_module("sweetpotato.functions.authentication_functions")
+
+
+def _nav_functions():
+    return importlib.import_module("sweetpotato.functions.navigation_functions")
+
 
 class Settings(metaclass=ThreadSafe):
     """Provides and allows user to override default configuration."""
@@ -46,48 +79,87 @@ class Settings(metaclass=ThreadSafe):
         False  #: Indicates whether to use authentication methods.
     )
     LOGIN_COMPONENT: str = "Login"  #: Name of login component, defaults to `'Login'`.
-    LOGIN_FUNCTION: str = auth_functions.LOGIN.replace(
-        "API_URL", API_URL
+    LOGIN_FUNCTION: str = _Derived(
+        lambda cls: _auth_functions().LOGIN.replace("API_URL", cls.API_URL)
     )  #: Login function for authentication.
-    LOGOUT_FUNCTION: str = auth_functions.LOGOUT.replace(
-        "API_URL", API_URL
+    LOGOUT_FUNCTION: str = _Derived(
+        lambda cls: _auth_functions().LOGOUT.replace("API_URL", cls.API_URL)
     )  #: Logout function for authentication.
-    SET_CREDENTIALS: str = (
-        auth_functions.SET_CREDENTIALS
+    SET_CREDENTIALS: str = _Derived(
+        lambda cls: _auth_functions().SET_CREDENTIALS
     )  #: Credential setting function for authentication.
-    STORE_DATA: str = (
-        auth_functions.STORE_DATA
+    STORE_DATA: str = _Derived(
+        lambda cls: _auth_functions().STORE_DATA
     )  #: Data storage setting function for authentication.
-    RETRIEVE_DATA: str = (
-        auth_functions.RETRIEVE_DATA
+    RETRIEVE_DATA: str = _Derived(
+        lambda cls: _auth_functions().RETRIEVE_DATA
     )  #: Data retrieval function for authentication.
-    STORE_SESSION: str = (
-        auth_functions.STORE_SESSION
+    STORE_SESSION: str = _Derived(
+        lambda cls: _auth_functions().STORE_SESSION
     )  #: Session storage function for authentication.
-    RETRIEVE_SESSION: str = (
-        auth_functions.RETRIEVE_SESSION
+    RETRIEVE_SESSION: str = _Derived(
+        lambda cls: _auth_functions().RETRIEVE_SESSION
     )  #: Session retrieval function for authentication.
-    REMOVE_SESSION: str = (
-        auth_functions.REMOVE_SESSION
+    REMOVE_SESSION: str = _Derived(
+        lambda cls: _auth_functions().REMOVE_SESSION
     )  #: Session removal function for authentication.
-    TIMEOUT: str = (
-        auth_functions.TIMEOUT
+    TIMEOUT: str = _Derived(
+        lambda cls: _auth_functions().TIMEOUT
     )  #: Generic timeout function for authentication.
-    AUTH_FUNCTIONS: dict = {
-        APP_COMPONENT: LOGIN_FUNCTION,
-        LOGIN_COMPONENT: SET_CREDENTIALS,
-    }  #: Dictionary of authentication functions and corresponding components.
+    AUTH_FUNCTIONS: dict = _Derived(
+        lambda cls: {
+            cls.APP_COMPONENT: cls.LOGIN_FUNCTION,
+            cls.LOGIN_COMPONENT: cls.SET_CREDENTIALS,
+        }
+    )  #: Dictionary of authentication functions and corresponding components.
 
     # Navigation settings
     USE_NAVIGATION: bool = False  #: Indicates whether to use @react-navigation/native.
-    NAVIGATION_FUNCTIONS: list = [
-        v for k, v in nav_functions.__dict__.items() if not k.startswith("__")
-    ]
+    NAVIGATION_FUNCTIONS: list = _Derived(
+        lambda cls: [
+            v for k, v in _nav_functions().__dict__.items() if not k.startswith("__")
+        ]
+    )  #: Navigation functions of the root navigation module.
+
+    # Component settings
+    VALIDATE_PROPS: bool = (
+        True  #: Indicates whether to validate props of constructed components.
+    )
+
+    # Style settings
+    HOIST_STYLES: bool = False  #: Indicates whether to declare style dicts once per screen in a StyleSheet.
+
+    # Render cache settings
+    USE_RENDER_CACHE: bool = (
+        True  #: Indicates whether to reuse renditions cached on disk.
+    )
+    RENDER_CACHE_FOLDER: str = (
+        ".sweetpotato_cache"  #: Name of render cache folder in the working directory.
+    )
+    RENDER_CACHE_MAX_BYTES: int = (
+        64 * 1024 * 1024
+    )  #: Size bound of render cache, least recently used renditions are evicted beyond it.
+
+    # Build settings
+    BUILD_MANIFEST: str = ".sweetpotato_manifest.json"  #: Name of build manifest file in the expo project.
+    BUILD_JOBS: int = 1  #: Number of processes writing screens, `0` for one per CPU.
+    FORMATTER: Optional[
+        str
+    ] = "prettier"  #: Formatter of screens, `'prettier'`, `'builtin'` or `None`.
+    FORMAT_WORKER_COMMAND: list = _Derived(
+        lambda cls: ["node", f"{_PACKAGE.resolve()}/core/format_worker.js"]
+    )  #: Command starting the prettier format worker, run in the expo project.
+    DEV_SERVER_COMMAND: list = [
+        "expo",
+        "start",
+    ]  #: Command starting the expo development server.
 
     # React Native settings
     RESOURCE_FOLDER: str = "frontend"  #: Name of expo project resource folder.
     SOURCE_FOLDER: str = "src"  #: Name of expo project component folder.
-    REACT_NATIVE_PATH: str = f"{Path(__file__).resolve().parent.parent}/{RESOURCE_FOLDER}"  #: Absolute path to expo project.
+    REACT_NATIVE_PATH: str = _Derived(
+        lambda cls: f"{_PACKAGE.resolve()}/{cls.RESOURCE_FOLDER}"
+    )  #: Absolute path to expo project.
 
     @classmethod
     def __set_ui_kitten(cls) -> None:
@@ -103,8 +175,8 @@ class Settings(metaclass=ThreadSafe):
     @classmethod
     def __set_api(cls) -> None:
         """Sets API configuration for app."""
-        cls.LOGIN_FUNCTION = auth_functions.LOGIN.replace("API_URL", cls.API_URL)
-        cls.LOGOUT_FUNCTION = auth_functions.LOGOUT.replace("API_URL", cls.API_URL)
+        cls.LOGIN_FUNCTION = _auth_functions().LOGIN.replace("API_URL", cls.API_URL)
+        cls.LOGOUT_FUNCTION = _auth_functions().LOGOUT.replace("API_URL", cls.API_URL)
         cls.AUTH_FUNCTIONS = {
             cls.APP_COMPONENT: cls.LOGIN_FUNCTION,
             cls.LOGIN_COMPONENT: cls.SET_CREDENTIALS,
@@ -113,9 +185,7 @@ class Settings(metaclass=ThreadSafe):
     @classmethod
     def __set_react_native(cls) -> None:
         """Sets all necessary React Native configuration for app."""
-        cls.REACT_NATIVE_PATH = (
-            f"{Path(__file__).resolve().parent.parent}/{cls.RESOURCE_FOLDER}"
-        )
+        cls.REACT_NATIVE_PATH = f"{_PACKAGE.resolve()}/{cls.RESOURCE_FOLDER}"
 
     @classmethod
     def __setattr__(cls, key: str, value: str) -> None:
@@ -1,13 +1,23 @@
 """Core functionality of React Native class based components."""
+import itertools
 import json
 import pathlib
 import pickle
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import singledispatchmethod
-from typing import Optional, Union
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
 
 from sweetpotato.config import settings
-from sweetpotato.core import ThreadSafe, js_utils
+from sweetpotato.core import ThreadSafe, js_utils, styles
+from sweetpotato.core.instrumentation import tracer
+from sweetpotato.core.render_cache import RenderCache
+from sweetpotato.core.renderer import Renderer, render, render_children
+from sweetpotato.core.tracking import SHARED, ChildList, LazyChildren, WatchedDict
+from sweetpotato.core.traversal import preorder
 from sweetpotato.core.base_management import (
+    EMPTY_PROPS,
+    EMPTY_STATE,
     Props,
     State,
     Function,
@@ -19,6 +29,76 @@ from sweetpotato.core.protocols import (
     ComponentType,
 )
 
+Children = Union[
+    list[ComponentVar], Iterable[ComponentVar], Callable[[], Iterable[ComponentVar]]
+]  #: Child components of a composite, see :class:`Composite`.
+AttrFormatter = Callable[["Component", Any, str], str]  #: Formats `key=value` attrs.
+
+_validating: ContextVar[bool] = ContextVar("validating", default=True)
+_managed_types: dict[type, bool] = {}  #: Whether attribute types are State or Props.
+
+
+@contextmanager
+def no_validation() -> Iterator[None]:
+    """Skips prop validation of components constructed within the context.
+
+    Meant for trusted, already validated generated code, see also
+    `settings.VALIDATE_PROPS` to skip it globally. The switch is scoped to the current
+    thread or task.
+
+    Example:
+        with no_validation():
+            rows = [Text(text=row) for row in generated_rows]
+    """
+    token = _validating.set(False)
+    try:
+        yield
+    finally:
+        _validating.reset(token)
+
+
+def _is_managed(value: Any) -> bool:
+    """Checks whether an attribute value is State or Props, cached by type."""
+    value_type = value.__class__
+    try:
+        return _managed_types[value_type]
+    except KeyError:
+        managed = _managed_types[value_type] = issubclass(value_type, (State, Props))
+        return managed
+
+
+def _format_management_attr(
+    component: "Component", attr: Union[State, Props], _
+) -> str:
+    return component._make_state_or_prop_attrs(attr)
+
+
+def _format_object_attr(_, attr: Union[dict, Function], key: str) -> str:
+    return f"{key}={{{attr}}}"
+
+
+def _format_dict_attr(component: "Component", attr: dict, key: str) -> str:
+    name = styles.hoisted_name(key, attr)
+    if name is None:
+        return _format_object_attr(component, attr, key)
+    return f"{key}={{{styles.SHEET}.{name}}}"
+
+
+def _format_style_list_attr(
+    component: "Component", attr: Union[list, tuple], key: str
+) -> str:
+    if key != "style":
+        raise AttributeError(f"{attr} {key} not in allowed types")
+    return _format_dict_attr(component, styles.flatten(attr), key)
+
+
+def _format_str_attr(_, attr: str, key: str) -> str:
+    return f"{key}={{`{attr}`}}"
+
+
+def _format_json_attr(_, attr: Union[bool, int, float, None], key: str) -> str:
+    return f"{key}={{{json.dumps(attr)}}}"
+
 
 class Component:
     """Base React Native component with MetaComponent metaclass.
@@ -32,48 +112,125 @@ class Component:
         _children: Inner content for component.
         _attrs: String of given attributes for component.
         _variables: Contains variables (if any) belonging to given component.
+        _render_cache: Memoized rendition of component and its descendants, if current.
+        _parts_cache: Memoized parts of component rendition, if current.
+        _hash_cache: Memoized structural hash and subtree size of component, if current.
+        _container: Composite(s) containing component, notified when it changes.
         props: Allowed props for component.
         parent: Name of parent component, defaults to `'App'`.
 
+    Keyword arguments are validated against the allowed props of component, unless
+    constructed in a :func:`no_validation` context or `settings.VALIDATE_PROPS` is off.
+
+    Components are slotted to keep large trees compact, subclasses declaring no
+    attributes of their own should set `__slots__ = ()` to stay that way. Components
+    without state or props share immutable empty defaults.
+
+    Style dicts, and lists of them flattened into one, are referenced from the style
+    sheet of their screen when `settings.HOIST_STYLES` is enabled, see
+    :mod:`sweetpotato.core.styles`.
+
+    Renditions are memoized and marked stale through :meth:`invalidate` when children,
+    attributes, names or the values of rendered State/Props change. Attribute values such
+    as style dicts are treated as immutable, call :meth:`invalidate` after editing one in place.
+
     Example:
         component = Component(children="foo")
     """
 
+    __slots__ = (
+        "_render_cache",
+        "_parts_cache",
+        "_hash_cache",
+        "_container",
+        "_component_name",
+        "_import_name",
+        "_children",
+        "_state",
+        "_props",
+        "_variables",
+        "_attrs",
+        "parent",
+        "__weakref__",
+    )
+
     package: str = "react-native"  #: Default package for component.
-    props: set = {
-        "state",
-        "props",
-        "style",
-    }  #: Set of allowed props for component, default `'state'`, `'props'`.
+    props: frozenset = frozenset(
+        {
+            "state",
+            "props",
+            "style",
+        }
+    )  #: Set of allowed props for component, frozen per class.
     is_composite: bool = False  #: Indicates whether component may have inner content.
+    _formatters: dict[type, AttrFormatter] = {
+        State: _format_management_attr,
+        Props: _format_management_attr,
+        dict: _format_dict_attr,
+        list: _format_style_list_attr,
+        tuple: _format_style_list_attr,
+        Function: _format_object_attr,
+        str: _format_str_attr,
+        bool: _format_json_attr,
+        int: _format_json_attr,
+        float: _format_json_attr,
+        type(None): _format_json_attr,
+    }  #: Attribute formatters registered on this class, by attribute type.
+    _attr_formatters: dict[type, AttrFormatter] = dict(
+        _formatters
+    )  #: Compiled attribute formatters, by exact attribute type.
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.props.__class__ is not frozenset:
+            cls.props = frozenset(cls.props)
+        cls._formatters = dict(cls.__dict__.get("_formatters", {}))
+        cls._compile_formatters()
 
     def __init__(
         self,
         component_name: Optional[str] = None,
         children: Optional[str] = None,
-        state: Optional[State] = State(),
-        props: Optional[Props] = Props(),
+        state: Optional[State] = EMPTY_STATE,
+        props: Optional[Props] = EMPTY_PROPS,
         variables: Optional[list[str]] = None,
         **kwargs,
     ) -> None:
-        self.component_name = (
-            component_name if component_name else self._set_default_name()
-        )
-        if set(kwargs.keys()).difference(self.props):
-            attributes = ", ".join(set(kwargs.keys()).difference(self.props))
+        self._render_cache = None
+        self._parts_cache = None
+        self._hash_cache = None
+        self._container = None
+        if not component_name:
+            component_name = self._set_default_name()
+        self._component_name = self._import_name = component_name
+        if (
+            kwargs
+            and not kwargs.keys() <= self.props
+            and settings.VALIDATE_PROPS
+            and _validating.get()
+        ):
+            attributes = ", ".join(kwargs.keys() - self.props)
             raise AttributeError(
                 f"{self.component_name} component does not have attribute(s): {attributes}"
             )
-        self._import_name = (
-            component_name if component_name else self._set_default_name()
-        )
 
         self._children = children
-        self._state = state
-        self._props = props
-        self._variables = variables if variables else []
+        self._state = state if state is not None else EMPTY_STATE
+        self._props = props if props is not None else EMPTY_PROPS
+        self._variables = variables if variables else ()
         self.parent = settings.APP_COMPONENT
-        self._attrs = kwargs | {"state": self._state}
+        self._attrs = WatchedDict(kwargs | {"state": self._state}, owner=self)
+        self._watch_values()
+
+    @property
+    def component_name(self) -> str:
+        """Name of .js class/function/const for component."""
+        return self._component_name
+
+    @component_name.setter
+    def component_name(self, name: str) -> None:
+        self.invalidate()
+        self._component_name = name
 
     @property
     def import_name(self) -> Optional[str]:
@@ -82,8 +239,66 @@ class Component:
 
     @import_name.setter
     def import_name(self, name) -> None:
+        self.invalidate()
         self._import_name = name
 
+    def _watch_values(self) -> None:
+        """Registers component with the values of State/Props it renders."""
+        for value in self._attrs.values():
+            if _is_managed(value):
+                value.values.watch(self)
+
+    def __setstate__(self, state: tuple[Optional[dict], dict]) -> None:
+        instance_dict, slots = state
+        for name, value in {**(instance_dict or {}), **slots}.items():
+            object.__setattr__(self, name, value)
+        self._watch_values()
+
+    def invalidate(self) -> None:
+        """Marks the memoized rendition of component and of its ancestors as stale.
+
+        Raises:
+            TypeError: If component is interned, see :mod:`sweetpotato.core.interning`.
+        """
+        if self._container is SHARED:
+            raise TypeError(f"Interned {self.__class__.__name__} is immutable.")
+        self._parts_cache = None
+        stack = [self]
+        while stack:
+            component = stack.pop()
+            component._render_cache = None
+            component._hash_cache = None
+            container = component._container
+            if container.__class__ is list:
+                stack.extend(container)
+            elif container is not None:
+                stack.append(container)
+
+    def _adopt(self, container: CompositeVar) -> None:
+        """Registers a composite containing component, interned ones are not tracked."""
+        current = self._container
+        if current is SHARED:
+            return
+        if current is None or current is container:
+            self._container = container
+        elif current.__class__ is list:
+            if not any(composite is container for composite in current):
+                current.append(container)
+        else:
+            self._container = [current, container]
+
+    def _release(self, container: CompositeVar) -> None:
+        """Unregisters a composite no longer containing component."""
+        current = self._container
+        if current is container:
+            self._container = None
+        elif current.__class__ is list:
+            current[:] = [
+                composite for composite in current if composite is not container
+            ]
+            if len(current) == 1:
+                self._container = current[0]
+
     @property
     def children(self) -> Optional[str]:
         """Property returning inner content."""
@@ -97,7 +312,68 @@ class Component:
     @property
     def attrs(self) -> Optional[str]:
         """Property string of given attributes for component"""
-        return " ".join([self._format_attr(v, k) for k, v in self._attrs.items()])
+        formatters = self._attr_formatters
+        formatted = []
+        for key, value in self._attrs.items():
+            formatter = formatters.get(value.__class__)
+            if formatter is None:
+                formatted.append(self._format_attr(value, key))
+            else:
+                formatted.append(formatter(self, value, key))
+        return " ".join(formatted)
+
+    @classmethod
+    def register_formatter(
+        cls, attr_type: type, formatter: Optional[AttrFormatter] = None
+    ) -> Union[AttrFormatter, Callable[[AttrFormatter], AttrFormatter]]:
+        """Registers an attribute formatter for component class and its subclasses.
+
+        Formatters receive the component, the attribute value and its key and return the
+        formatted `key={value}` string. Register formatters before rendering components.
+
+        Args:
+            attr_type: Type of attribute values, subclasses included.
+            formatter: Formatter, if omitted a decorator registering it is returned.
+
+        Returns:
+            Formatter, or decorator registering it.
+
+        Example:
+            @View.register_formatter(Color)
+            def format_color(component, attr, key):
+                return f"{key}={{'{attr.hex}'}}"
+        """
+        if formatter is None:
+            return lambda function: cls.register_formatter(attr_type, function)
+        cls._formatters[attr_type] = formatter
+        classes = [cls]
+        while classes:
+            component_class = classes.pop()
+            component_class._compile_formatters()
+            classes.extend(component_class.__subclasses__())
+        return formatter
+
+    @classmethod
+    def _compile_formatters(cls) -> None:
+        """Compiles the formatter table of class from the registrations along its MRO."""
+        attr_types = {
+            attr_type
+            for component_class in cls.__mro__
+            for attr_type in vars(component_class).get("_formatters", ())
+        }
+        cls._attr_formatters = {
+            attr_type: cls._resolve_formatter(attr_type) for attr_type in attr_types
+        }
+
+    @classmethod
+    def _resolve_formatter(cls, attr_type: type) -> Optional[AttrFormatter]:
+        """Returns the most specific formatter registered for attribute type, if any."""
+        for base in attr_type.__mro__:
+            for component_class in cls.__mro__:
+                formatter = vars(component_class).get("_formatters", {}).get(base)
+                if formatter is not None:
+                    return formatter
+        return None
 
     def _make_state_or_prop_attrs(self, attr: Union[State, Props]) -> str:
         placeholder = "" if self.is_composite else js_utils.add_this()
@@ -109,33 +385,22 @@ class Component:
             ]
         )
 
-    @singledispatchmethod
-    def _format_attr(self, attr, key) -> AttributeError:
-        """Generic method for formatting state, props & style.
+    def _format_attr(self, attr: Any, key: str) -> str:
+        """Formats an attribute with the formatter registered for its type.
+
+        Formatters resolved through the attribute type's bases are added to the table.
 
         Args:
-            key: ...
-            attr: ...
+            key: Name of attribute.
+            attr: Value of attribute.
         """
-        raise AttributeError(f"{attr} {key} not in allowed types")
-
-    @_format_attr.register(State)
-    @_format_attr.register(Props)
-    def _(self, attr: Union[State, Props], _) -> str:
-        return self._make_state_or_prop_attrs(attr)
-
-    @_format_attr.register(dict)
-    @_format_attr.register(Function)
-    def _(self, attr: Union[dict, Function], key: str) -> str:
-        return self._make_key_w_attr(key, attr)
-
-    @_format_attr.register(str)
-    def _(self, attr: str, key: str):
-        return self._make_key_w_attr(key, f"`{attr}`")
-
-    @_format_attr.register(bool)
-    def _(self, attr: bool, key: str) -> str:
-        return self._make_key_w_attr(key, json.dumps(attr))
+        formatter = self._attr_formatters.get(attr.__class__)
+        if formatter is None:
+            formatter = self._resolve_formatter(attr.__class__)
+            if formatter is None:
+                raise AttributeError(f"{attr} {key} not in allowed types")
+            self.__class__._attr_formatters[attr.__class__] = formatter
+        return formatter(self, attr, key)
 
     @staticmethod
     def _make_key_w_attr(key, attr) -> str:
@@ -144,17 +409,40 @@ class Component:
     def _set_default_name(self) -> str:
         return self.__class__.__name__
 
-    def __repr__(self) -> str:
+    def _cached_render_parts(self) -> tuple[Union[str, ComponentVar], ...]:
+        """Returns memoized result of :meth:`_render_parts`, lazy children excluded."""
+        parts = self._parts_cache
+        if parts is None:
+            if self._children.__class__ is LazyChildren:
+                return self._render_parts()
+            parts = self._parts_cache = tuple(self._render_parts())
+        return parts
+
+    def _render_parts(self) -> tuple[Union[str, ComponentVar], ...]:
+        """Returns the string fragments and child components making up the rendition."""
         if self._children:
-            return f"<{self.component_name} {self.attrs}>{self.children}</{self.component_name}>"
-        return f"<{self.component_name} {self.attrs}/>"
+            return (
+                f"<{self.component_name} {self.attrs}>{self.children}</{self.component_name}>",
+            )
+        return (f"<{self.component_name} {self.attrs}/>",)
+
+    def __repr__(self) -> str:
+        # pylint: disable=protected-access
+        if Renderer._has_custom_repr(self.__class__):
+            # Reached through super() from the __repr__ of a subclass, rendering the
+            # parts of component directly, and without memoizing them as its rendition.
+            buffer: list[str] = []
+            Renderer(buffer).render_parts(self)
+            return "".join(buffer)
+        return render(self)
 
 
 class Composite(Component):
     """Base React Native component with MetaComponent metaclass.
 
     Args:
-        children: Inner content for component.
+        children: Inner content for component, a list or, to produce children lazily
+            while streaming, any other iterable or a factory returning one.
         state: Dictionary of allowed state values for component.
         functions: Functions for component, passed to top level component.
         kwargs: Arbitrary keyword arguments.
@@ -166,26 +454,32 @@ class Composite(Component):
 
     Example:
         composite = Composite(children=[])
+        rows = Composite(children=lambda: (Text(text=row) for row in fetch_rows()))
     """
 
+    __slots__ = ("_functions",)
+
     is_context: bool = False  #: Indicates whether component is a context, similar to an inline if-else.
     is_composite: bool = True  #: Indicates whether component may have inner components.
     is_root: bool = False  #: Indicates whether component is a top level component.
 
     def __init__(
         self,
-        children: Optional[list[Union[ComponentVar, CompositeVar]]] = None,
+        children: Optional[Children] = None,
         functions: Optional[Union[list[str], str]] = None,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
-        self._children = children if children else []
-        self._functions = functions if functions else []
+        if children is None or isinstance(children, (list, tuple)):
+            self._children = ChildList(children if children else [], owner=self)
+        else:
+            self._children = LazyChildren(children)
+        self._functions = functions if functions else ()
 
     @property
     def children(self) -> str:
         """Property returning a string rendition of child components"""
-        return "".join(map(repr, self._children))
+        return render_children(self._children)
 
     @property
     def functions(self) -> str:
@@ -227,10 +521,20 @@ class Composite(Component):
         """
         ...
 
-    def __repr__(self) -> str:
+    def _render_parts(self) -> Iterable[Union[str, ComponentVar]]:
+        if self._children.__class__ is LazyChildren and self.is_composite:
+            return itertools.chain(
+                (f"<{self.component_name} {self.attrs}>",),
+                self._children,
+                (f"</{self.component_name}>",),
+            )
         if self._children and self.is_composite:
-            return f"<{self.component_name} {self.attrs}>{self.children}</{self.component_name}>"
-        return f"<{self.component_name} {self.attrs}/>"
+            return (
+                f"<{self.component_name} {self.attrs}>",
+                *self._children,
+                f"</{self.component_name}>",
+            )
+        return (f"<{self.component_name} {self.attrs}/>",)
 
 
 class ComponentRegistry(metaclass=ThreadSafe):
@@ -272,8 +576,13 @@ class RootComponent(Composite):
     Attributes:
         component_name: Name of .js class/function/const for component.
         import_name: Name of .js class/function/const for component import.
+
+    Root components keep an instance dictionary, as screens and custom components
+    commonly set attributes of their own and there are only a few per tree.
     """
 
+    __slots__ = ("package", "_imports", "_styles", "_lazy", "__dict__")
+
     is_composite = False  #: Indicates whether component is represented as composite inside parent component.
     package_root: str = (
         f"./{settings.SOURCE_FOLDER}/components"  #: Default package for component.
@@ -293,29 +602,52 @@ class RootComponent(Composite):
                 [word.title() for word in kwargs.get("component_name").split(" ")]
             )
         super().__init__(**kwargs)
+        self._functions = list(self._functions)
+        self._variables = list(self._variables)
         if self._state.functions:
             self._functions.extend(self._state.functions)
         self.package = f"{self.package_root}/{self._import_name}.js"
         self._imports = {}
-        self._set_parent(self._children)
+        self._styles = []
+        self._lazy = False
+        with tracer.phase("collect", self.component_name):
+            self._set_parent(self._children)
         if extra_imports:
             self._imports.update(extra_imports)
         ComponentRegistry.register(self)
 
     @property
     def imports(self) -> str:
-        """Property returning string of imports (if any) belonging to given component."""
+        """Property returning string of imports (if any) belonging to given component.
+
+        Named imports are sorted, so screens are written the same in every process.
+        """
         import_string = ""
         for key, value in self._imports.items():
-            if value and "RootNavigation" != list(value)[0]:
+            if isinstance(value, (set, frozenset)):
+                names = sorted(value)
+                if names and names[0] == "RootNavigation":
+                    continue
+                value = f"{{{', '.join(names)}}}" if names else None
+            if value:
                 import_string += (
-                    f'import {value} from "{key}";\n'.replace("'", "")
-                    if value
-                    else f'import "{key}"\n'
+                    f'import {value} from "{key}";\n' if value else f'import "{key}"\n'
                 )
 
         return import_string
 
+    @property
+    def variables(self) -> str:
+        """Property returning string of variables, followed by the style sheet of hoisted styles."""
+        variables = "\n".join(self._variables)
+        sheet = styles.declare(self._styles)
+        return f"{variables}\n{sheet}" if sheet else variables
+
+    @property
+    def is_lazy(self) -> bool:
+        """Whether descendants are produced lazily, collecting imports as they stream."""
+        return self._lazy
+
     @property
     def state(self) -> str:
         """Property returning json string of state (if any) belonging to given component.
@@ -324,31 +656,63 @@ class RootComponent(Composite):
         """
         return self._state.as_json()
 
-    def _set_parent(self, children: list[Union[CompositeType, ComponentType]]) -> None:
+    def _set_parent(
+        self, children: Iterable[Union[CompositeType, ComponentType]]
+    ) -> None:
         """Sets top level component as root and sets each parent to self.
 
+        Descendants are visited depth first with an explicit stack, collecting imports,
+        functions, variables and hoisted styles along the way. Lazy children are not consumed, they
+        are collected in a single pass as they are streamed instead.
+
         Args:
-            children: List of components.
+            children: Components, or lazy children.
 
         Todos:
             * Refactor + don't access _children attribute for child.
         """
-        for child in children:
+        if children.__class__ is LazyChildren:
+            children.collect = self._set_parent
+            self._lazy = True
+            return
+        for child in preorder(children, self._nested_children):
             child.parent = self.component_name
             if (child.is_composite and not child.is_context) or not child.is_composite:
                 if child.package not in self._imports:
                     self._imports[child.package] = set()
                 self._imports[child.package].add(child.import_name)
+            style = styles.hoisted_style(child._attrs.get("style"))
+            if style is not None:
+                self._styles.append(style)
+                self._imports.setdefault(styles.PACKAGE, set()).add("StyleSheet")
             if child.is_composite:
                 self._functions.append(child.functions)
                 self._variables.append(child.variables)
-                self._set_parent(child._children)
+                if child._children.__class__ is LazyChildren:
+                    self._set_parent(child._children)
 
-    def serialize(self, as_format: Optional[str] = "dict") -> Union[dict, bytes, str]:
+    @staticmethod
+    def _nested_children(
+        child: Union[CompositeType, ComponentType]
+    ) -> Optional[list[Union[CompositeType, ComponentType]]]:
+        """Returns children belonging to the same top level component, if any."""
+        if not child.is_composite or child._children.__class__ is LazyChildren:
+            return None
+        return child._children
+
+    def serialize(
+        self,
+        as_format: Optional[str] = "dict",
+        rendered: bool = True,
+        cache: Optional[RenderCache] = None,
+    ) -> Union[dict, bytes, str]:
         """Returns component as specified serialization format.
 
         Args:
             as_format: Specified format, one of `'json', `'dict'``, `'dict'` is default.
+            rendered: Whether to render child components to a string, otherwise
+                the child components are returned for streaming, `'dict'` only.
+            cache: Render cache to serve unchanged child components from, if any.
 
         Returns:
             Serialized component.
@@ -357,11 +721,13 @@ class RootComponent(Composite):
             raise KeyError(
                 f"{as_format} not in available formats, pass 'dict' or 'json'."
             )
+        if not rendered and as_format != "dict":
+            raise ValueError("Unrendered children may only be serialized as a dict.")
         serialized_component = {
             "state": self.state,
             "variables": self.variables,
             "functions": self.functions,
-            "children": self.children,
+            "children": self._serialize_children(rendered, cache),
             "imports": self.imports,
             "package": self.package,
             "functional": self.is_functional,
@@ -374,6 +740,17 @@ class RootComponent(Composite):
             return pickle.dumps(serialized_component)
         return serialized_component
 
+    def _serialize_children(
+        self, rendered: bool, cache: Optional[RenderCache]
+    ) -> Union[str, list[Union[CompositeType, ComponentType]]]:
+        if not rendered:
+            if self._children.__class__ is LazyChildren:
+                return self._children
+            return list(self._children)
+        if cache and not self.is_lazy:
+            return cache.render(self._children)
+        return self.children
+
     @classmethod
     def register(cls, management_obj: Union[State, Props]) -> None:
         """Registers state/prop object as functional or class based.
@@ -389,4 +766,4 @@ class App(RootComponent):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.package = f"{settings.REACT_NATIVE_PATH}/{self.import_name}.js"
+        self.package = f"./{self.import_name}.js"
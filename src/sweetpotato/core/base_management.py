@@ -8,6 +8,18 @@ from abc import abstractmethod
 from typing import Optional, Protocol, Union, Any
 
 import sweetpotato.core.js_utils as js_utils
+from sweetpotato.core.tracking import FrozenDict, WatchedDict
+
+
+def _watched(values: dict, previous: Optional[WatchedDict]) -> WatchedDict:
+    """Returns values as a watched dictionary, taking over watchers of previous values."""
+    if isinstance(previous, FrozenDict):
+        raise TypeError("Shared empty defaults are immutable, pass your own instead.")
+    if not isinstance(values, WatchedDict):
+        values = WatchedDict(values)
+    if previous is not None and previous is not values:
+        values.adopt_watchers(previous)
+    return values
 
 
 class _ProtocolFunction(Protocol):
@@ -127,10 +139,24 @@ class State(_ProtocolState):
         self,
         values: Optional[dict[str, Any]] = None,
     ) -> None:
-        self.values = values if values else {}
+        self.values = values if values is not None else {}
         self.functions = []
         self.type = self.__class__.__name__.lower()
 
+    def __reduce_ex__(self, protocol: int) -> Union[str, tuple]:
+        if self is EMPTY_STATE:
+            return "EMPTY_STATE"
+        return super().__reduce_ex__(protocol)
+
+    @property
+    def values(self) -> WatchedDict:
+        """State values, components rendering them are invalidated when they change."""
+        return self._values
+
+    @values.setter
+    def values(self, values: dict[str, Any]) -> None:
+        self._values = _watched(values, getattr(self, "_values", None))
+
     def as_json(self) -> str:
         """Return dict as json."""
         return json.dumps(self.values)
@@ -275,6 +301,20 @@ class Props(_ProtocolProps):
         self.values = state.values if state else {}
         self.type = self.__class__.__name__.lower()
 
+    def __reduce_ex__(self, protocol: int) -> Union[str, tuple]:
+        if self is EMPTY_PROPS:
+            return "EMPTY_PROPS"
+        return super().__reduce_ex__(protocol)
+
+    @property
+    def values(self) -> WatchedDict:
+        """Prop values, components rendering them are invalidated when they change."""
+        return self._values
+
+    @values.setter
+    def values(self, values: dict) -> None:
+        self._values = _watched(values, getattr(self, "_values", None))
+
     def as_json(self) -> str:
         """Return dict as json."""
         return json.dumps(self.values)
@@ -283,3 +323,9 @@ class Props(_ProtocolProps):
         if self.state.is_functional:
             return js_utils.add_curls(js_utils.add_props(item))
         return js_utils.add_curls(js_utils.add_class_props(item))
+
+
+EMPTY_STATE: State = State(FrozenDict())  #: Immutable state shared by default.
+EMPTY_STATE.functions = ()
+EMPTY_PROPS: Props = Props()  #: Immutable props shared by default.
+EMPTY_PROPS._values = FrozenDict()
@@ -1,6 +1,7 @@
-"""
-The `_access_check` and `_check_dependency` functions are essentially copies from
-https://github.com/cookiecutter/whichcraft/blob/master/whichcraft.py#L20.
+"""Provides the build, writing the app to its expo project and running expo on it.
+
+Modules only needed by one step, like the formatters, worker processes and watch mode,
+are imported by that step, so importing an app does not load them.
 
 Todos:
     * Refactor + add platform command compatibility (windows, mac, etc).
@@ -10,13 +11,28 @@ Todos:
 import io
 import json
 import os
-import pty
+import shlex
+import shutil
 import subprocess
 import sys
-from typing import Optional
+import tempfile
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Union
 
 from sweetpotato.config import settings
-from sweetpotato.core.base import ComponentRegistry
+from sweetpotato.core.base import ComponentRegistry, RootComponent
+from sweetpotato.core.instrumentation import tracer
+from sweetpotato.core.manifest import Manifest
+from sweetpotato.core.output import OutputWriter
+from sweetpotato.core.render_cache import MemoryRenderCache, RenderCache
+from sweetpotato.core.renderer import Renderer
+from sweetpotato.core.templates import Template, compile_template
+from sweetpotato.core.traversal import preorder
+from sweetpotato.core.variants import Variant
+
+
+_worker_output: Optional[OutputWriter] = None  #: Output writer of a worker process.
 
 
 class Build:
@@ -27,9 +43,15 @@ class Build:
     """
 
     storage = ComponentRegistry()
+    spool_bytes: int = (
+        8 * 2**20
+    )  #: Lazy screen bodies up to this size stay in memory.
+    parallel_components: int = 20_000  #: Apps smaller than this are built serially.
+    #: Start method of workers, platform default if `None`, builds are serial unless it forks.
+    start_method: Optional[str] = None
 
     def __init__(self, dependencies: Optional[list[str]] = None) -> None:
-        dependencies = (
+        self.dependencies = (
             dependencies
             if dependencies
             else [
@@ -38,46 +60,370 @@ class Build:
                 "expo",
             ]
         )
-        for dependency in dependencies:
-            if not self.__check_dependency(dependency) and not self._install_dependency(
-                dependency
-            ):
+
+    def require(self, dependencies: Optional[list[str]] = None) -> dict[str, str]:
+        """Checks that js dependencies are installed, prompting to install missing ones.
+
+        Dependencies are looked up on `PATH` by the steps running them rather than on
+        construction, so rendering an app never searches it, see
+        :class:`~sweetpotato.core.toolchain.Toolchain`.
+
+        Args:
+            dependencies: Dependencies to check, those of the build by default.
+
+        Returns:
+            Path of each dependency.
+
+        Raises:
+            ImportError: If a dependency is not installed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from sweetpotato.core.toolchain import Toolchain
+
+        paths = Toolchain().resolve(dependencies or self.dependencies)
+        for dependency, path in paths.items():
+            if path is None and not self._install_dependency(dependency):
                 raise ImportError(f"Dependency package {dependency} not found.")
+        return paths
 
     @classmethod
-    def write_files(cls) -> None:
-        """Writes out .js files for application."""
+    def write_files(
+        cls,
+        use_cache: bool = True,
+        incremental: bool = True,
+        jobs: Optional[int] = None,
+        output_dir: Optional[Union[str, Path]] = None,
+        cache: Optional[RenderCache] = None,
+        profile_memory: bool = False,
+    ) -> None:
+        """Writes out .js files for application.
+
+        Files are only written, and formatted, if their content changed since the last
+        build, files of screens no longer registered are deleted, see
+        :class:`~sweetpotato.core.manifest.Manifest`. Screens are formatted before they
+        are written, by the built-in formatter with `settings.FORMATTER` set to
+        `'builtin'`, by the project's prettier with `'prettier'`, see
+        :class:`~sweetpotato.core.format_worker.FormatWorker`.
+
+        With more than one job, screens are rendered and written by a pool of forked
+        worker processes, which look screens up in the registry they inherited, unless
+        the app has fewer than `parallel_components` components. Where workers are not
+        started by forking, screens are written serially, shipping them to workers
+        costs more than rendering them. Screens with lazy children are always written
+        by the building process.
 
-        for screen, content in cls.storage.registry.items():
-            cls._write_screen(screen, content.serialize())
-        cls.__format_screens()
+        Args:
+            use_cache: Whether to serve unchanged screens from the render cache, see
+                :class:`~sweetpotato.core.render_cache.RenderCache`.
+            incremental: Whether to skip files whose content did not change, otherwise
+                every file is written and formatted.
+            jobs: Number of worker processes, `settings.BUILD_JOBS` by default, `0` for
+                one per CPU.
+            output_dir: Expo project to write to, `settings.REACT_NATIVE_PATH` by default.
+            cache: Render cache screens written by this process are served from, one in
+                the working directory by default, if `use_cache`.
+            profile_memory: Whether to profile the memory of the build, printing a summary
+                and writing the profile to `memory.json` in `settings.RENDER_CACHE_FOLDER`,
+                see :class:`~sweetpotato.core.memory.MemoryProfiler`.
+        """
+        if profile_memory:
+            cls._profile_memory(
+                partial(
+                    cls.write_files, use_cache, incremental, jobs, output_dir, cache
+                )
+            )
+            return
+        with tracer.phase("write_files"):
+            directory = Path(output_dir or settings.REACT_NATIVE_PATH)
+            manifest = Manifest(directory)
+            output = cls._output(directory, manifest, force=not incremental)
+            jobs = settings.BUILD_JOBS if jobs is None else jobs
+            jobs = jobs if jobs > 0 else os.cpu_count() or 1
+            registry = cls.storage.registry
+            parallel = [
+                screen for screen, content in registry.items() if not content.is_lazy
+            ]
+            if (
+                jobs < 2
+                or len(parallel) < 2
+                or not cls._forks()
+                or cls._size(registry) < cls.parallel_components
+            ):
+                parallel = []
+            built = {}
+            if parallel:
+                with tracer.phase("parallel"):
+                    built = dict(cls._write_parallel(parallel, use_cache, output, jobs))
+            if cache is None and use_cache and RenderCache.enabled():
+                cache = RenderCache()
+            paths = []
+            for screen, content in registry.items():
+                paths.append(content.package)
+                if screen in built:
+                    _, digest = built[screen]
+                    if digest is not None:
+                        manifest.record(content.package, digest)
+                    else:
+                        manifest.discard(content.package)
+                else:
+                    cls._write_component(screen, content, cache, output)
+            manifest.prune(paths)
+            manifest.save()
+
+    @staticmethod
+    def _profile_memory(build: Callable[[], None]) -> None:
+        """Runs a build in a memory profiler, printing and writing out its profile."""
+        # pylint: disable=import-outside-toplevel
+        from sweetpotato.core.memory import MemoryProfiler
+
+        with MemoryProfiler() as profiler:
+            build()
+        path = Path.cwd() / settings.RENDER_CACHE_FOLDER / "memory.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump(path)
+        sys.stdout.write(profiler.summary())
+        sys.stdout.write(f"Memory profile written to {path}.\n")
 
     @classmethod
-    def run(cls, platform: Optional[str] = "") -> None:
+    def write_variants(
+        cls,
+        factory: Callable[..., object],
+        variants: Iterable[Variant],
+        use_cache: bool = True,
+        incremental: bool = True,
+        cache: Optional[RenderCache] = None,
+    ) -> None:
+        """Writes variants of an app, each to its own expo project, in this process.
+
+        Each variant is created by calling the factory with its overrides, with its
+        settings applied and into an empty registry, see
+        :class:`~sweetpotato.core.variants.Variant`. Subtrees rendered for a variant are
+        served to the next ones from a render cache shared by the batch, as long as the
+        settings affecting output are the same. The factory should create the
+        components of each variant rather than reuse those of another, renditions
+        memoized on components do not depend on settings.
+
+        Args:
+            factory: Function creating the app and its screens, called with the
+                overrides of each variant.
+            variants: Variants to write.
+            use_cache: Whether renditions are also read from and stored in the render
+                cache on disk.
+            incremental: Whether to skip files whose content did not change, see
+                :meth:`write_files`.
+            cache: Render cache shared by the variants, one in memory by default.
+        """
+        if cache is None:
+            cache = MemoryRenderCache(disk=use_cache and RenderCache.enabled())
+        for variant in variants:
+            with variant.applied():
+                cache.refresh()
+                factory(**variant.overrides)
+                cls.write_files(
+                    incremental=incremental,
+                    jobs=1,
+                    output_dir=variant.output_dir,
+                    cache=cache,
+                )
+
+    @staticmethod
+    def _output(
+        directory: Union[str, Path],
+        manifest: Optional[Manifest] = None,
+        force: bool = False,
+    ) -> OutputWriter:
+        """Returns an output writer formatting screens with `settings.FORMATTER`."""
+        if settings.FORMATTER == "builtin":
+            formatter = _format
+        elif settings.FORMATTER == "prettier":
+            formatter = partial(_format_with_prettier, directory)
+        else:
+            formatter = None
+        return OutputWriter(directory, manifest, force, formatter, settings.FORMATTER)
+
+    @classmethod
+    def _write_component(
+        cls,
+        screen: str,
+        component: RootComponent,
+        cache: Optional[RenderCache],
+        output: OutputWriter,
+    ) -> Optional[str]:
+        """Writes a screen component, see :meth:`_write_screen`."""
+        if component.is_lazy:
+            return cls._write_lazy_screen(screen, component, output)
+        with tracer.phase("serialize", screen):
+            content = component.serialize(rendered=False)
+        return cls._write_screen(screen, content, output, cache)
+
+    @classmethod
+    def _write_parallel(
+        cls, screens: list[str], use_cache: bool, output: OutputWriter, jobs: int
+    ) -> list[tuple[str, tuple[Optional[str], Optional[str]]]]:
+        """Writes screens on a pool of forked processes.
+
+        Args:
+            screens: Names of registered screens to write.
+            use_cache: Whether workers serve unchanged screens from the render cache.
+            output: Output writer of the build, workers write to its directory.
+            jobs: Number of worker processes.
+
+        Returns:
+            Name of each screen with the path of its file, if written, and its content
+            hash, in the order of screens.
+        """
+        if not screens:
+            return []
+        # pylint: disable=import-outside-toplevel
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(screens)),
+            mp_context=multiprocessing.get_context(cls.start_method),
+            initializer=_init_worker,
+            initargs=(output.directory, output.force),
+        ) as executor:
+            return list(
+                zip(
+                    screens,
+                    executor.map(
+                        _write_job, [(screen, use_cache) for screen in screens]
+                    ),
+                )
+            )
+
+    @classmethod
+    def _forks(cls) -> bool:
+        """Returns whether workers are started by forking."""
+        # pylint: disable=import-outside-toplevel
+        import multiprocessing
+
+        return (
+            multiprocessing.get_context(cls.start_method).get_start_method() == "fork"
+        )
+
+    @classmethod
+    def _size(cls, registry: dict[str, RootComponent]) -> int:
+        """Returns number of components in registered screens, lazy children excluded."""
+        size = 0
+        for component in registry.values():
+            for _ in preorder(component._children, RootComponent._nested_children):
+                size += 1
+        return size
+
+    @classmethod
+    def run(
+        cls,
+        platform: Optional[str] = "",
+        use_cache: bool = True,
+        watch: bool = False,
+        profile_memory: bool = False,
+    ) -> None:
         """Starts a React Native expo client through a subprocess.
 
+        In watch mode the expo server is supervised and the app rebuilt whenever its
+        Python modules change, see :class:`~sweetpotato.core.watch.Watcher`. Runs of
+        the main script by the watcher return right away.
+
         Args:
             platform: Platform for expo to run on.
+            use_cache: Whether to serve unchanged screens from the render cache.
+            watch: Whether to rebuild the app on changes until interrupted.
+            profile_memory: Whether to profile the memory of the first build, see
+                :meth:`write_files`.
         """
-        cls.write_files()
-        subprocess.run(
-            f"cd {settings.REACT_NATIVE_PATH} && expo start {platform}",
-            shell=True,
-            check=True,
-        )
+        # pylint: disable=import-outside-toplevel
+        from sweetpotato.core.watch import DevServer, Watcher
+
+        if Watcher.reloading:
+            return
+        cls.write_files(use_cache=use_cache, profile_memory=profile_memory)
+        server = DevServer(settings.REACT_NATIVE_PATH, shlex.split(platform or ""))
+        if not watch:
+            with tracer.phase("expo"):
+                subprocess.run(
+                    server.command, cwd=settings.REACT_NATIVE_PATH, check=True
+                )
+            return
+        Watcher(partial(cls.write_files, use_cache=use_cache)).run(server)
 
     @classmethod
-    def _write_screen(cls, screen: str, content: dict) -> None:
+    def _write_screen(
+        cls,
+        screen: str,
+        content: dict,
+        output: Optional[OutputWriter] = None,
+        cache: Optional[RenderCache] = None,
+    ) -> Optional[str]:
         """Writes screen contents to file with screen name as file name.
 
+        Child components are streamed straight to the output file rather than being
+        rendered into the screen string first, see
+        :class:`~sweetpotato.core.output.OutputWriter`.
+
         Args:
             screen: Name of screen.
-            content: Dictionary of screen contents.
+            content: Dictionary of screen contents, `children` may be left unrendered or
+                be a file holding their rendition.
+            output: Output writer, writes to `settings.REACT_NATIVE_PATH` by default.
+            cache: Render cache unrendered children are streamed through, if any.
+
+        Returns:
+            Path of screen file if it was written.
         """
-        component = cls.__replace_values(content, screen)
-        os.chdir(settings.REACT_NATIVE_PATH)
-        with open(content["package"], "w", encoding="utf-8") as file:
-            file.write(component)
+        with tracer.phase("template", screen):
+            values = cls._template_values(content, screen)
+            template = cls._template(content, screen)
+        output = output or cls._output(settings.REACT_NATIVE_PATH)
+        path = content["package"]
+        with tracer.phase("write", screen), output.open(path) as file:
+            renderer = Renderer(file)
+            for part in template.parts(values):
+                if isinstance(part, str):
+                    file.write(part)
+                elif hasattr(part, "read"):
+                    shutil.copyfileobj(part, file)
+                elif cache:
+                    cache.stream(part, file)
+                else:
+                    renderer.render_children(part)
+        return path if file.written else None
+
+    @classmethod
+    def _write_lazy_screen(
+        cls,
+        screen: str,
+        component: RootComponent,
+        output: Optional[OutputWriter] = None,
+    ) -> Optional[str]:
+        """Writes a screen with lazy children in a single pass over them.
+
+        Imports, functions and variables precede the children in the screen but are
+        collected while they stream, so the children are spooled to a temporary file,
+        kept in memory up to `spool_bytes`, and copied in afterwards. Screens whose
+        children outgrow `spool_bytes` are written unformatted.
+
+        Args:
+            screen: Name of screen.
+            component: Screen component.
+            output: Output writer, see :meth:`_write_screen`.
+
+        Returns:
+            Path of screen file if it was written.
+        """
+        with tempfile.SpooledTemporaryFile(
+            max_size=cls.spool_bytes, mode="w+", encoding="utf-8"
+        ) as body:
+            with tracer.phase("serialize", screen):
+                children = component.serialize(rendered=False)["children"]
+                Renderer(body).render_children(children)
+            if output is not None and body.tell() > cls.spool_bytes:
+                output = OutputWriter(output.directory, output.manifest, output.force)
+            body.seek(0)
+            content = component.serialize(rendered=False)
+            content = content | {"children": body}
+            return cls._write_screen(screen, content, output)
 
     @staticmethod
     def publish(platform: str, staging: Optional[str] = "preview") -> str:
@@ -93,6 +439,8 @@ class Build:
         Todos:
             * Complete publishing logic for all platforms.
         """
+        import pty  # pylint: disable=import-outside-toplevel
+
         cmd = f"eas build -p {platform} --profile {staging}".split(" ")
 
         with open(f"{settings.REACT_NATIVE_PATH}/eas.json", "r+") as file:
@@ -134,56 +482,44 @@ class Build:
         raise NotImplementedError
 
     @staticmethod
-    def __format_screens() -> None:
-        """Formats all .js files with the prettier.js package."""
-        try:
-            subprocess.run(
-                f"cd {settings.REACT_NATIVE_PATH} && yarn prettier",
-                shell=True,
-                check=True,
-                stdout=subprocess.DEVNULL,
-            )
+    def _template(content: dict, screen: str) -> Template:
+        """Returns compiled template of screen.
 
-        except subprocess.CalledProcessError as error:
-            sys.stdout.write(f"{error}\nTrying yarn install...\n")
-            subprocess.run(
-                f"cd {settings.REACT_NATIVE_PATH} && yarn install",
-                shell=True,
-                check=True,
-                stdout=subprocess.DEVNULL,
-            )
+        Args:
+            content: Dictionary of screen contents.
+            screen: Name of screen.
+
+        Returns:
+            Template for functional or class components, `default` is removed from it
+            unless screen is the application component.
+        """
+        if not content["functional"]:
+            source = settings.APP_REPR
+        elif screen == "RootNavigation":
+            source = "<IMPORTS>\n<FUNCTIONS>"
+        else:
+            source = settings.APP_REPR_FUNCTIONAL_DEFAULT
+        return compile_template(source, exported=settings.APP_COMPONENT == screen)
 
     @staticmethod
-    def __replace_values(content: dict, screen: str) -> str:
-        """Sets placeholder values in the string representation of the app component.
+    def _template_values(content: dict, screen: str) -> dict:
+        """Returns values of template slots for screen.
 
         Args:
             content: Dictionary of screen contents.
             screen: Name of screen.
 
         Returns:
-            component: String representation of app component with placeholder values set.
-
-        Todos:
-            * Refactor this travesty.
+            Values by slot name, unrendered children are kept for streaming.
         """
-        if content["functional"]:
-            str_repr = (
-                "<IMPORTS>\n<FUNCTIONS>"
-                if screen == "RootNavigation"
-                else settings.APP_REPR_FUNCTIONAL_DEFAULT
-            )
-
-        if not content["functional"]:
-            str_repr = settings.APP_REPR
-        component = str_repr.replace("<NAME>", screen)
-        if settings.APP_COMPONENT != screen:
-            component = component.replace("default", "")
-        for key in content:
-            if key == "props" and content[key]:
-                component = component.replace(f"<{key.upper()}>", "props")
-            component = component.replace(f"<{key.upper()}>", str(content[key]))
-        return component
+        values = {key.upper(): value for key, value in content.items()}
+        values["NAME"] = screen
+        if values["PROPS"]:
+            values["PROPS"] = "props"
+        for key, value in values.items():
+            if key != "CHILDREN" or isinstance(value, str):
+                values[key] = str(value)
+        return values
 
     @staticmethod
     def _install_dependency(dependency: str) -> None:
@@ -200,42 +536,61 @@ class Build:
         if install:
             raise NotImplementedError
 
-    @staticmethod
-    def __access_check(file: str, mode: int) -> bool:
-        return (
-            os.path.exists(file) and os.access(file, mode) and not os.path.isdir(file)
-        )
 
-    @classmethod
-    def __check_dependency(
-        cls, cmd: str, mode: int = os.F_OK | os.X_OK, path: Optional[str] = None
-    ) -> Optional[str]:
-        if os.path.dirname(cmd):
-            if cls.__access_check(cmd, mode):
-                return cmd
+def _init_worker(directory: Path, force: bool) -> None:
+    """Creates the output writer of a worker process.
+
+    Args:
+        directory: Expo project to write to.
+        force: Whether to write files even if their content did not change.
+    """
+    global _worker_output  # pylint: disable=global-statement
+    _worker_output = Build._output(directory, Manifest(directory), force)
+
+
+def _format(source: str, path: Path) -> Optional[str]:
+    """Returns a screen formatted by the built-in formatter, or `None` on failure."""
+    # pylint: disable=import-outside-toplevel
+    from sweetpotato.core.pretty import FormatError, format_source
+
+    with tracer.phase("format", Path(path).stem):
+        try:
+            return format_source(source)
+        except FormatError as error:
+            sys.stdout.write(f"Could not format {path}: {error}\n")
             return None
-        if path is None:
-            path = os.environ.get("PATH", os.defpath)
-        if not path:
+
+
+def _format_with_prettier(
+    directory: Union[str, Path], source: str, path: Path
+) -> Optional[str]:
+    """Returns a screen formatted by the format worker of its project, or `None` on failure."""
+    # pylint: disable=import-outside-toplevel
+    from sweetpotato.core.format_worker import FormatWorker
+    from sweetpotato.core.pretty import FormatError
+
+    with tracer.phase("format", Path(path).stem):
+        try:
+            return FormatWorker.get(directory).format(source, path)
+        except FormatError as error:
+            sys.stdout.write(f"Could not format {path}: {error}\n")
             return None
-        path = path.split(os.pathsep)
-        if sys.platform == "win32":
-            if os.curdir not in path:
-                path.insert(0, os.curdir)
-            pathext = os.environ.get("PATHEXT", "").split(os.pathsep)
-            if any(cmd.lower().endswith(ext.lower()) for ext in pathext):
-                files = [cmd]
-            else:
-                files = [cmd + ext for ext in pathext]
-        else:
-            files = [cmd]
-        seen = set()
-        for directory in path:
-            norm_dir = os.path.normcase(directory)
-            if norm_dir not in seen:
-                seen.add(norm_dir)
-                for file in files:
-                    name = os.path.join(directory, file)
-                    if cls.__access_check(name, mode):
-                        return name
-        return None
+
+
+def _write_job(job: tuple[str, bool]) -> tuple[Optional[str], Optional[str]]:
+    """Writes a screen in a worker process.
+
+    Args:
+        job: Name of screen, looked up in the inherited registry, and whether to use
+            the render cache.
+
+    Returns:
+        Path of screen file if it was written and the hash of its content.
+    """
+    screen, use_cache = job
+    output = _worker_output
+    component = Build.storage.registry[screen]
+    cache = RenderCache() if use_cache and RenderCache.enabled() else None
+    path = Build._write_component(screen, component, cache, output)
+    package = component.package
+    return path, output.manifest.entries.get(output.manifest.relative(package))
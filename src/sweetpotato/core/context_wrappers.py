@@ -1,4 +1,8 @@
-"""
+"""Provides wrappers adding app-wide contexts, like navigation, around the app.
+
+The providers of optional plugins are imported by the wrappers adding them, so apps
+not using authentication, navigation or UI Kitten never import them.
+
 Todo:
     * Add docstrings for all classes & methods.
     * Add typing.
@@ -6,15 +10,13 @@ Todo:
 from abc import abstractmethod, ABC
 from typing import Union, Optional
 
-from sweetpotato.authentication import AuthenticationProvider
 from sweetpotato.components import SafeAreaProvider
 from sweetpotato.config import settings
 from sweetpotato.core import js_utils
 from sweetpotato.core.base import App
 from sweetpotato.core.base_management import State
+from sweetpotato.core.instrumentation import tracer
 from sweetpotato.core.protocols import CompositeType
-from sweetpotato.navigation import NavigationContainer
-from sweetpotato.ui_kitten import ApplicationProvider
 
 
 class Wrapper(ABC):
@@ -39,6 +41,9 @@ class UIKittenWrapper(Wrapper):
             Composite.
         """
         if settings.USE_UI_KITTEN:
+            # pylint: disable=import-outside-toplevel
+            from sweetpotato.ui_kitten import ApplicationProvider
+
             theme = kwargs.pop("theme", None)
             if not theme:
                 raise KeyError("UI Kitten must be provided a theme.")
@@ -65,6 +70,9 @@ class AuthenticationWrapper(Wrapper):
             Composite.
         """
         if settings.USE_AUTHENTICATION:
+            # pylint: disable=import-outside-toplevel
+            from sweetpotato.authentication import AuthenticationProvider
+
             component = AuthenticationProvider(children=[component])
         return super().wrap(component, **kwargs)
 
@@ -86,6 +94,9 @@ class NavigationWrapper(Wrapper):
             Composite.
         """
         if settings.USE_NAVIGATION:
+            # pylint: disable=import-outside-toplevel
+            from sweetpotato.navigation import NavigationContainer
+
             component = NavigationContainer(
                 children=[component], ref="RootNavigation.navigationRef"
             )
@@ -160,10 +171,11 @@ class ContextWrapper(
                     "@ui-kitten/eva-icons": {"EvaIconsPack"},
                 }
             )
-        component = App(
-            children=[super().wrap(component, **kwargs)],
-            state=state,
-            extra_imports=extra_imports,
-        )
+        with tracer.phase("wrap"):
+            component = App(
+                children=[super().wrap(component, **kwargs)],
+                state=state,
+                extra_imports=extra_imports,
+            )
         component.is_functional = is_functional
         return component
@@ -0,0 +1,329 @@
+"""Provides a document printer laying out source code within a line width.
+
+Documents describe code as text joined by possible line breaks, the same model, and
+algorithm, as prettier's: a :class:`Group` is printed on one line if it fits, otherwise
+its lines break, a :class:`Fill` breaks only the lines it must, like words of a
+paragraph, and :class:`ConditionalGroup` tries alternative layouts in turn.
+
+Example:
+    doc = Group(["[", Indent([SOFTLINE, join([",", LINE], items)]), SOFTLINE, "]"])
+    source = print_doc(doc, width=80)
+"""
+from typing import Iterable, Union
+
+INDENT: str = "  "  #: Indentation of one level.
+
+Doc = Union[
+    str, list, "Group", "Indent", "Line", "Fill", "IfBreak", "BreakParent"
+]  #: Document.
+
+_BREAK, _FLAT = 0, 1
+
+
+class Line:
+    """Line break, printed as a space, or nothing if soft, unless its group breaks.
+
+    Args:
+        soft: Whether the line is printed as nothing when flat.
+        hard: Whether the line always breaks, breaking its enclosing groups too.
+    """
+
+    __slots__ = ("soft", "hard")
+
+    def __init__(self, soft: bool = False, hard: bool = False) -> None:
+        self.soft = soft
+        self.hard = hard
+
+
+class BreakParent:
+    """Marker breaking the groups enclosing it, printed as nothing."""
+
+    __slots__ = ()
+
+
+LINE = Line()  #: Line breaking into a space.
+SOFTLINE = Line(soft=True)  #: Line breaking into nothing.
+HARDLINE = Line(hard=True)  #: Line always breaking.
+BREAK_PARENT = BreakParent()  #: Marker breaking enclosing groups.
+
+
+class Group:
+    """Document printed flat if it fits on the rest of the line, broken otherwise.
+
+    Args:
+        contents: Document of group.
+        should_break: Whether the group breaks regardless of fitting.
+    """
+
+    __slots__ = ("contents", "should_break")
+
+    def __init__(self, contents: Doc, should_break: bool = False) -> None:
+        self.contents = contents
+        self.should_break = should_break
+
+
+class ConditionalGroup(Group):
+    """Group trying alternative layouts, printing the first one that fits.
+
+    Args:
+        states: Layouts from most to least compact, the last one is printed broken if
+            none fits.
+    """
+
+    __slots__ = ("states",)
+
+    def __init__(self, states: list[Doc]) -> None:
+        super().__init__(states[0])
+        self.states = states
+
+
+class Indent:
+    """Document whose lines are indented one more level."""
+
+    __slots__ = ("contents",)
+
+    def __init__(self, contents: Doc) -> None:
+        self.contents = contents
+
+
+class Fill:
+    """Alternating contents and separators, separators break only if the next content does not fit.
+
+    Args:
+        parts: Contents at even indices, separator lines at odd ones.
+        start: Index of first part printed.
+    """
+
+    __slots__ = ("parts", "start")
+
+    def __init__(self, parts: list[Doc], start: int = 0) -> None:
+        self.parts = parts
+        self.start = start
+
+
+class IfBreak:
+    """Document printed depending on whether its enclosing group breaks.
+
+    Args:
+        broken: Document printed if the group breaks.
+        flat: Document printed if the group is flat.
+    """
+
+    __slots__ = ("broken", "flat")
+
+    def __init__(self, broken: Doc, flat: Doc = "") -> None:
+        self.broken = broken
+        self.flat = flat
+
+
+def join(separator: Doc, docs: Iterable[Doc]) -> list:
+    """Returns documents with separator between them."""
+    joined = []
+    for doc in docs:
+        if joined:
+            joined.append(separator)
+        joined.append(doc)
+    return joined
+
+
+def will_break(doc: Doc) -> bool:
+    """Whether a document contains a hard line or a group that always breaks."""
+    stack = [doc]
+    while stack:
+        doc = stack.pop()
+        if isinstance(doc, str):
+            continue
+        if isinstance(doc, list):
+            stack.extend(doc)
+        elif isinstance(doc, Line):
+            if doc.hard:
+                return True
+        elif isinstance(doc, BreakParent):
+            return True
+        elif isinstance(doc, Group):
+            if doc.should_break:
+                return True
+            stack.append(doc.contents)
+        elif isinstance(doc, Fill):
+            stack.extend(doc.parts)
+        elif isinstance(doc, IfBreak):
+            stack.append(doc.broken)
+            stack.append(doc.flat)
+        else:
+            stack.append(doc.contents)
+    return False
+
+
+def propagate_breaks(doc: Doc) -> None:
+    """Breaks every group containing a hard line, and the groups enclosing it, as prettier does.
+
+    Conditional groups are left to try their layouts and do not break their parents.
+    """
+    groups: list[Group] = []
+    stack: list[tuple[Doc, bool]] = [(doc, False)]
+    while stack:
+        doc, exiting = stack.pop()
+        if exiting:
+            group = groups.pop()
+            if (
+                group.should_break
+                and groups
+                and not isinstance(groups[-1], ConditionalGroup)
+            ):
+                groups[-1].should_break = True
+        elif isinstance(doc, str):
+            continue
+        elif isinstance(doc, list):
+            stack.extend((part, False) for part in reversed(doc))
+        elif isinstance(doc, (Line, BreakParent)):
+            hard = not isinstance(doc, Line) or doc.hard
+            if hard and groups and not isinstance(groups[-1], ConditionalGroup):
+                groups[-1].should_break = True
+        elif isinstance(doc, Group):
+            groups.append(doc)
+            stack.append((doc, True))
+            if isinstance(doc, ConditionalGroup):
+                stack.extend((state, False) for state in reversed(doc.states))
+            else:
+                stack.append((doc.contents, False))
+        elif isinstance(doc, Fill):
+            stack.extend((part, False) for part in reversed(doc.parts))
+        elif isinstance(doc, IfBreak):
+            stack.extend(((doc.flat, False), (doc.broken, False)))
+        else:
+            stack.append((doc.contents, False))
+
+
+def _fits(command: tuple, rest: list, width: int, must_be_flat: bool = False) -> bool:
+    """Whether a command fits in width, up to the first line break."""
+    rest_index = len(rest)
+    commands = [command]
+    while width >= 0:
+        if not commands:
+            if rest_index == 0:
+                return True
+            rest_index -= 1
+            commands.append(rest[rest_index])
+            continue
+        indent, mode, doc = commands.pop()
+        if isinstance(doc, str):
+            width -= len(doc)
+        elif isinstance(doc, list):
+            commands.extend((indent, mode, part) for part in reversed(doc))
+        elif isinstance(doc, Line):
+            if mode == _BREAK or doc.hard:
+                return True
+            if not doc.soft:
+                width -= 1
+        elif isinstance(doc, Group):
+            if must_be_flat and doc.should_break:
+                return False
+            group_mode = _BREAK if doc.should_break else mode
+            if isinstance(doc, ConditionalGroup) and group_mode == _BREAK:
+                commands.append((indent, group_mode, doc.states[-1]))
+            else:
+                commands.append((indent, group_mode, doc.contents))
+        elif isinstance(doc, Indent):
+            commands.append((indent + 1, mode, doc.contents))
+        elif isinstance(doc, Fill):
+            parts = doc.parts
+            for index in range(len(parts) - 1, doc.start - 1, -1):
+                commands.append((indent, mode, parts[index]))
+        elif isinstance(doc, IfBreak):
+            commands.append((indent, mode, doc.broken if mode == _BREAK else doc.flat))
+    return False
+
+
+def print_doc(doc: Doc, width: int = 80) -> str:
+    """Returns document laid out within width, trailing whitespace of lines trimmed.
+
+    Args:
+        doc: Document to print.
+        width: Maximum width of lines, exceeded only by text that can not break.
+    """
+    propagate_breaks(doc)
+    out: list[str] = []
+    position = 0
+    commands = [(0, _BREAK, doc)]
+    while commands:
+        indent, mode, doc = commands.pop()
+        if isinstance(doc, str):
+            out.append(doc)
+            position += len(doc)
+        elif isinstance(doc, list):
+            commands.extend((indent, mode, part) for part in reversed(doc))
+        elif isinstance(doc, Indent):
+            commands.append((indent + 1, mode, doc.contents))
+        elif isinstance(doc, Group):
+            if mode == _FLAT and not doc.should_break:
+                commands.append((indent, _FLAT, doc.contents))
+                continue
+            flat = (indent, _FLAT, doc.contents)
+            if not doc.should_break and _fits(flat, commands, width - position):
+                commands.append(flat)
+            elif isinstance(doc, ConditionalGroup):
+                if doc.should_break:
+                    commands.append((indent, _BREAK, doc.states[-1]))
+                    continue
+                for state in doc.states[1:]:
+                    command = (indent, _FLAT, state)
+                    if _fits(command, commands, width - position):
+                        commands.append(command)
+                        break
+                else:
+                    commands.append((indent, _BREAK, doc.states[-1]))
+            else:
+                commands.append((indent, _BREAK, doc.contents))
+        elif isinstance(doc, Fill):
+            _print_fill(doc, indent, mode, commands, width - position)
+        elif isinstance(doc, IfBreak):
+            commands.append((indent, mode, doc.broken if mode == _BREAK else doc.flat))
+        elif isinstance(doc, BreakParent):
+            continue
+        elif mode == _FLAT and not doc.hard:
+            if not doc.soft:
+                out.append(" ")
+                position += 1
+        else:
+            while out and out[-1].endswith((" ", "\t")):
+                out[-1] = out[-1].rstrip(" \t")
+                if not out[-1]:
+                    out.pop()
+            line = INDENT * indent
+            out.append("\n" + line)
+            position = len(line)
+    return "".join(out)
+
+
+def _print_fill(
+    fill: Fill, indent: int, mode: int, commands: list, remaining: int
+) -> None:
+    """Queues the first content and separator of a fill, breaking the separator if needed."""
+    parts, start = fill.parts, fill.start
+    count = len(parts) - start
+    if count <= 0:
+        return
+    content = parts[start]
+    content_flat = (indent, _FLAT, content)
+    content_break = (indent, _BREAK, content)
+    content_fits = _fits(content_flat, [], remaining, must_be_flat=True)
+    if count == 1:
+        commands.append(content_flat if content_fits else content_break)
+        return
+    separator = parts[start + 1]
+    separator_flat = (indent, _FLAT, separator)
+    separator_break = (indent, _BREAK, separator)
+    if count == 2:
+        if content_fits:
+            commands.extend((separator_flat, content_flat))
+        else:
+            commands.extend((separator_break, content_break))
+        return
+    rest = (indent, mode, Fill(parts, start + 2))
+    pair = (indent, _FLAT, [content, separator, parts[start + 2]])
+    if _fits(pair, [], remaining, must_be_flat=True):
+        commands.extend((rest, separator_flat, content_flat))
+    elif content_fits:
+        commands.extend((rest, separator_break, content_flat))
+    else:
+        commands.extend((rest, separator_break, content_break))
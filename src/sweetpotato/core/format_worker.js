@@ -0,0 +1,44 @@
+// Formats sources with the prettier package of the project in the working directory.
+//
+// Each request is a line of JSON, {"id": 1, "path": "/project/App.js", "source": "..."},
+// answered by a line {"id": 1, "source": "..."} or {"id": 1, "error": "..."}. The
+// process serves requests until its standard input is closed.
+const path = require("path");
+const readline = require("readline");
+
+let prettier = null;
+let loadError = null;
+try {
+  prettier = require(require.resolve("prettier", { paths: [process.cwd()] }));
+} catch (error) {
+  loadError = `Could not load prettier: ${error.message}`;
+}
+
+const configs = new Map();
+
+async function format(request) {
+  if (loadError !== null) {
+    throw new Error(loadError);
+  }
+  const directory = path.dirname(request.path);
+  if (!configs.has(directory)) {
+    configs.set(directory, await prettier.resolveConfig(request.path));
+  }
+  const options = { ...configs.get(directory), filepath: request.path };
+  return await prettier.format(request.source, options);
+}
+
+let queue = Promise.resolve();
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+  queue = queue.then(async () => {
+    let request = { id: null };
+    let response;
+    try {
+      request = JSON.parse(line);
+      response = { id: request.id, source: await format(request) };
+    } catch (error) {
+      response = { id: request.id, error: error.message };
+    }
+    process.stdout.write(JSON.stringify(response) + "\n");
+  });
+});
@@ -0,0 +1,182 @@
+"""Provides the format worker, a long-lived node process formatting screens with prettier.
+
+Running `yarn prettier` on every build costs more than the build itself, mostly in
+starting node and loading prettier. Instead, screens are sent to one node process
+running `format_worker.js`, which loads prettier once and serves every build of the
+Python process, watch sessions included. Requests and responses are lines of JSON
+over the standard streams of the process, see the script for the protocol. A project
+prettier can not be loaded from, like a fresh one without `node_modules`, is installed
+with `yarn install` once and the worker started again.
+
+Example:
+    worker = FormatWorker.get(settings.REACT_NATIVE_PATH)
+    source = worker.format(source, path)
+"""
+import atexit
+import json
+import os
+import subprocess
+import sys
+import threading
+from contextlib import ExitStack
+from pathlib import Path
+from typing import ClassVar, Optional, Sequence, Union
+
+from sweetpotato.config import settings
+from sweetpotato.core.pretty import FormatError
+
+LOAD_ERROR: str = (
+    "Could not load prettier"  #: Start of the error of a worker without prettier.
+)
+
+
+class FormatWorker:
+    """Node process formatting sources with the prettier package of a project.
+
+    Workers are started on their first request and restarted if they exit.
+
+    Args:
+        directory: Project directory prettier is loaded from.
+        command: Command starting the worker, `settings.FORMAT_WORKER_COMMAND` by default.
+
+    Attributes:
+        directory: Project directory.
+        command: Command starting the worker.
+    """
+
+    install_command: ClassVar[list[str]] = ["yarn", "install"]  #: Installs a project.
+    _workers: ClassVar[dict[tuple, "FormatWorker"]] = {}
+    _workers_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self, directory: Union[str, Path], command: Optional[Sequence[str]] = None
+    ) -> None:
+        self.directory = Path(directory)
+        self.command = list(command or settings.FORMAT_WORKER_COMMAND)
+        self._process: Optional[subprocess.Popen] = None
+        self._exits = ExitStack()  # Closes the pipes of the process.
+        self._requests = 0
+        self._installed = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(
+        cls, directory: Union[str, Path], command: Optional[Sequence[str]] = None
+    ) -> "FormatWorker":
+        """Returns the worker of a project, shared by the builds of this process.
+
+        Args:
+            directory: Project directory prettier is loaded from.
+            command: Command starting the worker, `settings.FORMAT_WORKER_COMMAND` by
+                default.
+        """
+        command = tuple(command or settings.FORMAT_WORKER_COMMAND)
+        # Forked processes inherit the workers of their parent, but not their pipes.
+        key = (os.getpid(), os.path.abspath(directory), command)
+        with cls._workers_lock:
+            worker = cls._workers.get(key)
+            if worker is None:
+                worker = cls._workers[key] = cls(directory, command)
+        return worker
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Stops the workers started by this process."""
+        with cls._workers_lock:
+            workers = [
+                worker for key, worker in cls._workers.items() if key[0] == os.getpid()
+            ]
+            cls._workers.clear()
+        for worker in workers:
+            worker.close()
+
+    def format(self, source: str, path: Union[str, Path]) -> str:
+        """Returns source formatted by prettier.
+
+        Args:
+            source: Source to format.
+            path: Path of the file the source is written to, prettier resolves its
+                configuration and parser from it.
+
+        Raises:
+            FormatError: If prettier can not format the source, can not be loaded even
+                after installing the project, or the worker can not be started or exits.
+        """
+        with self._lock:
+            process = self._start()
+            self._requests += 1
+            request = {"id": self._requests, "path": str(path), "source": source}
+            try:
+                process.stdin.write(json.dumps(request) + "\n")
+                process.stdin.flush()
+                line = process.stdout.readline()
+            except OSError:
+                line = ""
+            if not line:
+                self.close()
+                raise FormatError(f"Format worker {self.command[0]} exited.")
+        response = json.loads(line)
+        if "error" in response:
+            if response["error"].startswith(LOAD_ERROR) and not self._installed:
+                self.install()
+                return self.format(source, path)
+            raise FormatError(response["error"])
+        return response["source"]
+
+    def install(self) -> None:
+        """Installs the dependencies of the project and stops the worker, once per worker.
+
+        Failures are left to the next request, which reports prettier can not be loaded.
+        """
+        with self._lock:
+            if self._installed:
+                return
+            self._installed = True
+            sys.stdout.write(
+                f"{LOAD_ERROR}, trying {' '.join(self.install_command)}...\n"
+            )
+            try:
+                subprocess.run(
+                    self.install_command,
+                    cwd=self.directory,
+                    check=False,
+                    stdout=subprocess.DEVNULL,
+                )
+            except OSError:
+                pass
+            self.close()
+
+    def close(self) -> None:
+        """Stops the worker, it is started again by the next request."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+        self._exits.close()
+
+    def _start(self) -> subprocess.Popen:
+        """Returns the worker process, starting it if it is not running."""
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+        if self._process is not None:
+            self.close()
+        try:
+            self._process = self._exits.enter_context(
+                subprocess.Popen(
+                    self.command,
+                    cwd=self.directory,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    encoding="utf-8",
+                )
+            )
+        except OSError as error:
+            raise FormatError(f"Could not start format worker: {error}") from error
+        return self._process
+
+
+atexit.register(FormatWorker.close_all)
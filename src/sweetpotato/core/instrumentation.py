@@ -0,0 +1,190 @@
+"""Provides build instrumentation, hooks told when each phase of a build starts and ends.
+
+Phases are reported to the hooks of :data:`tracer`, by build and by screen:
+
+* `wrap`: wrapping of the app in its contexts, by the context wrapper.
+* `collect`: collection of imports, functions and styles of a screen on creation.
+* `write_files`: a whole build, `parallel` the screens written by worker processes.
+* `serialize`: serialization of a screen, children served from the render cache.
+* `template`: filling in of the template of a screen.
+* `write`: streaming of a screen to its file, rendering its children.
+* `format`: formatting of a screen, by the built-in formatter or prettier.
+* `expo`: the expo client started by `Build.run`.
+
+Phases nest, `format` runs within `write` for instance. Phases of worker processes are
+not reported, the `parallel` phase times them as a whole. Without hooks, reporting a
+phase costs a check of the hooks.
+
+Example:
+    with TraceRecorder() as recorder:
+        Build.write_files()
+    recorder.dump("trace.json")  # Opened with https://ui.perfetto.dev.
+    print(recorder.summary())
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Protocol, Union
+
+
+class Hook(Protocol):
+    """Receives the start and end of each phase."""
+
+    def start(self, phase: str, screen: Optional[str]) -> None:
+        """Called when a phase starts, screen is `None` for phases of a whole build."""
+
+    def end(self, phase: str, screen: Optional[str]) -> None:
+        """Called when a phase ends, even if it raised."""
+
+
+class Tracer:
+    """Reports phases to hooks.
+
+    Attributes:
+        hooks: Hooks phases are reported to, in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        self.hooks: tuple[Hook, ...] = ()
+        self._lock = threading.Lock()
+
+    def add(self, hook: Hook) -> None:
+        """Adds a hook, told about phases starting from now."""
+        with self._lock:
+            self.hooks = (*self.hooks, hook)
+
+    def remove(self, hook: Hook) -> None:
+        """Removes a hook, phases that already started are still ended on it."""
+        with self._lock:
+            self.hooks = tuple(added for added in self.hooks if added is not hook)
+
+    @contextmanager
+    def phase(self, name: str, screen: Optional[str] = None) -> Iterator[None]:
+        """Reports the phase run within the context to the hooks.
+
+        Args:
+            name: Name of phase.
+            screen: Name of screen, if the phase is that of a single screen.
+        """
+        hooks = self.hooks
+        if not hooks:
+            yield
+            return
+        for hook in hooks:
+            hook.start(name, screen)
+        try:
+            yield
+        finally:
+            for hook in reversed(hooks):
+                hook.end(name, screen)
+
+
+tracer = Tracer()  #: Default tracer, builds report their phases to it.
+
+
+class TraceRecorder:
+    """Hook recording phases, as Chrome trace events and as a plain text summary.
+
+    Adds itself to a tracer on entry and removes itself on exit, when used as a
+    context manager.
+
+    Args:
+        tracer: Tracer to record, :data:`tracer` by default.
+
+    Attributes:
+        tracer: Recorded tracer.
+        events: Recorded phases, as name, screen, start and duration in nanoseconds,
+            process and thread identifiers, in the order they ended.
+    """
+
+    def __init__(
+        self,
+        tracer: Tracer = tracer,  # pylint: disable=redefined-outer-name
+    ) -> None:
+        self.tracer = tracer
+        self.events: list[tuple[str, Optional[str], int, int, int, int]] = []
+        self._started = threading.local()
+        self._origin = time.perf_counter_ns()
+
+    def __enter__(self) -> "TraceRecorder":
+        self.tracer.add(self)
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.tracer.remove(self)
+
+    def start(self, *_) -> None:
+        stack = self._started.__dict__.setdefault("stack", [])
+        stack.append(time.perf_counter_ns())
+
+    def end(self, phase: str, screen: Optional[str]) -> None:
+        started = self._started.stack.pop()
+        self.events.append(
+            (
+                phase,
+                screen,
+                started - self._origin,
+                time.perf_counter_ns() - started,
+                os.getpid(),
+                threading.get_ident(),
+            )
+        )
+
+    def chrome_trace(self) -> dict:
+        """Returns the recorded phases in the Chrome trace event format.
+
+        Phases are complete events, timed in microseconds since the recorder was
+        created, the screen of a phase is its `screen` argument.
+        """
+        events = []
+        for phase, screen, start, duration, pid, tid in self.events:
+            event = {
+                "name": phase,
+                "cat": "build",
+                "ph": "X",
+                "ts": start / 1e3,
+                "dur": duration / 1e3,
+                "pid": pid,
+                "tid": tid,
+            }
+            if screen is not None:
+                event["name"] = f"{phase} {screen}"
+                event["args"] = {"screen": screen}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """Writes the recorded phases to a Chrome trace event JSON file."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.chrome_trace(), file)
+
+    def summary(self, screens: int = 10) -> str:
+        """Returns a table of the time spent in each phase, and in the slowest screens.
+
+        Args:
+            screens: Number of slowest screen phases listed.
+        """
+        phases: dict[str, list[int]] = {}
+        by_screen: dict[tuple[str, str], int] = {}
+        for phase, screen, _, duration, _, _ in self.events:
+            phases.setdefault(phase, []).append(duration)
+            if screen is not None:
+                by_screen[phase, screen] = by_screen.get((phase, screen), 0) + duration
+        lines = [
+            f"{'phase':<12} {'calls':>7} {'total ms':>11} {'mean ms':>10} {'max ms':>10}"
+        ]
+        for phase, durations in sorted(phases.items(), key=lambda item: -sum(item[1])):
+            lines.append(
+                f"{phase:<12} {len(durations):>7} {sum(durations) / 1e6:>11.2f} "
+                f"{sum(durations) / len(durations) / 1e6:>10.2f} {max(durations) / 1e6:>10.2f}"
+            )
+        slowest = sorted(by_screen.items(), key=lambda item: -item[1])[:screens]
+        if slowest:
+            lines.append("")
+            lines.append(f"{'screen':<30} {'phase':<12} {'total ms':>11}")
+            for (phase, screen), duration in slowest:
+                lines.append(f"{screen:<30} {phase:<12} {duration / 1e6:>11.2f}")
+        return "\n".join(lines) + "\n"
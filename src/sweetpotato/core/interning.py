@@ -0,0 +1,106 @@
+"""Provides opt-in interning of identical leaf components.
+
+Screens often repeat the same leaf, a separator `View` or a `Text(text="—")`, thousands
+of times. Interning resolves structurally identical leaves to one shared, immutable
+instance, rendered once and held once in memory, however many composites contain it.
+
+Interned components are not tracked by the composites containing them. Their
+attributes, names and children can no longer be changed, doing so raises a `TypeError`
+or, for children, an `AttributeError`. Dicts and lists held by attributes, like styles,
+are copied into immutable ones, so they can not be changed in place either.
+
+Example:
+    separator = intern(View(style={"height": 1}))
+    rows = View(children=[intern(Text(text="—")) for _ in range(1000)])
+"""
+import weakref
+from typing import Any, Optional
+
+from sweetpotato.core.base import Composite, RootComponent
+from sweetpotato.core.base_management import EMPTY_PROPS, EMPTY_STATE
+from sweetpotato.core.protocols import ComponentVar
+from sweetpotato.core.render_cache import describe
+from sweetpotato.core.renderer import Renderer
+from sweetpotato.core.tracking import SHARED, FrozenDict, FrozenList
+
+
+class LeafPool:
+    """Pool of interned leaf components, keyed by their structural description.
+
+    Components are held weakly and dropped from the pool once no tree contains them.
+    """
+
+    def __init__(self) -> None:
+        self._leaves = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._leaves)
+
+    def intern(self, component: ComponentVar) -> ComponentVar:
+        """Returns the shared instance of a leaf component, interning it if needed.
+
+        Args:
+            component: Leaf component, or composite without children, not yet added to
+                any composite.
+
+        Returns:
+            Shared instance structurally identical to component.
+
+        Raises:
+            ValueError: If component has children or state or props of its own, is a
+                root component or was already added to a composite.
+        """
+        if component._container is SHARED:
+            return component
+        if isinstance(component, RootComponent) or (
+            isinstance(component, Composite) and component._children
+        ):
+            name = component.__class__.__name__
+            raise ValueError(f"Only leaf components may be interned, not {name}.")
+        if component._state is not EMPTY_STATE or component._props is not EMPTY_PROPS:
+            raise ValueError("Components with state or props may not be interned.")
+        if component._container is not None:
+            raise ValueError("Components added to a composite may not be interned.")
+        key = describe(component)
+        shared: Optional[ComponentVar] = self._leaves.get(key)
+        if shared is not None:
+            return shared
+        component._render_cache = Renderer.rendition(component)
+        component._attrs = FrozenDict(
+            {key: _freeze(value) for key, value in component._attrs.items()}
+        )
+        if isinstance(component, Composite):
+            component._children = ()
+        component._container = SHARED
+        self._leaves[key] = component
+        return component
+
+    def clear(self) -> None:
+        """Forgets every interned component, those already shared stay immutable."""
+        self._leaves.clear()
+
+
+def _freeze(value: Any) -> Any:
+    """Returns an immutable copy of dicts, lists and tuples, nested ones included."""
+    if isinstance(value, dict):
+        return FrozenDict({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList(_freeze(item) for item in value)
+    if isinstance(value, tuple) and value.__class__ is tuple:
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+pool = LeafPool()  #: Default pool used by :func:`intern`.
+
+
+def intern(component: ComponentVar) -> ComponentVar:
+    """Returns the shared instance of a leaf component from the default pool.
+
+    Args:
+        component: Leaf component, not yet added to any composite.
+
+    Returns:
+        Shared instance structurally identical to component.
+    """
+    return pool.intern(component)
@@ -0,0 +1,96 @@
+"""Provides the build manifest, content hashes of the files written by the last build.
+
+Builds compare the hash of each rendered screen with the manifest and only write, and
+format, the files whose content changed. Untouched files keep their modification
+times, so Metro does not transform them again, and files of screens that are no
+longer registered are deleted.
+
+Example:
+    manifest = Manifest(settings.REACT_NATIVE_PATH)
+    if manifest.changed(path, digest):
+        ...
+        manifest.record(path, digest)
+    manifest.prune(written)
+    manifest.save()
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Union
+
+from sweetpotato.config import settings
+
+MODE: int = (
+    0o644  #: Permissions of the manifest and output files, set whatever the umask.
+)
+
+
+class Manifest:
+    """Content hashes of output files by path, relative to the project directory.
+
+    Args:
+        directory: Project directory the manifest and output files are kept in.
+
+    Attributes:
+        directory: Project directory.
+        path: Path of manifest file, `settings.BUILD_MANIFEST` in the project directory.
+        entries: Content hash of each output file, by relative path.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+        self.path = self.directory / settings.BUILD_MANIFEST
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                self.entries: dict[str, str] = json.load(file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def relative(self, path: Union[str, Path]) -> str:
+        """Returns an output path relative to the project directory, as a key."""
+        return os.path.relpath(self.directory / path, self.directory)
+
+    def changed(self, path: Union[str, Path], digest: str) -> bool:
+        """Whether an output file is missing or was written with different content.
+
+        Args:
+            path: Output path, absolute or relative to the project directory.
+            digest: Content hash of the file to write.
+        """
+        key = self.relative(path)
+        return self.entries.get(key) != digest or not (self.directory / key).is_file()
+
+    def record(self, path: Union[str, Path], digest: str) -> None:
+        """Records the content hash of a written output file."""
+        self.entries[self.relative(path)] = digest
+
+    def discard(self, path: Union[str, Path]) -> None:
+        """Forgets an output file, so the next build writes it whatever its content."""
+        self.entries.pop(self.relative(path), None)
+
+    def prune(self, paths: Iterable[Union[str, Path]]) -> list[str]:
+        """Deletes output files of a previous build that were not built this time.
+
+        Args:
+            paths: Output paths of this build.
+
+        Returns:
+            Relative paths of deleted files.
+        """
+        kept = {self.relative(path) for path in paths}
+        removed = [key for key in self.entries if key not in kept]
+        for key in removed:
+            (self.directory / key).unlink(missing_ok=True)
+            del self.entries[key]
+        return removed
+
+    def save(self) -> None:
+        """Writes the manifest, replacing the previous one atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=self.directory, delete=False
+        ) as file:
+            json.dump(self.entries, file, indent=2, sort_keys=True)
+        os.chmod(file.name, MODE)
+        os.replace(file.name, self.path)
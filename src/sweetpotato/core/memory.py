@@ -0,0 +1,320 @@
+"""Provides memory profiling of builds, attributing memory to phases, component classes and code.
+
+:class:`MemoryProfiler` is a hook of the build :data:`~sweetpotato.core.instrumentation.tracer`
+tracing allocations with tracemalloc. It reports:
+
+* by phase and screen, the peak memory allocated above what was allocated when the phase
+  started, and the memory it retained when it ended,
+* by component class, the memory of the registered components and of their memoized
+  renditions, the component registry as a whole,
+* the allocation sites in sweetpotato code retaining the most memory, since profiling
+  started and at the end of each phase of a whole build.
+
+Builds are profiled with `Build.write_files(profile_memory=True)`, or by wrapping the
+creation of the app too:
+
+Example:
+    with MemoryProfiler() as profiler:
+        app = App(component=catalogue())
+        app.write_files()
+    print(profiler.summary())
+    profiler.dump("memory.json")
+
+Allocations of worker processes of parallel builds are not traced, only those of the
+building process. Tracing slows builds down several times, one profiler should be
+active at a time.
+"""
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Optional, Union
+
+from sweetpotato.core.base import ComponentRegistry, RootComponent
+from sweetpotato.core.instrumentation import Tracer, tracer
+from sweetpotato.core.tracking import LazyChildren
+from sweetpotato.core.traversal import preorder
+
+PACKAGE: str = str(Path(__file__).parent.parent)  #: Directory of sweetpotato.
+
+Sites = dict[tuple[str, int], list[int]]
+
+
+def _sites(snapshot: tracemalloc.Snapshot) -> Sites:
+    """Returns size and count of the allocations of a snapshot by line of sweetpotato code.
+
+    Allocations are attributed to the most recent sweetpotato frame of their traceback,
+    allocations of the standard library on behalf of sweetpotato included, those of the
+    profiler itself are left out.
+    """
+    sites: Sites = {}
+    attributed: dict[tracemalloc.Traceback, Optional[list[int]]] = {}
+    for trace in snapshot.traces:
+        traceback = trace.traceback
+        if traceback not in attributed:
+            attributed[traceback] = None
+            for frame in reversed(traceback):
+                if frame.filename == __file__:
+                    break
+                if frame.filename.startswith(PACKAGE):
+                    site = sites.setdefault((frame.filename, frame.lineno), [0, 0])
+                    attributed[traceback] = site
+                    break
+        site = attributed[traceback]
+        if site is not None:
+            site[0] += trace.size
+            site[1] += 1
+    return sites
+
+
+def _footprint(component: object) -> tuple[int, int]:
+    """Returns the size of a component and of its memoized renditions, in bytes."""
+    size = sys.getsizeof(component) + sys.getsizeof(component._attrs)
+    instance = getattr(component, "__dict__", None)
+    if instance is not None:
+        size += sys.getsizeof(instance)
+    if isinstance(component._children, (list, str)):
+        size += sys.getsizeof(component._children)
+    rendered = 0
+    if component._render_cache is not None:
+        rendered += sys.getsizeof(component._render_cache)
+    if component._parts_cache is not None:
+        rendered += sys.getsizeof(component._parts_cache)
+        rendered += sum(
+            sys.getsizeof(part)
+            for part in component._parts_cache
+            if part.__class__ is str
+        )
+    return size, rendered
+
+
+class MemoryProfiler:
+    """Hook attributing the memory allocated by builds to phases, components and code.
+
+    Starts tracemalloc on entry, unless it is tracing already, and stops it on exit, when
+    used as a context manager. A snapshot of allocations by sweetpotato code is kept on
+    entry, on exit and at the end of each phase of a whole build.
+
+    Args:
+        tracer: Tracer to profile, :data:`~sweetpotato.core.instrumentation.tracer` by default.
+        frames: Frames traced per allocation, when tracemalloc is started by the profiler.
+
+    Attributes:
+        tracer: Profiled tracer.
+        phases: Calls, highest peak and total retained bytes by phase.
+        screens: Highest peak and total retained bytes by phase and screen.
+        snapshots: Allocations by sweetpotato code by phase of a whole build, and on
+            `'start'` and `'end'` of profiling.
+    """
+
+    def __init__(
+        self,
+        tracer: Tracer = tracer,  # pylint: disable=redefined-outer-name
+        frames: int = 8,
+    ) -> None:
+        self.tracer = tracer
+        self.phases: dict[str, list[int]] = {}
+        self.screens: dict[tuple[str, str], list[int]] = {}
+        self.snapshots: dict[str, Sites] = {}
+        self._frames = frames
+        self._started = False
+        self._stack: list[list[int]] = []
+        self._traced = [0, 0, 0]
+
+    def __enter__(self) -> "MemoryProfiler":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._frames)
+            self._started = True
+        self.snapshots["start"] = _sites(tracemalloc.take_snapshot())
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        self._stack = [[current, current]]
+        self.tracer.add(self)
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.tracer.remove(self)
+        current, peak = tracemalloc.get_traced_memory()
+        started, highest = self._stack.pop()
+        self._traced = [started, current, max(highest, peak)]
+        self.snapshots["end"] = _sites(tracemalloc.take_snapshot())
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+
+    def start(self, *_) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self._stack[-1][1] = max(self._stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._stack.append([current, current])
+
+    def end(self, phase: str, screen: Optional[str]) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        started, highest = self._stack.pop()
+        peak = max(highest, peak)
+        self._stack[-1][1] = max(self._stack[-1][1], peak)
+        stats = self.phases.setdefault(phase, [0, 0, 0])
+        stats[0] += 1
+        stats[1] = max(stats[1], peak - started)
+        stats[2] += current - started
+        if screen is not None:
+            stats = self.screens.setdefault((phase, screen), [0, 0])
+            stats[0] = max(stats[0], peak - started)
+            stats[1] += current - started
+            return
+        self.snapshots[phase] = _sites(tracemalloc.take_snapshot())
+        tracemalloc.reset_peak()
+
+    def components(self, registry: Optional[dict] = None) -> dict[str, dict[str, int]]:
+        """Returns count, bytes and rendered bytes of components by class, largest first.
+
+        Components are those of the registered screens, lazy children excluded. Bytes are
+        those of components, their attributes and child lists, rendered bytes those of
+        their memoized renditions.
+
+        Args:
+            registry: Component registry, the current one by default.
+        """
+        registry = ComponentRegistry._registry if registry is None else registry
+        classes: dict[str, dict[str, int]] = {}
+        seen = set()
+        for root in registry.values():
+            children = (
+                () if root._children.__class__ is LazyChildren else root._children
+            )
+            for component in (
+                root,
+                *preorder(children, RootComponent._nested_children),
+            ):
+                if id(component) in seen:
+                    continue
+                seen.add(id(component))
+                cls = component.__class__
+                name = (
+                    f"{cls.__module__.removeprefix('sweetpotato.')}.{cls.__qualname__}"
+                )
+                stats = classes.setdefault(
+                    name, {"count": 0, "bytes": 0, "rendered": 0}
+                )
+                size, rendered = _footprint(component)
+                stats["count"] += 1
+                stats["bytes"] += size
+                stats["rendered"] += rendered
+        return dict(
+            sorted(
+                classes.items(),
+                key=lambda item: -item[1]["bytes"] - item[1]["rendered"],
+            )
+        )
+
+    def sites(
+        self, limit: int = 10, phase: str = "end"
+    ) -> list[dict[str, Union[str, int]]]:
+        """Returns the allocation sites in sweetpotato code retaining the most memory.
+
+        Args:
+            limit: Number of sites.
+            phase: Phase of a whole build the memory is retained at the end of, or
+                `'end'` for the end of profiling.
+
+        Returns:
+            File relative to the package's parent, line, bytes and count of allocations
+            retained since profiling started, largest first.
+        """
+        start, sites = self.snapshots["start"], self.snapshots[phase]
+        retained = []
+        for (filename, line), (size, count) in sites.items():
+            size_before, count_before = start.get((filename, line), (0, 0))
+            if size > size_before:
+                retained.append(
+                    {
+                        "file": str(Path(filename).relative_to(Path(PACKAGE).parent)),
+                        "line": line,
+                        "bytes": size - size_before,
+                        "count": count - count_before,
+                    }
+                )
+        return sorted(retained, key=lambda site: -site["bytes"])[:limit]
+
+    def report(self, limit: int = 10) -> dict:
+        """Returns the profile as a JSON serializable dict, sizes in bytes.
+
+        Args:
+            limit: Number of screens and allocation sites listed.
+        """
+        components = self.components()
+        screens = sorted(self.screens.items(), key=lambda item: -item[1][0])[:limit]
+        return {
+            "traced": dict(zip(("start", "end", "peak"), self._traced)),
+            "phases": {
+                phase: {"calls": calls, "peak": peak, "retained": retained}
+                for phase, (calls, peak, retained) in self.phases.items()
+            },
+            "screens": [
+                {"phase": phase, "screen": screen, "peak": peak, "retained": retained}
+                for (phase, screen), (peak, retained) in screens
+            ],
+            "registry": {
+                "screens": len(ComponentRegistry._registry),
+                "components": sum(stats["count"] for stats in components.values()),
+                "bytes": sum(stats["bytes"] for stats in components.values()),
+                "rendered": sum(stats["rendered"] for stats in components.values()),
+            },
+            "components": components,
+            "sites": {
+                phase: self.sites(limit, phase)
+                for phase in self.snapshots
+                if phase != "start"
+            },
+        }
+
+    def dump(self, path: Union[str, Path], limit: int = 10) -> None:
+        """Writes the profile to a JSON file, see :meth:`report`."""
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.report(limit), file, indent=2)
+
+    def summary(self, limit: int = 10) -> str:
+        """Returns tables of memory by phase, screen, component class and allocation site.
+
+        Args:
+            limit: Number of screens, component classes and allocation sites listed.
+        """
+        report = self.report(limit)
+        traced, registry = report["traced"], report["registry"]
+        lines = [
+            f"traced {traced['end'] / 1e6:.2f} MB, peak {traced['peak'] / 1e6:.2f} MB, "
+            f"registry of {registry['screens']} screens, {registry['components']} components "
+            f"{registry['bytes'] / 1e6:.2f} MB, rendered {registry['rendered'] / 1e6:.2f} MB",
+            "",
+            f"{'phase':<12} {'calls':>7} {'peak MB':>10} {'retained MB':>12}",
+        ]
+        for phase, stats in sorted(
+            report["phases"].items(), key=lambda item: -item[1]["peak"]
+        ):
+            lines.append(
+                f"{phase:<12} {stats['calls']:>7} {stats['peak'] / 1e6:>10.2f} "
+                f"{stats['retained'] / 1e6:>12.2f}"
+            )
+        if report["screens"]:
+            lines += [
+                "",
+                f"{'screen':<30} {'phase':<12} {'peak MB':>10} {'retained MB':>12}",
+            ]
+            for stats in report["screens"]:
+                lines.append(
+                    f"{stats['screen']:<30} {stats['phase']:<12} {stats['peak'] / 1e6:>10.2f} "
+                    f"{stats['retained'] / 1e6:>12.2f}"
+                )
+        lines += ["", f"{'component':<30} {'count':>9} {'MB':>10} {'rendered MB':>12}"]
+        for name, stats in list(report["components"].items())[:limit]:
+            lines.append(
+                f"{name:<30} {stats['count']:>9} {stats['bytes'] / 1e6:>10.2f} "
+                f"{stats['rendered'] / 1e6:>12.2f}"
+            )
+        lines += ["", f"{'site':<50} {'count':>9} {'retained MB':>12}"]
+        for site in report["sites"]["end"]:
+            lines.append(
+                f"{site['file'] + ':' + str(site['line']):<50} {site['count']:>9} "
+                f"{site['bytes'] / 1e6:>12.2f}"
+            )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,157 @@
+"""Provides the output writer, writing screen files below an explicit project directory.
+
+Screen packages, like `./src/components/Home.js`, are resolved against the target
+directory rather than the working directory, so builds never change directory and
+builds of different targets can run in threads of one process. Each file is written
+to a temporary file next to it and moved into place with `os.replace`, so Metro never
+bundles a half-written file. With a formatter, text is collected and only formatted if
+the file is written, see :mod:`~sweetpotato.core.pretty`.
+
+Example:
+    writer = OutputWriter(directory, Manifest(directory))
+    with writer.open("./src/components/Home.js") as file:
+        file.write(source)
+    if file.written:
+        ...
+"""
+import hashlib
+import io
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Union
+
+from sweetpotato.core.manifest import MODE, Manifest
+
+#: Function formatting the source of an output file, `None` if it can not.
+Formatter = Callable[[str, Path], Optional[str]]
+
+
+class OutputFile:
+    """Text file being written, hashed along the way.
+
+    Args:
+        file: Temporary file the text is written to.
+
+    Attributes:
+        digest: SHA-256 hash of the text written so far.
+        written: Whether the file replaced its target when closed.
+    """
+
+    def __init__(self, file) -> None:
+        self._file = file
+        self.digest = hashlib.sha256()
+        self.written = False
+
+    def write(self, text: str) -> int:
+        self.digest.update(text.encode("utf-8"))
+        return self._file.write(text)
+
+    def format(self, formatter: Formatter, path: Path, file) -> bool:
+        """Writes the text collected so far to file, formatted if the formatter can.
+
+        The digest stays that of the unformatted text, and of the name of the formatter,
+        so unchanged files are skipped without formatting them.
+
+        Args:
+            formatter: Function formatting source text.
+            path: Path of output file.
+            file: File the formatted text is written to.
+
+        Returns:
+            Whether the text was formatted, it is written as is otherwise.
+        """
+        source = self._file.getvalue()
+        formatted = formatter(source, path)
+        file.write(source if formatted is None else formatted)
+        return formatted is not None
+
+
+class OutputWriter:
+    """Writes output files below a target directory, replacing each one atomically.
+
+    Args:
+        directory: Project directory packages are resolved against.
+        manifest: Build manifest, if any, files with unchanged content are skipped.
+        force: Whether to write files even if the manifest holds the same content.
+        formatter: Function formatting the text of each file, and its path, before it
+            is written.
+        formatter_name: Name of the formatter, part of the content hash of each file, so
+            files are written again when the formatter changes.
+
+    Attributes:
+        directory: Project directory.
+        manifest: Build manifest recording what was written.
+        force: Whether unchanged files are written too.
+        formatter: Function formatting text, files are written as is if `None`.
+        formatter_name: Name of the formatter hashed with the content of each file.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        manifest: Optional[Manifest] = None,
+        force: bool = False,
+        formatter: Optional[Formatter] = None,
+        formatter_name: Optional[str] = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.manifest = manifest
+        self.force = force
+        self.formatter = formatter
+        self.formatter_name = formatter_name
+
+    def resolve(self, package: Union[str, Path]) -> Path:
+        """Returns the path of a package, relative packages are below the directory."""
+        return Path(os.path.normpath(self.directory / package))
+
+    @contextmanager
+    def open(self, package: Union[str, Path]) -> Iterator[OutputFile]:
+        """Opens an output file for writing.
+
+        Missing directories are created. Text is written to a temporary file in the
+        same directory, which replaces the target on success unless the manifest holds
+        the same content hash, and is removed otherwise. With a formatter, text is held
+        in memory and formatted if the target is replaced, the hash is that of the
+        unformatted text and of the name of the formatter. Files the formatter fails on
+        are written as is but left out of the manifest, so the next build formats them.
+
+        Args:
+            package: Path of file, relative to the directory.
+
+        Yields:
+            File to write text to, `written` tells whether it replaced the target.
+        """
+        path = self.resolve(package)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+        )
+        output = None
+        try:
+            with open(descriptor, "w", encoding="utf-8") as file:
+                output = OutputFile(file if self.formatter is None else io.StringIO())
+                if self.formatter_name is not None:
+                    output.digest.update(f"{self.formatter_name}\0".encode("utf-8"))
+                yield output
+                digest = output.digest.hexdigest()
+                changed = (
+                    self.force
+                    or self.manifest is None
+                    or self.manifest.changed(path, digest)
+                )
+                formatted = True
+                if changed and self.formatter is not None:
+                    formatted = output.format(self.formatter, path, file)
+            if changed:
+                os.chmod(temporary, MODE)
+                os.replace(temporary, path)
+                output.written = True
+                if self.manifest is not None and formatted:
+                    self.manifest.record(path, digest)
+                elif self.manifest is not None:
+                    self.manifest.discard(path)
+        finally:
+            if output is None or not output.written:
+                os.unlink(temporary)
@@ -0,0 +1,1190 @@
+"""Provides the built-in formatter, laying out screens the way prettier does.
+
+Screens are formatted with the options of the bundled `.prettierrc.json`, prettier's
+defaults: lines of 80 columns, two space indentation, double quotes, semicolons,
+trailing commas where ES5 allows them and spaces inside object braces. JSX follows
+prettier's rules for breaking elements, attributes and text, imports and objects are
+wrapped like prettier wraps them, and hand-written code keeps its own line breaks but
+is re-indented and spaced.
+
+The formatter covers the JavaScript sweetpotato generates, and common hand-written
+functions, rather than the whole language. It is experimental: the golden files under
+`tests/test_backend/golden` were written by hand from prettier 2.6's printing rules,
+not produced by prettier, so its output is not verified to match prettier's. It is
+opted into with `settings.FORMATTER = "builtin"`, prettier formats screens by default.
+
+Example:
+    source = format_source("import {View} from 'react-native'")
+"""
+import re
+from typing import Optional
+
+from sweetpotato.core.doc import (
+    BREAK_PARENT,
+    HARDLINE,
+    LINE,
+    SOFTLINE,
+    ConditionalGroup,
+    Doc,
+    Fill,
+    Group,
+    IfBreak,
+    Indent,
+    join,
+    print_doc,
+    will_break,
+)
+
+WIDTH: int = 80  #: Maximum width of lines.
+
+(
+    _NAME,
+    _PROPERTY,
+    _NUMBER,
+    _STRING,
+    _TEMPLATE,
+    _REGEX,
+    _PUNCT,
+    _COMMENT,
+    _BLOCK_COMMENT,
+) = range(9)
+
+_PUNCTUATORS = re.compile(
+    "|".join(
+        re.escape(punctuator)
+        for punctuator in sorted(
+            (
+                ">>>=",
+                "...",
+                "===",
+                "!==",
+                "**=",
+                "<<=",
+                ">>=",
+                ">>>",
+                "&&=",
+                "||=",
+                "??=",
+                "=>",
+                "==",
+                "!=",
+                "<=",
+                ">=",
+                "&&",
+                "||",
+                "??",
+                "?.",
+                "++",
+                "--",
+                "+=",
+                "-=",
+                "*=",
+                "/=",
+                "%=",
+                "&=",
+                "|=",
+                "^=",
+                "**",
+                "<<",
+                ">>",
+                "{",
+                "}",
+                "(",
+                ")",
+                "[",
+                "]",
+                ";",
+                ",",
+                "<",
+                ">",
+                "+",
+                "-",
+                "*",
+                "/",
+                "%",
+                "&",
+                "|",
+                "^",
+                "!",
+                "~",
+                "?",
+                ":",
+                "=",
+                ".",
+                "@",
+                "#",
+            ),
+            key=len,
+            reverse=True,
+        )
+    )
+)
+_WHITESPACE = re.compile(r"[ \t\r\n\f\v\u00a0\ufeff\u2028\u2029]*")
+_IDENTIFIER = re.compile(r"[A-Za-z_$\u0080-\uffff][\w$\u0080-\uffff]*")
+_NUMBER_LITERAL = re.compile(
+    r"0[xXoObB][\da-fA-F_]+n?|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?n?"
+)
+_JSX_NAME = re.compile(r"[A-Za-z_$][\w$.:-]*")
+_JSX_ATTRIBUTE = re.compile(r"[A-Za-z_$][\w$:-]*")
+_ES5_IDENTIFIER = re.compile(r"[A-Za-z_$][A-Za-z0-9_$]*\Z")
+_JSX_SPACE = re.compile(r"([ \n\r\t]+)")
+
+_HEADER_KEYWORDS = frozenset({"if", "for", "while", "switch", "catch", "with"})
+_BLOCK_KEYWORDS = frozenset({"else", "try", "finally", "do"})
+_EXPRESSION_KEYWORDS = frozenset(
+    {
+        "return",
+        "typeof",
+        "in",
+        "of",
+        "case",
+        "yield",
+        "await",
+        "default",
+        "import",
+        "export",
+        "throw",
+        "delete",
+        "void",
+        "const",
+        "let",
+        "var",
+        "new",
+        "instanceof",
+    }
+)
+_KEYWORDS = (
+    _HEADER_KEYWORDS
+    | _BLOCK_KEYWORDS
+    | _EXPRESSION_KEYWORDS
+    | {
+        "function",
+        "class",
+        "extends",
+        "async",
+        "static",
+        "get",
+        "set",
+        "from",
+        "as",
+        "break",
+        "continue",
+    }
+)
+_DECLARATION_KEYWORDS = frozenset(
+    {"if", "for", "while", "switch", "try", "function", "class", "with"}
+)
+_MEMBER_PREFIXES = frozenset({"static", "async", "get", "set", "*"})
+_ASSIGNMENTS = frozenset(
+    {
+        "=",
+        "+=",
+        "-=",
+        "*=",
+        "/=",
+        "%=",
+        "**=",
+        "<<=",
+        ">>=",
+        ">>>=",
+        "&=",
+        "|=",
+        "^=",
+        "&&=",
+        "||=",
+        "??=",
+    }
+)
+_BINARY = _ASSIGNMENTS | {
+    "==",
+    "===",
+    "!=",
+    "!==",
+    "<",
+    ">",
+    "<=",
+    ">=",
+    "+",
+    "-",
+    "*",
+    "/",
+    "%",
+    "**",
+    "&",
+    "|",
+    "^",
+    "<<",
+    ">>",
+    ">>>",
+    "&&",
+    "||",
+    "??",
+    "=>",
+}
+_CONTINUATIONS = _BINARY - {"=>"} | {".", "?.", "?", ":", ","}
+
+_JSX_WHITESPACE = IfBreak(['{" "}', SOFTLINE], " ")
+
+
+class FormatError(ValueError):
+    """Raised for source the formatter can not parse."""
+
+
+class _Token:
+    """Token of source, with the number of line breaks preceding it."""
+
+    __slots__ = ("kind", "text", "newlines", "prefix")
+
+    def __init__(self, kind: int, text: str, newlines: int) -> None:
+        self.kind = kind
+        self.text = text
+        self.newlines = newlines
+        self.prefix = False
+
+    def __repr__(self) -> str:
+        return self.text
+
+
+class _Bracket:
+    """Bracketed items, `kind` tells how the brackets are used.
+
+    Kinds are `block`, `object`, `array` and `index` for braces and square brackets,
+    `call`, `header` and `paren` for parentheses.
+    """
+
+    __slots__ = ("open", "items", "kind", "newlines", "expanded")
+
+    def __init__(self, open_: str, kind: str, newlines: int) -> None:
+        self.open = open_
+        self.items: list = []
+        self.kind = kind
+        self.newlines = newlines
+        self.expanded = False
+
+
+class _Element:
+    """JSX element, `children` is `None` for self-closing elements."""
+
+    __slots__ = ("name", "attributes", "children", "newlines")
+
+    def __init__(self, name: str, newlines: int) -> None:
+        self.name = name
+        self.attributes: list[tuple[Optional[str], object]] = []
+        self.children: Optional[list] = None
+        self.newlines = newlines
+
+
+class _Expression:
+    """JSX expression container."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: list) -> None:
+        self.items = items
+
+
+_CLOSERS = {"{": "}", "(": ")", "[": "]"}
+
+
+def _is_keyword(item: object, keywords: frozenset = _KEYWORDS) -> bool:
+    return isinstance(item, _Token) and item.kind == _NAME and item.text in keywords
+
+
+def _is_punct(item: object, *texts: str) -> bool:
+    return (
+        isinstance(item, _Token)
+        and item.kind == _PUNCT
+        and (not texts or item.text in texts)
+    )
+
+
+def _is_comment(item: object) -> bool:
+    return isinstance(item, _Token) and item.kind in (_COMMENT, _BLOCK_COMMENT)
+
+
+def _is_operand(item: object) -> bool:
+    """Whether an item ends an operand, so a following `+` or `/` is binary."""
+    if item is None:
+        return False
+    if isinstance(item, _Token):
+        if item.kind == _PUNCT:
+            return item.text in ("++", "--") and not item.prefix
+        if item.kind in (_COMMENT, _BLOCK_COMMENT):
+            return False
+        return item.kind != _NAME or item.text not in _KEYWORDS
+    return not (isinstance(item, _Bracket) and item.kind == "block")
+
+
+class _Parser:
+    """Parses source into items, nesting bracketed items and JSX elements."""
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+
+    def error(self, position: int, message: str) -> FormatError:
+        line = self.source.count("\n", 0, position) + 1
+        return FormatError(f"{message} on line {line}.")
+
+    def items(
+        self, position: int, closer: Optional[str], container: str
+    ) -> tuple[list, int]:
+        """Returns items up to closer, and the position after it.
+
+        Args:
+            position: Position to start at.
+            closer: Closing bracket, `None` for the end of source.
+            container: Kind of enclosing brackets, see :class:`_Bracket`.
+        """
+        source = self.source
+        items: list = []
+        previous = None
+        while True:
+            space = _WHITESPACE.match(source, position)
+            newlines = source.count("\n", position, space.end())
+            position = space.end()
+            if position >= len(source):
+                if closer is not None:
+                    raise self.error(position, f"Missing {closer!r}")
+                return items, position
+            char = source[position]
+            if char == closer:
+                return items, position + 1
+            if char in ")]}":
+                raise self.error(position, f"Unexpected {char!r}")
+            item, position = self.item(position, char, newlines, previous, container)
+            items.append(item)
+            if not _is_comment(item):
+                previous = item
+
+    def item(
+        self, position: int, char: str, newlines: int, previous: object, container: str
+    ) -> tuple[object, int]:
+        """Returns the item at position and the position after it."""
+        source = self.source
+        if source.startswith("//", position):
+            end = source.find("\n", position)
+            end = len(source) if end < 0 else end
+            return _Token(_COMMENT, source[position:end].rstrip(), newlines), end
+        if source.startswith("/*", position):
+            end = source.find("*/", position + 2)
+            if end < 0:
+                raise self.error(position, "Unterminated comment")
+            return _Token(_BLOCK_COMMENT, source[position : end + 2], newlines), end + 2
+        if char in "{([":
+            bracket = _Bracket(char, self.kind(char, previous, container), newlines)
+            bracket.items, end = self.items(position + 1, _CLOSERS[char], bracket.kind)
+            space = _WHITESPACE.match(source, position + 1)
+            bracket.expanded = bracket.kind == "object" and "\n" in space.group()
+            if bracket.expanded and _is_keyword(
+                previous, frozenset({"import", "export"})
+            ):
+                bracket.expanded = False
+            return bracket, end
+        if char in "'\"":
+            end = self.string(position, char)
+            return _Token(_STRING, source[position:end], newlines), end
+        if char == "`":
+            end = self.template(position)
+            return _Token(_TEMPLATE, source[position:end], newlines), end
+        if char == "<" and self.starts_jsx(position, previous):
+            return self.element(position, newlines)
+        if char == "/" and not _is_operand(previous):
+            end = self.regex(position)
+            return _Token(_REGEX, source[position:end], newlines), end
+        match = _NUMBER_LITERAL.match(source, position)
+        if match and (char.isdigit() or char == "." and match.end() > position + 1):
+            return _Token(_NUMBER, _number(match.group()), newlines), match.end()
+        match = _IDENTIFIER.match(source, position)
+        if match:
+            token = _Token(_NAME, match.group(), newlines)
+            if _is_punct(previous, ".", "?.", "#"):
+                token.kind = _PROPERTY
+            return token, match.end()
+        match = _PUNCTUATORS.match(source, position)
+        if match:
+            return _Token(_PUNCT, match.group(), newlines), match.end()
+        raise self.error(position, f"Unexpected {char!r}")
+
+    @staticmethod
+    def kind(char: str, previous: object, container: str) -> str:
+        """Returns how brackets opened after previous item are used."""
+        if char == "{":
+            if previous is None:
+                return "block" if container == "block" else "object"
+            if _is_punct(previous):
+                return "block" if previous.text in ("=>", ";") else "object"
+            if _is_keyword(previous, _BLOCK_KEYWORDS):
+                return "block"
+            if _is_keyword(previous, _EXPRESSION_KEYWORDS):
+                return "object"
+            if isinstance(previous, _Token) and previous.kind in (_NAME, _PROPERTY):
+                return "block"
+            if isinstance(previous, _Bracket):
+                return "block" if previous.open in "({" else "object"
+            return "object"
+        if char == "[":
+            return "index" if _is_operand(previous) else "array"
+        if _is_keyword(previous, _HEADER_KEYWORDS):
+            return "header"
+        if _is_keyword(previous, frozenset({"function"})):
+            return "call"
+        if _is_keyword(previous):
+            return "paren"
+        if isinstance(previous, _Token) and previous.kind in (_NAME, _PROPERTY):
+            return "call"
+        if isinstance(previous, _Bracket) and previous.kind in (
+            "call",
+            "index",
+            "paren",
+        ):
+            return "call"
+        return "paren"
+
+    def starts_jsx(self, position: int, previous: object) -> bool:
+        following = self.source[position + 1 : position + 2]
+        if not (following.isalpha() or following in ("_", "$", ">")):
+            return False
+        if isinstance(previous, _Element) or previous is None:
+            return True
+        if _is_punct(previous):
+            return previous.text not in ("++", "--") or previous.prefix
+        return _is_keyword(previous)
+
+    def string(self, position: int, quote: str) -> int:
+        source = self.source
+        index = position + 1
+        while index < len(source):
+            char = source[index]
+            if char == "\\":
+                index += 2
+                continue
+            if char == quote:
+                return index + 1
+            if char == "\n":
+                break
+            index += 1
+        raise self.error(position, "Unterminated string")
+
+    def template(self, position: int) -> int:
+        source = self.source
+        index = position + 1
+        while index < len(source):
+            char = source[index]
+            if char == "\\":
+                index += 2
+            elif char == "`":
+                return index + 1
+            elif source.startswith("${", index):
+                _, index = self.items(index + 2, "}", "object")
+            else:
+                index += 1
+        raise self.error(position, "Unterminated template literal")
+
+    def regex(self, position: int) -> int:
+        source = self.source
+        index, in_class = position + 1, False
+        while index < len(source):
+            char = source[index]
+            if char == "\\":
+                index += 2
+                continue
+            if char == "\n":
+                break
+            if char == "[":
+                in_class = True
+            elif char == "]":
+                in_class = False
+            elif char == "/" and not in_class:
+                match = _IDENTIFIER.match(source, index + 1)
+                return match.end() if match else index + 1
+            index += 1
+        raise self.error(position, "Unterminated regular expression")
+
+    def element(self, position: int, newlines: int) -> tuple[_Element, int]:
+        """Parses the JSX element at position."""
+        source = self.source
+        position += 1
+        match = _JSX_NAME.match(source, position)
+        element = _Element(match.group() if match else "", newlines)
+        position = match.end() if match else position
+        while True:
+            position = _WHITESPACE.match(source, position).end()
+            if source.startswith("/>", position):
+                return element, position + 2
+            if source.startswith(">", position):
+                position += 1
+                break
+            if source.startswith("{", position):
+                items, position = self.items(position + 1, "}", "object")
+                element.attributes.append((None, _Expression(items)))
+                continue
+            match = _JSX_ATTRIBUTE.match(source, position)
+            if not match:
+                raise self.error(position, f"Invalid attribute of <{element.name}>")
+            name = match.group()
+            position = _WHITESPACE.match(source, match.end()).end()
+            value = None
+            if source.startswith("=", position):
+                position = _WHITESPACE.match(source, position + 1).end()
+                char = source[position : position + 1]
+                if char in ("'", '"'):
+                    end = source.find(char, position + 1)
+                    if end < 0:
+                        raise self.error(position, "Unterminated attribute")
+                    value, position = source[position : end + 1], end + 1
+                elif char == "{":
+                    items, position = self.items(position + 1, "}", "object")
+                    value = _Expression(items)
+                elif char == "<":
+                    value, position = self.element(position, 0)
+                else:
+                    raise self.error(position, f"Invalid value of {name}")
+            element.attributes.append((name, value))
+        element.children = []
+        while True:
+            if position >= len(source):
+                raise self.error(position, f"Unclosed <{element.name}>")
+            if source.startswith("</", position):
+                position = _WHITESPACE.match(source, position + 2).end()
+                match = _JSX_NAME.match(source, position)
+                name = match.group() if match else ""
+                position = _WHITESPACE.match(
+                    source, match.end() if match else position
+                ).end()
+                if name != element.name or not source.startswith(">", position):
+                    raise self.error(position, f"Mismatched </{name}>")
+                return element, position + 1
+            if source.startswith("<", position):
+                child, position = self.element(position, 0)
+                element.children.append(child)
+            elif source.startswith("{", position):
+                items, position = self.items(position + 1, "}", "object")
+                element.children.append(_Expression(items))
+            else:
+                ends = (source.find("<", position), source.find("{", position))
+                end = min((index for index in ends if index >= 0), default=len(source))
+                element.children.append(source[position:end])
+                position = end
+
+
+def _number(text: str) -> str:
+    """Returns a number literal printed as prettier prints it."""
+    if text[:2].lower() in ("0x", "0o", "0b") or text.endswith("n"):
+        return text.lower()
+    value = text.lower()
+    value = re.sub(r"^([+-]?[\d.]+e)(?:\+|(-))?0*(\d)", r"\1\2\3", value)
+    value = re.sub(r"^([+-]?[\d.]+)e[+-]?0+$", r"\1", value)
+    value = re.sub(r"^([+-])?\.", r"\g<1>0.", value)
+    value = re.sub(r"(\.\d+?)0+(?=e|$)", r"\1", value)
+    return re.sub(r"\.(?=e|$)", "", value)
+
+
+def _string(text: str) -> str:
+    """Returns a string literal quoted as prettier quotes it, preferring double quotes."""
+    content = text[1:-1]
+    quote = "'" if content.count('"') > content.count("'") else '"'
+    other = "'" if quote == '"' else '"'
+
+    def replace(match: re.Match) -> str:
+        escaped, char = match.group(1), match.group(2)
+        if escaped == other:
+            return escaped
+        if char == quote:
+            return "\\" + char
+        if char:
+            return char
+        if re.fullmatch(r"[^\n\r\"'0-7\\bfnrt-vx\u2028\u2029]", escaped):
+            return escaped
+        return "\\" + escaped
+
+    return quote + re.sub(r"\\(.)|([\"'])", replace, content, flags=re.S) + quote
+
+
+def _split(items: list, separator: str = ",") -> list[list]:
+    """Returns items split at separator tokens, without an empty last part."""
+    parts: list[list] = [[]]
+    for item in items:
+        if _is_punct(item, separator):
+            parts.append([])
+        else:
+            parts[-1].append(item)
+    if not parts[-1]:
+        parts.pop()
+    return parts
+
+
+class _Printer:
+    """Builds the document of parsed source."""
+
+    def program(self, items: list) -> Doc:
+        statements = self.statements(items, class_body=False)
+        return [statements, HARDLINE] if items else ""
+
+    # Statements
+
+    def statements(self, items: list, class_body: bool) -> Doc:
+        """Returns statements, one per line, blank lines between them kept once."""
+        statements: list[list[list]] = []
+        blank: list[bool] = []
+        for item in items:
+            if statements and not self.starts_statement(statements[-1][-1], item):
+                segments = statements[-1]
+                if item.newlines and self.breaks_line(item):
+                    segments.append([item])
+                else:
+                    segments[-1].append(item)
+                continue
+            blank.append(bool(statements) and item.newlines > 1)
+            statements.append([[item]])
+        docs: list = []
+        for index, segments in enumerate(statements):
+            if index:
+                docs.append(HARDLINE)
+                if blank[index]:
+                    docs.append(HARDLINE)
+            self.terminate(segments, class_body)
+            docs.append(self.sequence(segments[0]))
+            for segment in segments[1:]:
+                docs.append(Indent([HARDLINE, self.sequence(segment)]))
+        return docs
+
+    @staticmethod
+    def starts_statement(segment: list, item: object) -> bool:
+        """Whether item starts a statement after the statement ending in segment."""
+        last = segment[-1]
+        if _is_comment(item):
+            return item.newlines > 0
+        if isinstance(last, _Token):
+            if last.kind == _COMMENT or _is_punct(last, ";"):
+                return True
+        if _is_keyword(item, frozenset({"else", "catch", "finally"})):
+            return False
+        if isinstance(last, _Bracket) and last.kind == "block":
+            if not item.newlines and _is_keyword(item, frozenset({"while"})):
+                return False
+            return not _is_punct(item, ".", "?.", ",", ")", ";")
+        if not item.newlines:
+            return False
+        if isinstance(item, _Bracket) and item.kind in ("call", "index"):
+            return False
+        if isinstance(item, _Token):
+            if item.kind == _TEMPLATE:
+                return False
+            if item.kind == _PUNCT and item.text in _CONTINUATIONS:
+                return False
+        if _is_punct(last) and last.text not in ("++", "--"):
+            return False
+        if _is_keyword(last, frozenset({"return", "throw", "break", "continue"})):
+            return True
+        return not _is_keyword(last)
+
+    @staticmethod
+    def breaks_line(item: object) -> bool:
+        """Whether a continued statement keeps its line break before item."""
+        return _is_punct(item) and item.text in _CONTINUATIONS
+
+    @staticmethod
+    def terminate(segments: list[list], class_body: bool) -> None:
+        """Appends the semicolon a statement lacks."""
+        segment = segments[-1]
+        index = len(segment) - 1
+        while index >= 0 and _is_comment(segment[index]):
+            index -= 1
+        if index < 0:
+            return
+        last = segment[index]
+        if _is_punct(last, ";", ":"):
+            return
+        items = [item for part in segments for item in part]
+        while (
+            len(items) > 2
+            and isinstance(items[0], _Token)
+            and items[0].kind == _NAME
+            and _is_punct(items[1], ":")
+        ):
+            del items[:2]
+        modifiers = frozenset({"export", "default", "async"})
+        first = next((item for item in items if not _is_keyword(item, modifiers)), None)
+        if isinstance(last, _Bracket) and last.kind == "block":
+            if first is last or _is_keyword(first, _DECLARATION_KEYWORDS):
+                return
+            if class_body and _Printer.is_method(items):
+                return
+            if _is_keyword(first, frozenset({"else", "do"})):
+                return
+        elif (
+            _is_keyword(first, frozenset({"if", "for", "while", "with"}))
+            and len(items) == 2
+        ):
+            return
+        semicolon = _Token(_PUNCT, ";", 0)
+        segment.insert(index + 1, semicolon)
+
+    @staticmethod
+    def is_method(items: list) -> bool:
+        """Whether class member items define a method."""
+        index = 0
+        while index < len(items) and (
+            _is_keyword(items[index], _MEMBER_PREFIXES) or _is_punct(items[index], "*")
+        ):
+            index += 1
+        rest = items[index:]
+        return (
+            len(rest) == 3
+            and isinstance(rest[1], _Bracket)
+            and rest[1].open == "("
+            and isinstance(rest[2], _Bracket)
+            and rest[2].kind == "block"
+        )
+
+    # Expressions
+
+    def sequence(self, items: list, key: bool = False) -> list:
+        """Returns items spaced as prettier spaces them.
+
+        Args:
+            items: Items of an expression or statement.
+            key: Whether items are a property of an object, its key is unquoted if
+                possible.
+        """
+        docs: list = []
+        previous = None
+        ternaries = 0
+        class_body = False
+        for index, item in enumerate(items):
+            if _is_punct(item, "+", "-", "++", "--"):
+                item.prefix = not _is_operand(previous)
+            if previous is not None:
+                if isinstance(previous, _Token) and previous.kind == _COMMENT:
+                    docs.append(HARDLINE)
+                elif _is_punct(item, ":") and ternaries:
+                    ternaries -= 1
+                    docs.append(" ")
+                else:
+                    docs.append(self.separator(previous, item))
+            if _is_punct(item, "?"):
+                ternaries += 1
+            if _is_keyword(item, frozenset({"class"})):
+                class_body = True
+            if key and index == 0 and isinstance(item, _Token) and item.kind == _STRING:
+                unquoted = _ES5_IDENTIFIER.match(item.text[1:-1])
+                if unquoted and len(items) > 1 and _is_punct(items[1], ":"):
+                    docs.append(item.text[1:-1])
+                    previous = item
+                    continue
+            if isinstance(item, _Element) and (
+                _is_punct(previous, "=>")
+                or _is_keyword(previous, frozenset({"return"}))
+            ):
+                docs.append(self.wrapped_element(item))
+            elif isinstance(item, _Bracket) and item.kind == "block" and class_body:
+                docs.append(self.block(item, class_body=True))
+                class_body = False
+            elif (
+                isinstance(item, _Token)
+                and item.kind == _NAME
+                and index + 1 < len(items)
+                and _is_punct(items[index + 1], "=>")
+            ):
+                docs.append(["(", item.text, ")"])
+            else:
+                docs.append(self.item(item))
+            previous = item
+        return docs
+
+    @staticmethod
+    def separator(previous: object, item: object) -> str:
+        """Returns the space between two items."""
+        if isinstance(item, _Token) and item.kind == _PUNCT:
+            text = item.text
+            if text in (",", ";", ".", "?.", ":"):
+                return ""
+            if text in ("++", "--") and not item.prefix:
+                return ""
+        if isinstance(previous, _Token) and previous.kind == _PUNCT:
+            text = previous.text
+            if text in (".", "?.", "!", "~", "...", "#", "@"):
+                return ""
+            if text in ("+", "-", "++", "--") and previous.prefix:
+                return ""
+        if isinstance(item, _Bracket) and item.kind in ("call", "index"):
+            return " " if _is_keyword(previous, frozenset({"function"})) else ""
+        return " "
+
+    def item(self, item: object) -> Doc:
+        if isinstance(item, _Element):
+            return self.element(item)
+        if isinstance(item, _Bracket):
+            if item.kind == "block":
+                return self.block(item, class_body=False)
+            if item.kind == "object":
+                return self.object_literal(item)
+            if item.kind == "array":
+                return self.array(item)
+            if item.kind == "index":
+                return ["[", self.sequence(item.items), "]"]
+            return self.parens(item)
+        if item.kind == _STRING:
+            return _string(item.text)
+        return item.text
+
+    def block(self, bracket: _Bracket, class_body: bool) -> Doc:
+        if not bracket.items:
+            return "{}"
+        return [
+            "{",
+            Indent([HARDLINE, self.statements(bracket.items, class_body)]),
+            HARDLINE,
+            "}",
+        ]
+
+    def object_literal(self, bracket: _Bracket) -> Doc:
+        properties = [self.sequence(part, key=True) for part in _split(bracket.items)]
+        if not properties:
+            return "{}"
+        return Group(
+            [
+                "{",
+                Indent([LINE, join([",", LINE], properties)]),
+                IfBreak(","),
+                LINE,
+                "}",
+            ],
+            should_break=bracket.expanded,
+        )
+
+    def array(self, bracket: _Bracket) -> Doc:
+        elements = [self.sequence(part) for part in _split(bracket.items)]
+        if not elements:
+            return "[]"
+        elements = join([",", LINE], elements)
+        return Group(["[", Indent([SOFTLINE, elements]), IfBreak(","), SOFTLINE, "]"])
+
+    def parens(self, bracket: _Bracket) -> Doc:
+        items = bracket.items
+        if items and all(isinstance(item, _Element) for item in items):
+            if len(items) == 1:
+                return self.wrapped_element(items[0])
+            elements = join(HARDLINE, [self.element(item) for item in items])
+            return ["(", Indent([HARDLINE, elements]), HARDLINE, ")"]
+        if bracket.kind == "header":
+            return ["(", self.sequence(items), ")"]
+        arguments = _split(items)
+        if bracket.kind == "paren" and len(arguments) <= 1:
+            return ["(", self.sequence(items), ")"]
+        return self.arguments(arguments)
+
+    def arguments(self, arguments: list[list]) -> Doc:
+        """Returns call arguments, the last one hugged if it is a function or object."""
+        if not arguments:
+            return "()"
+        docs = [self.sequence(argument) for argument in arguments]
+        contents = ["(", Indent([SOFTLINE, join([",", LINE], docs)]), SOFTLINE, ")"]
+        if not self.huggable(arguments[-1]) or any(map(self.huggable, arguments[:-1])):
+            return Group(contents)
+        broken = Group(contents, should_break=True)
+        if any(will_break(doc) for doc in docs[:-1]):
+            return broken
+        hugged = [
+            "(",
+            join(", ", docs[:-1] + [Group(docs[-1], should_break=True)]),
+            ")",
+        ]
+        return [
+            BREAK_PARENT if will_break(docs[-1]) else "",
+            ConditionalGroup([["(", join(", ", docs), ")"], hugged, broken]),
+        ]
+
+    @staticmethod
+    def huggable(argument: list) -> bool:
+        """Whether an argument is an object, array or function, kept on the line of its call."""
+        if not argument:
+            return False
+        last = argument[-1]
+        if len(argument) == 1:
+            return (
+                isinstance(last, _Bracket)
+                and last.kind in ("object", "array")
+                and bool(last.items)
+            )
+        arrow = any(_is_punct(item, "=>") for item in argument)
+        if not isinstance(last, _Bracket) or last.kind not in (
+            "block",
+            "object",
+            "array",
+        ):
+            return isinstance(last, _Element) and arrow
+        return arrow or _is_keyword(argument[0], frozenset({"function"}))
+
+    # JSX
+
+    def wrapped_element(self, element: _Element) -> Doc:
+        """Returns element wrapped in parentheses if it breaks."""
+        printed = self.element(element)
+        return Group(
+            [IfBreak("("), Indent([SOFTLINE, printed]), SOFTLINE, IfBreak(")")]
+        )
+
+    def element(self, element: _Element) -> Doc:
+        """Returns a JSX element laid out as prettier lays it out."""
+        if element.children is None:
+            return self.opening(element, self_closing=True)
+        children = [
+            " " if isinstance(child, _Expression) and self.is_space(child) else child
+            for child in element.children
+        ]
+        opening = self.opening(element, self_closing=False)
+        closing = f"</{element.name}>"
+        if not children or (
+            len(children) == 1
+            and isinstance(children[0], str)
+            and not self.is_meaningful(children[0])
+        ):
+            return [opening, closing]
+        if (
+            len(children) == 1
+            and isinstance(children[0], _Expression)
+            and len(children[0].items) == 1
+            and isinstance(children[0].items[0], _Token)
+            and children[0].items[0].kind == _TEMPLATE
+        ):
+            return [opening, "{", children[0].items[0].text, "}", closing]
+        forced = (
+            will_break(opening)
+            or any(isinstance(child, _Element) for child in children)
+            or (element.name != "" and len(element.attributes) > 1)
+            or sum(isinstance(child, _Expression) for child in children) > 1
+        )
+        parts = self.children(children)
+        contains_text = any(
+            isinstance(child, str) and self.is_meaningful(child) for child in children
+        )
+        index = len(parts) - 2
+        while index >= 0:
+            part, following = parts[index], parts[index + 1]
+            after = parts[index + 2] if index + 2 < len(parts) else None
+            if (
+                (
+                    part is HARDLINE
+                    and following == ""
+                    and after is HARDLINE
+                    and contains_text
+                )
+                or (part == "" and following == "")
+                or (
+                    part in (HARDLINE, SOFTLINE)
+                    and following == ""
+                    and after is _JSX_WHITESPACE
+                )
+                or (
+                    part is _JSX_WHITESPACE
+                    and following == ""
+                    and after is _JSX_WHITESPACE
+                )
+            ):
+                del parts[index : index + 2]
+            elif following == "" and (
+                (part is _JSX_WHITESPACE and after in (HARDLINE, SOFTLINE))
+                or (part, after) in ((SOFTLINE, HARDLINE), (HARDLINE, SOFTLINE))
+            ):
+                del parts[index + 1 : index + 3]
+            index -= 1
+        while parts and self.is_separator(parts[-1]):
+            parts.pop()
+        while len(parts) > 1 and all(map(self.is_separator, parts[:2])):
+            del parts[:2]
+        multiline: list = []
+        for index, part in enumerate(parts):
+            if part is _JSX_WHITESPACE:
+                if index == 1 and parts[0] == "":
+                    if len(parts) == 2:
+                        multiline.append('{" "}')
+                    else:
+                        multiline.append(['{" "}', HARDLINE])
+                    continue
+                if index == len(parts) - 1 or (
+                    index > 1
+                    and parts[index - 1] == ""
+                    and parts[index - 2] is HARDLINE
+                ):
+                    multiline.append('{" "}')
+                    continue
+            multiline.append(part)
+            if will_break(part):
+                forced = True
+        broken = Group(
+            [opening, Indent([HARDLINE, Fill(multiline)]), HARDLINE, closing]
+        )
+        if forced:
+            return broken
+        return ConditionalGroup([Group([opening, Fill(parts), closing]), broken])
+
+    def children(self, children: list) -> list:
+        """Returns JSX children as fill parts, contents alternating with separators."""
+        parts: list = []
+        for index, child in enumerate(children):
+            following = children[index + 1] if index + 1 < len(children) else None
+            if isinstance(child, str):
+                if self.is_meaningful(child):
+                    words = _JSX_SPACE.split(child)
+                    if words[0] == "":
+                        parts.append("")
+                        words.pop(0)
+                        if "\n" in words[0]:
+                            parts.append(self.with_whitespace(words[1], child))
+                        else:
+                            parts.append(_JSX_WHITESPACE)
+                        words.pop(0)
+                    end = None
+                    if words[-1] == "":
+                        words.pop()
+                        end = words.pop() if words else None
+                    if not words:
+                        continue
+                    for position, word in enumerate(words):
+                        parts.append(LINE if position % 2 else word)
+                    if end is not None:
+                        if "\n" in end:
+                            parts.append(self.with_whitespace(parts[-1], child))
+                        else:
+                            parts.append(_JSX_WHITESPACE)
+                    else:
+                        parts.append(
+                            self.without_whitespace(parts[-1], child, following)
+                        )
+                elif "\n" in child:
+                    if child.count("\n") > 1:
+                        parts.extend(("", HARDLINE))
+                else:
+                    parts.extend(("", _JSX_WHITESPACE))
+            else:
+                if isinstance(child, _Element):
+                    parts.append(self.element(child))
+                else:
+                    parts.append(self.container(child, True))
+                if isinstance(following, str) and self.is_meaningful(following):
+                    first = _JSX_SPACE.split(following.strip(" \n\r\t"))[0]
+                    parts.append(self.without_whitespace(first, child, following))
+                else:
+                    parts.append(HARDLINE)
+        return parts
+
+    @staticmethod
+    def without_whitespace(word: str, child: object, following: object) -> Doc:
+        if (isinstance(child, _Element) and child.children is None) or (
+            isinstance(following, _Element) and following.children is None
+        ):
+            return SOFTLINE if len(word) == 1 else HARDLINE
+        return SOFTLINE
+
+    @staticmethod
+    def with_whitespace(word: object, child: str) -> Doc:
+        if isinstance(word, str) and len(word) == 1:
+            return HARDLINE if "\n" not in child else SOFTLINE
+        return HARDLINE
+
+    @staticmethod
+    def is_separator(part: Doc) -> bool:
+        return part == "" or part in (HARDLINE, SOFTLINE, LINE)
+
+    @staticmethod
+    def is_meaningful(text: str) -> bool:
+        return bool(text.strip(" \n\r\t")) or "\n" not in text
+
+    @staticmethod
+    def is_space(expression: _Expression) -> bool:
+        items = expression.items
+        return (
+            len(items) == 1
+            and isinstance(items[0], _Token)
+            and items[0].kind == _STRING
+            and items[0].text[1:-1].strip(" ") == ""
+            and items[0].text[1:-1] != ""
+        )
+
+    def opening(self, element: _Element, self_closing: bool) -> Doc:
+        """Returns the opening tag of a JSX element."""
+        name = element.name
+        attributes = element.attributes
+        if not attributes:
+            return f"<{name} />" if self_closing else f"<{name}>"
+        key, value = attributes[0]
+        if len(attributes) == 1 and isinstance(value, str) and "\n" not in value:
+            attribute = self.attribute(key, value)
+            return Group(["<", name, " ", attribute, " />" if self_closing else ">"])
+        should_break = any(
+            isinstance(value, str) and "\n" in value for _, value in attributes
+        )
+        docs = [[LINE, self.attribute(key, value)] for key, value in attributes]
+        return Group(
+            ["<", name, Indent(docs)]
+            + ([LINE, "/>"] if self_closing else [SOFTLINE, ">"]),
+            should_break=should_break,
+        )
+
+    def attribute(self, key: Optional[str], value: object) -> Doc:
+        if key is None:
+            return self.container(value, False)
+        if value is None:
+            return key
+        if isinstance(value, str):
+            content = value[1:-1].replace("&apos;", "'").replace("&quot;", '"')
+            quote = "'" if content.count('"') > content.count("'") else '"'
+            escaped = "&quot;" if quote == '"' else "&apos;"
+            return [key, "=", quote, content.replace(quote, escaped), quote]
+        if isinstance(value, _Element):
+            return [key, "=", self.element(value)]
+        return [key, "=", self.container(value, False)]
+
+    def container(self, expression: _Expression, child: bool) -> Doc:
+        """Returns a JSX expression container, hugging objects, functions and calls."""
+        items = expression.items
+        printed = self.sequence(items)
+        if not items or self.inline(items, child):
+            return Group(["{", printed, "}"])
+        return Group(["{", Indent([SOFTLINE, printed]), SOFTLINE, "}"])
+
+    @staticmethod
+    def inline(items: list, child: bool) -> bool:
+        first, last = items[0], items[-1]
+        if _is_comment(first):
+            return True
+        if len(items) == 1:
+            if isinstance(first, _Bracket) and first.kind in ("object", "array"):
+                return True
+            if isinstance(first, _Token) and first.kind == _TEMPLATE:
+                return True
+        if _is_keyword(first, frozenset({"function"})):
+            return True
+        if any(_is_punct(item, "=>") for item in items):
+            return True
+        operators = [
+            item for item in items if _is_punct(item) and item.text in _BINARY | {"?"}
+        ]
+        if child and operators:
+            return True
+        if isinstance(last, _Token) and last.kind == _TEMPLATE and len(items) == 2:
+            return True
+        return (
+            isinstance(last, _Bracket)
+            and last.kind == "call"
+            and not operators
+            and not _is_keyword(first, frozenset({"new"}))
+        )
+
+
+def format_source(source: str, width: int = WIDTH) -> str:
+    """Returns JavaScript source formatted as prettier formats it.
+
+    Args:
+        source: Source of a screen, JSX included.
+        width: Maximum width of lines.
+
+    Raises:
+        FormatError: If the source can not be parsed.
+    """
+    try:
+        items, _ = _Parser(source).items(0, None, "block")
+        return print_doc(_Printer().program(items), width)
+    except RecursionError as error:
+        raise FormatError("Source is nested too deeply to format.") from error
@@ -0,0 +1,452 @@
+"""Provides a persistent, content addressed cache of component renditions.
+
+Renditions are stored on disk under a structural hash of the component, made up of its
+class, names, attributes, the hashes of its children, the settings affecting output and
+the sweetpotato version, and of the code of component classes defined outside sweetpotato.
+Unchanged top-level children of screens are then served from disk across processes
+instead of being rendered again. A :class:`MemoryRenderCache` keeps them in
+memory too, shared by the builds of one process.
+
+Example:
+    cache = RenderCache()
+    children = cache.render(screen._children)
+    cache.stream(screen._children, file)
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import types
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from sweetpotato.config import settings
+from sweetpotato.config.version import __version__
+from sweetpotato.core.base_management import Function, Props, State
+from sweetpotato.core.protocols import ComponentVar
+from sweetpotato.core.renderer import Renderer, Sink
+from sweetpotato.core.tracking import LazyChildren
+
+KEY_SETTINGS: tuple[str, ...] = (
+    "APP_COMPONENT",
+    "APP_REPR",
+    "APP_REPR_FUNCTIONAL_DEFAULT",
+    "HOIST_STYLES",
+    "SOURCE_FOLDER",
+    "USE_AUTHENTICATION",
+    "USE_NAVIGATION",
+    "USE_UI_KITTEN",
+)  #: Settings included in every cache key.
+STABLE_TYPES: frozenset[type] = frozenset(
+    {str, int, float, bool, type(None), Function}
+)  #: Types whose repr is the same in every process, those of containers aside.
+_class_digests: dict[
+    type, str
+] = {}  #: Digests of component classes, see `_class_digest`.
+
+
+def structural_hash(component: ComponentVar) -> tuple[str, int]:
+    """Returns the structural hash of a component and the size of its subtree.
+
+    Hashes are memoized on components and discarded along with their renditions.
+
+    Args:
+        component: Component to hash.
+
+    Returns:
+        Hex digest of component and number of components in its subtree.
+
+    Raises:
+        ValueError: If the subtree has lazy children, which are never cached, or values
+            whose repr is not stable, see :func:`describe`.
+    """
+    if component._hash_cache is not None:
+        return component._hash_cache
+    stack = [(component, False)]
+    while stack:
+        node, visited = stack.pop()
+        if node._hash_cache is not None:
+            continue
+        children = node._children if node.is_composite else ()
+        if children.__class__ is LazyChildren:
+            raise ValueError("Components with lazy children can not be hashed.")
+        if not visited:
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children))
+            continue
+        digest = hashlib.sha256(describe(node).encode("utf-8"))
+        size = 1
+        for child in children:
+            child_digest, child_size = child._hash_cache
+            digest.update(child_digest.encode("ascii"))
+            size += child_size
+        node._hash_cache = (digest.hexdigest(), size)
+    return component._hash_cache
+
+
+def describe(component: ComponentVar) -> str:
+    """Returns a stable description of what a component renders by itself.
+
+    Args:
+        component: Component to describe.
+
+    Returns:
+        Class, names, attributes and, for leaves, inner content of component.
+
+    Raises:
+        ValueError: If an attribute or the inner content is not of a type in
+            `STABLE_TYPES`, or a dict, list or tuple of them, whose repr may embed a
+            memory address and differ between processes.
+    """
+    # pylint: disable=protected-access
+    if Renderer._has_custom_repr(component.__class__):
+        return f"{component.__class__.__qualname__}:{component!r}"
+    attrs = []
+    for key, value in component._attrs.items():
+        if isinstance(value, (State, Props)):
+            value = f"{value.type}.{','.join(value.values)}"
+        attrs.append(f"{key}={value.__class__.__name__}:{_stable_repr(value)}")
+    children = component._children
+    children = "" if isinstance(children, (list, tuple)) else _stable_repr(children)
+    return "\x1f".join(
+        (
+            f"{component.__class__.__module__}.{component.__class__.__qualname__}",
+            _class_digest(component.__class__),
+            str(component.component_name),
+            str(component.import_name),
+            str(component.is_composite),
+            *attrs,
+            children,
+        )
+    )
+
+
+def _class_digest(component_class: type) -> str:
+    """Returns a digest of the code of a component class and of its bases.
+
+    Classes of sweetpotato are covered by its version and left out, so that editing the
+    rendering code of an app's own component class changes the keys of its components.
+    Digests are memoized by class, re-imported classes are new ones.
+    """
+    try:
+        return _class_digests[component_class]
+    except KeyError:
+        pass
+    digest = hashlib.sha256()
+    for base in component_class.__mro__:
+        if (
+            base.__module__ == "builtins"
+            or base.__module__.partition(".")[0] == "sweetpotato"
+        ):
+            continue
+        digest.update(f"{base.__module__}.{base.__qualname__}\0".encode("utf-8"))
+        for name, value in sorted(vars(base).items()):
+            digest.update(f"{name}\0".encode("utf-8"))
+            if isinstance(value, (staticmethod, classmethod)):
+                value = value.__func__
+            functions = (
+                (value.fget, value.fset) if isinstance(value, property) else (value,)
+            )
+            for function in functions:
+                if isinstance(function, types.FunctionType):
+                    _code_digest(function.__code__, digest)
+                elif function is not None:
+                    try:
+                        digest.update(_stable_repr(function).encode("utf-8"))
+                    except ValueError:
+                        digest.update(function.__class__.__qualname__.encode("utf-8"))
+    _class_digests[component_class] = digest.hexdigest()
+    return _class_digests[component_class]
+
+
+def _code_digest(code: types.CodeType, digest: "hashlib._Hash") -> None:
+    """Updates a digest with the bytecode, names and constants of code and nested code."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            _code_digest(constant, digest)
+        elif isinstance(constant, frozenset):
+            digest.update(repr(sorted(map(repr, constant))).encode("utf-8"))
+        else:
+            digest.update(repr(constant).encode("utf-8"))
+
+
+def _stable_repr(value: object) -> str:
+    """Returns the repr of a value, if it is the same in every process.
+
+    Raises:
+        ValueError: If value, or a value it holds, is not of a type in `STABLE_TYPES`.
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        item_type = item.__class__
+        if item_type in STABLE_TYPES:
+            continue
+        if isinstance(item, dict) and item_type.__repr__ is dict.__repr__:
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)) and item_type.__repr__ in (
+            list.__repr__,
+            tuple.__repr__,
+        ):
+            stack.extend(item)
+        else:
+            raise ValueError(
+                f"Values of type {item_type.__qualname__} can not be hashed."
+            )
+    return repr(value)
+
+
+class _Tee:
+    """Sink writing fragments through to another sink and keeping them."""
+
+    __slots__ = ("fragments", "_write")
+
+    def __init__(self, write: Callable[[str], object]) -> None:
+        self.fragments: list[str] = []
+        self._write = write
+
+    def write(self, fragment: str) -> None:
+        self._write(fragment)
+        self.fragments.append(fragment)
+
+
+class RenderCache:
+    """Content addressed on-disk cache of component renditions with LRU eviction.
+
+    Entries are files named after their key, reads refresh their modification time and
+    the least recently used entries are evicted once the cache outgrows its size bound.
+
+    Args:
+        directory: Cache directory, defaults to `settings.RENDER_CACHE_FOLDER` in the
+            working directory.
+        max_bytes: Size bound of cache, defaults to `settings.RENDER_CACHE_MAX_BYTES`.
+
+    Attributes:
+        directory: Cache directory.
+        max_bytes: Size bound of cache.
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, max_bytes: Optional[int] = None
+    ) -> None:
+        self.directory = Path(
+            directory if directory else Path.cwd() / settings.RENDER_CACHE_FOLDER
+        )
+        self.max_bytes = max_bytes if max_bytes else settings.RENDER_CACHE_MAX_BYTES
+        self._size = None
+        self._settings_key = None
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether the cache is enabled, `--no-cache` on the command line disables it."""
+        return settings.USE_RENDER_CACHE and "--no-cache" not in sys.argv
+
+    def key(self, component: ComponentVar) -> str:
+        """Returns cache key of a component.
+
+        Args:
+            component: Component to key.
+
+        Returns:
+            Hex digest of component, settings and sweetpotato version.
+        """
+        if self._settings_key is None:
+            values = [__version__, *(repr(getattr(settings, k)) for k in KEY_SETTINGS)]
+            self._settings_key = "\x1f".join(values)
+        digest = hashlib.sha256(self._settings_key.encode("utf-8"))
+        digest.update(structural_hash(component)[0].encode("ascii"))
+        return digest.hexdigest()
+
+    def refresh(self) -> None:
+        """Recomputes the settings part of keys, to be called after settings changed."""
+        self._settings_key = None
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns cached rendition, if any, marking it as recently used.
+
+        Args:
+            key: Cache key.
+        """
+        path = self._path(key)
+        try:
+            rendition = path.read_text(encoding="utf-8")
+            os.utime(path)
+        except OSError:
+            return None
+        return rendition
+
+    def put(self, key: str, rendition: str) -> None:
+        """Stores a rendition, evicting least recently used entries if necessary.
+
+        Args:
+            key: Cache key.
+            rendition: Rendition to store.
+        """
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, delete=False
+        ) as file:
+            file.write(rendition)
+        os.replace(file.name, path)
+        if self._size is None:
+            self._size = sum(entry.stat().st_size for entry in self._entries())
+        else:
+            self._size += path.stat().st_size
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def evict(self) -> None:
+        """Removes least recently used entries until the cache is within 90% of its bound."""
+        entries = sorted(
+            ((entry.stat(), entry) for entry in self._entries()),
+            key=lambda item: item[0].st_mtime_ns,
+        )
+        self._size = sum(stat.st_size for stat, _ in entries)
+        for stat, entry in entries:
+            if self._size <= 0.9 * self.max_bytes:
+                break
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+            self._size -= stat.st_size
+
+    def clear(self) -> None:
+        """Removes every entry from the cache."""
+        for entry in list(self._entries()):
+            Path(entry.path).unlink(missing_ok=True)
+        self._size = 0
+
+    def render(self, children: Iterable[ComponentVar]) -> str:
+        """Renders child components, serving unchanged subtrees from the cache.
+
+        Args:
+            children: Child components.
+
+        Returns:
+            Concatenated rendition of child components, see :meth:`stream`.
+        """
+        buffer: list[str] = []
+        self.stream(children, buffer)
+        return "".join(buffer)
+
+    def stream(self, children: Iterable[ComponentVar], sink: Sink) -> None:
+        """Writes child components to a sink, serving unchanged subtrees from the cache.
+
+        Each child is looked up, on a miss it is streamed to the sink fragment by
+        fragment and stored afterwards. Descendants are not stored on their own, which
+        would cost the size of the subtree times its depth. Children holding values
+        that can not be hashed are streamed without the cache.
+
+        Args:
+            children: Child components.
+            sink: Sink written to, see :class:`~sweetpotato.core.renderer.Renderer`.
+        """
+        renderer = Renderer(sink)
+        write = sink.append if isinstance(sink, list) else sink.write
+        for child in children:
+            try:
+                key = self.key(child)
+            except ValueError:
+                renderer.render(child)
+                continue
+            rendition = self.get(key)
+            if rendition is not None:
+                if child._render_cache is None:
+                    child._render_cache = rendition
+                write(rendition)
+                continue
+            tee = _Tee(write)
+            Renderer(tee).render(child)
+            self.put(key, "".join(tee.fragments))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key[2:]
+
+    def _entries(self) -> Iterable[os.DirEntry]:
+        if not self.directory.is_dir():
+            return
+        for folder in os.scandir(self.directory):
+            if folder.is_dir():
+                for entry in os.scandir(folder.path):
+                    if entry.is_file() and not entry.name.startswith("tmp"):
+                        yield entry
+
+
+class MemoryRenderCache(RenderCache):
+    """Render cache holding renditions in memory, in front of the disk cache.
+
+    Lets the builds of one process, like the variants of a batch build, share
+    renditions without reading them from disk again. The least recently used
+    renditions are dropped once those in memory outgrow the size bound.
+
+    Args:
+        directory: Cache directory, see :class:`RenderCache`.
+        max_bytes: Size bound of cache, in memory and on disk.
+        disk: Whether renditions are read from and stored on disk too.
+
+    Attributes:
+        disk: Whether renditions are read from and stored on disk too.
+        hits: Number of renditions served from memory.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        disk: bool = True,
+    ) -> None:
+        super().__init__(directory, max_bytes)
+        self.disk = disk
+        self.hits = 0
+        self._renditions: dict[str, str] = {}
+        self._memory_bytes = 0
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns cached rendition, if any, from memory or else from disk.
+
+        Args:
+            key: Cache key.
+        """
+        rendition = self._renditions.pop(key, None)
+        if rendition is not None:
+            self._renditions[key] = rendition
+            self.hits += 1
+            return rendition
+        if self.disk:
+            rendition = super().get(key)
+            if rendition is not None:
+                self._remember(key, rendition)
+        return rendition
+
+    def put(self, key: str, rendition: str) -> None:
+        """Stores a rendition in memory and, with `disk`, on disk.
+
+        Args:
+            key: Cache key.
+            rendition: Rendition to store.
+        """
+        self._remember(key, rendition)
+        if self.disk:
+            super().put(key, rendition)
+
+    def clear(self) -> None:
+        """Removes every entry from memory and, with `disk`, from disk."""
+        self._renditions.clear()
+        self._memory_bytes = 0
+        if self.disk:
+            super().clear()
+
+    def _remember(self, key: str, rendition: str) -> None:
+        previous = self._renditions.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._renditions[key] = rendition
+        self._memory_bytes += len(rendition)
+        while self._memory_bytes > self.max_bytes and len(self._renditions) > 1:
+            oldest = next(iter(self._renditions))
+            self._memory_bytes -= len(self._renditions.pop(oldest))
@@ -0,0 +1,188 @@
+"""Provides single pass rendering of component trees.
+
+Components describe their .js rendition as a sequence of parts, either string fragments
+or child components, through `_render_parts`. The :class:`Renderer` walks those parts
+once with an explicit stack and writes every fragment straight to a sink, so nested
+components are never joined into intermediate strings and tree depth is not limited
+by the recursion limit.
+
+Memoizing renderers additionally cache the rendition of each component, see
+:meth:`Renderer.rendition`, so that unchanged subtrees are not rendered again.
+
+Example:
+    with open("App.js", "w", encoding="utf-8") as file:
+        Renderer(file).render(component)
+"""
+import io
+from typing import Iterable, Optional, Union
+
+from sweetpotato.core.protocols import ComponentVar
+from sweetpotato.core.tracking import LazyChildren
+from sweetpotato.core.traversal import unfold
+
+Sink = Union[io.TextIOBase, list[str]]
+
+
+class Renderer:
+    """Streams the .js rendition of components into a sink.
+
+    Streaming renderers reuse memoized renditions but do not create them, keeping memory
+    bounded by the output sink.
+
+    Args:
+        sink: Object with a `write` method (`io.StringIO`, an open file) or a list buffer.
+        memoize: Whether to memoize the renditions of rendered components.
+
+    Example:
+        buffer = []
+        Renderer(buffer).render(component)
+    """
+
+    memo_length: int = 4096  #: Renditions up to this length are always memoized.
+    _custom_repr: dict[type, bool] = {}  #: Cache of classes overriding `__repr__`.
+
+    def __init__(self, sink: Sink, memoize: bool = False) -> None:
+        self._write = sink.append if isinstance(sink, list) else sink.write
+        self._memoize = memoize
+
+    def render(self, component: ComponentVar) -> None:
+        """Writes the rendition of a component and its descendants to the sink.
+
+        Args:
+            component: Component to render.
+        """
+        self.render_children((component,))
+
+    def render_children(self, children: Iterable[ComponentVar]) -> None:
+        """Writes the rendition of each child component to the sink, in order.
+
+        Args:
+            children: Child components.
+        """
+        write = self._write
+        if self._memoize:
+            for child in children:
+                write(self.rendition(child))
+            return
+        for fragment in unfold(children, self._expand):
+            write(fragment)
+
+    def render_parts(self, component: ComponentVar) -> None:
+        """Writes the parts of a component to the sink, ignoring its own `__repr__`.
+
+        Lets the `__repr__` of a component class extend the rendition of its base,
+        descendants are rendered as usual.
+
+        Args:
+            component: Component to render.
+        """
+        write = self._write
+        for fragment in unfold(component._cached_render_parts(), self._expand):
+            write(fragment)
+
+    @classmethod
+    def rendition(cls, component: ComponentVar) -> str:
+        """Returns the rendition of a component, memoizing it and its descendants.
+
+        Components with a current memoized rendition are not descended. A rendition is
+        memoized if it is short or at least twice as long as its longest child rendition,
+        so chains of thin wrappers do not keep copies of the same long string. Components
+        with lazy children, and their ancestors, are not memoized.
+
+        Args:
+            component: Component to render.
+
+        Returns:
+            Rendition of component.
+        """
+        if component._render_cache is not None:
+            return component._render_cache
+        if cls._has_custom_repr(component.__class__):
+            return repr(component)
+        buffer = []
+        # Frames hold component, parts, buffer offset, rendition length, longest child
+        # and whether lazy children were rendered.
+        lazy = component._children.__class__ is LazyChildren
+        stack = [[component, iter(component._cached_render_parts()), 0, 0, 0, lazy]]
+        while stack:
+            frame = stack[-1]
+            for part in frame[1]:
+                if part.__class__ is str:
+                    buffer.append(part)
+                    frame[3] += len(part)
+                    continue
+                rendition = part._render_cache
+                if rendition is None and cls._has_custom_repr(part.__class__):
+                    rendition = repr(part)
+                if rendition is None:
+                    parts = iter(part._cached_render_parts())
+                    lazy = part._children.__class__ is LazyChildren
+                    stack.append([part, parts, len(buffer), 0, 0, lazy])
+                    break
+                buffer.append(rendition)
+                frame[3] += len(rendition)
+                frame[4] = max(frame[4], len(rendition))
+            else:
+                node, _, offset, length, longest, lazy = stack.pop()
+                if not lazy and (length <= cls.memo_length or length >= 2 * longest):
+                    rendition = "".join(buffer[offset:])
+                    buffer[offset:] = (rendition,)
+                    node._render_cache = rendition
+                if stack:
+                    stack[-1][3] += length
+                    stack[-1][4] = max(stack[-1][4], length)
+                    stack[-1][5] = stack[-1][5] or lazy
+        return buffer[0] if len(buffer) == 1 else "".join(buffer)
+
+    @classmethod
+    def _expand(cls, component: ComponentVar) -> Iterable[Union[str, ComponentVar]]:
+        """Returns the parts of a component, see :func:`sweetpotato.core.traversal.unfold`."""
+        if component._render_cache is not None:
+            return (component._render_cache,)
+        if cls._has_custom_repr(component.__class__):
+            return (repr(component),)
+        return component._cached_render_parts()
+
+    @classmethod
+    def _has_custom_repr(cls, component_class: type) -> bool:
+        """Checks whether a component class renders itself through its own `__repr__`.
+
+        Custom components written before `_render_parts` existed are rendered opaquely.
+        """
+        try:
+            return cls._custom_repr[component_class]
+        except KeyError:
+            # pylint: disable=import-outside-toplevel
+            from sweetpotato.core.base import Component
+
+            custom = component_class.__repr__ is not Component.__repr__
+            cls._custom_repr[component_class] = custom
+            return custom
+
+
+def render(component: ComponentVar, sink: Optional[Sink] = None) -> Optional[str]:
+    """Renders a component, either streamed into the given sink or as a memoized string.
+
+    Args:
+        component: Component to render.
+        sink: Optional sink, see :class:`Renderer`.
+
+    Returns:
+        Rendition of component if no sink was given.
+    """
+    if sink is not None:
+        Renderer(sink).render(component)
+        return None
+    return Renderer.rendition(component)
+
+
+def render_children(children: Iterable[ComponentVar]) -> str:
+    """Renders child components as a single string, memoizing their renditions.
+
+    Args:
+        children: Child components.
+
+    Returns:
+        Concatenated rendition of child components.
+    """
+    return "".join(map(Renderer.rendition, children))
@@ -0,0 +1,140 @@
+"""Provides hoisting of inline style dicts into a `StyleSheet.create` constant per screen.
+
+Written inline, `style={{...}}` allocates a new style object on every render of every
+component. With `settings.HOIST_STYLES` enabled, style dicts are instead referenced by
+name, `style={styles.s5f0c...}`, and every screen file declares the styles its
+components use once:
+
+    const styles = StyleSheet.create({
+        s5f0c...: {"flex": 1},
+    });
+
+Names are derived from the content of a style, so identical styles share one entry,
+and renditions do not depend on the screen they are written to.
+
+Lists of styles are flattened into one static style at build time, rather than being
+flattened by React Native on every render, see :func:`flatten`.
+
+Example:
+    name = style_name({"flex": 1})
+    sheet = declare([{"flex": 1}, {"flex": 1}])
+    row = flatten([base, {"marginTop": 4}])
+"""
+import hashlib
+import json
+from typing import Any, Iterable, Optional, Union
+
+from sweetpotato.config import settings
+
+SHEET: str = "styles"  #: Name of the style sheet constant declared in screen files.
+PACKAGE: str = "react-native"  #: Package `StyleSheet` is imported from.
+MEMO_SIZE: int = 4096  #: Flattened styles memoized before the memo is cleared.
+
+Style = Union[
+    dict, list, tuple, None, bool
+]  #: Style dict, or possibly nested list of them.
+
+_flattened: dict[tuple[int, ...], tuple[tuple, dict]] = {}
+
+
+def flatten(style: Style) -> dict:
+    """Returns a style, or list of styles, merged into one style, like `StyleSheet.flatten`.
+
+    Later styles take precedence, nested lists are flattened and falsy entries skipped.
+    Results are memoized by the identities of the listed styles, which are treated as
+    immutable, so repeated compositions of the same styles return the same dict.
+
+    Args:
+        style: Style dict, or possibly nested list of style dicts.
+
+    Returns:
+        Merged style, shared between calls with the same styles.
+
+    Raises:
+        TypeError: If a style is neither a dict nor a list.
+    """
+    if isinstance(style, dict):
+        return style
+    if not style:
+        return {}
+    if not isinstance(style, (list, tuple)):
+        raise TypeError(f"{style!r} is not a style.")
+    styles = tuple(style)
+    key = tuple(map(id, styles))
+    memoized = _flattened.get(key)
+    if memoized is not None and all(a is b for a, b in zip(memoized[0], styles)):
+        return memoized[1]
+    merged = {}
+    for item in styles:
+        merged.update(flatten(item))
+    if len(_flattened) >= MEMO_SIZE:
+        _flattened.clear()
+    _flattened[key] = (styles, merged)
+    return merged
+
+
+def compose(style1: Style, style2: Style) -> dict:
+    """Returns two styles merged into one, the second taking precedence, see :func:`flatten`."""
+    return flatten((style1, style2))
+
+
+def style_name(style: dict) -> Optional[str]:
+    """Returns the name of a style in style sheets, derived from its content.
+
+    Args:
+        style: Style dict.
+
+    Returns:
+        Name of style, `None` if it holds values that can not be written as JSON.
+    """
+    try:
+        source = json.dumps(style, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return f"s{hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]}"
+
+
+def hoisted_style(value: Any) -> Optional[dict]:
+    """Returns the style a `style` attribute is declared as, if it is to be hoisted.
+
+    Args:
+        value: Value of attribute, lists of styles are flattened.
+    """
+    if not settings.HOIST_STYLES:
+        return None
+    if isinstance(value, (list, tuple)):
+        value = flatten(value)
+    if not isinstance(value, dict) or style_name(value) is None:
+        return None
+    return value
+
+
+def hoisted_name(key: str, value: Any) -> Optional[str]:
+    """Returns the style sheet name of an attribute, if it is a style to be hoisted.
+
+    Args:
+        key: Name of attribute.
+        value: Value of attribute.
+    """
+    style = hoisted_style(value) if key == "style" else None
+    return None if style is None else style_name(style)
+
+
+def declare(styles: Iterable[dict]) -> str:
+    """Returns the declaration of a style sheet holding each distinct style once.
+
+    Args:
+        styles: Style dicts, in document order.
+
+    Returns:
+        `StyleSheet.create` constant, empty if there are no styles.
+    """
+    entries = {}
+    for style in styles:
+        name = style_name(style)
+        if name is not None and name not in entries:
+            entries[name] = f"    {name}: {json.dumps(style)},"
+    if not entries:
+        return ""
+    body = "\n".join(entries.values())
+    return f"const {SHEET} = StyleSheet.create({{\n{body}\n}});"
@@ -0,0 +1,83 @@
+"""Provides compiled .js templates of screens.
+
+Templates such as `settings.APP_REPR` are parsed once into literal segments and
+placeholder slots, then filled in a single pass. Placeholders are only looked for in the
+template itself, so values containing `<CHILDREN>` or `<STATE>` are written verbatim.
+
+Example:
+    template = compile_template(settings.APP_REPR)
+    js = template.fill({"NAME": "App", "STATE": "{}", ...})
+"""
+import re
+from functools import lru_cache
+from typing import Any, Iterator, Mapping
+
+SLOTS: tuple[str, ...] = (
+    "NAME",
+    "STATE",
+    "VARIABLES",
+    "FUNCTIONS",
+    "CHILDREN",
+    "IMPORTS",
+    "PACKAGE",
+    "FUNCTIONAL",
+    "PROPS",
+)  #: Placeholders filled in by :class:`Template`, written as `<NAME>` in templates.
+
+_PLACEHOLDER = re.compile(f"<({'|'.join(SLOTS)})>")
+
+
+class Template:
+    """Template parsed into literal segments and placeholder slots.
+
+    Args:
+        source: Template string with `<SLOT>` placeholders.
+        exported: Whether the component is the default export, otherwise `default` is
+            removed from the template text.
+
+    Attributes:
+        segments: Literal segments, one more than there are slots.
+        slots: Names of placeholders between segments.
+    """
+
+    def __init__(self, source: str, exported: bool = True) -> None:
+        parts = _PLACEHOLDER.split(source)
+        segments = parts[::2]
+        if not exported:
+            segments = [segment.replace("default", "") for segment in segments]
+        self.segments: tuple[str, ...] = tuple(segments)
+        self.slots: tuple[str, ...] = tuple(parts[1::2])
+
+    def parts(self, values: Mapping[str, Any]) -> Iterator[Any]:
+        """Yields literal segments and slot values in order, skipping empty segments.
+
+        Args:
+            values: Values by slot name, slots without a value are left as placeholders.
+        """
+        segments = iter(self.segments)
+        for slot in self.slots:
+            segment = next(segments)
+            if segment:
+                yield segment
+            yield values[slot] if slot in values else f"<{slot}>"
+        if self.segments[-1]:
+            yield self.segments[-1]
+
+    def fill(self, values: Mapping[str, Any]) -> str:
+        """Returns template with slots replaced by their values.
+
+        Args:
+            values: Values by slot name, converted with `str`.
+        """
+        return "".join(map(str, self.parts(values)))
+
+
+@lru_cache(maxsize=None)
+def compile_template(source: str, exported: bool = True) -> Template:
+    """Returns compiled template, cached per template string.
+
+    Args:
+        source: Template string with `<SLOT>` placeholders.
+        exported: Whether the component is the default export.
+    """
+    return Template(source, exported)
@@ -0,0 +1,174 @@
+"""Provides toolchain detection, locating the JS tools builds run on `PATH`.
+
+Tools are only looked up by the steps running them, so rendering and writing an app
+never search `PATH`. Lookups are cached on disk, keyed on `PATH`: a cached tool is
+valid while its binary keeps its modification time and the directories of `PATH` before
+the one holding it keep theirs, as installing a binary modifies its directory, a tool
+that was not found while every directory of `PATH` keeps its modification time. Tools
+missing from the cache are looked up in parallel.
+
+The `_access_check` and `which` functions are essentially copies from
+https://github.com/cookiecutter/whichcraft/blob/master/whichcraft.py#L20.
+
+Example:
+    paths = Toolchain().resolve(["npm", "expo"])
+"""
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+from sweetpotato.config import settings
+
+
+def _access_check(file: str, mode: int) -> bool:
+    return os.path.exists(file) and os.access(file, mode) and not os.path.isdir(file)
+
+
+def which(
+    cmd: str, mode: int = os.F_OK | os.X_OK, path: Optional[str] = None
+) -> Optional[str]:
+    """Returns the path of a command on `PATH`, `None` if it is not found.
+
+    Args:
+        cmd: Name or path of command.
+        mode: Access the file must allow.
+        path: Directories to search, `PATH` by default.
+    """
+    if os.path.dirname(cmd):
+        if _access_check(cmd, mode):
+            return cmd
+        return None
+    if path is None:
+        path = os.environ.get("PATH", os.defpath)
+    if not path:
+        return None
+    path = path.split(os.pathsep)
+    if sys.platform == "win32":
+        if os.curdir not in path:
+            path.insert(0, os.curdir)
+        pathext = os.environ.get("PATHEXT", "").split(os.pathsep)
+        if any(cmd.lower().endswith(ext.lower()) for ext in pathext):
+            files = [cmd]
+        else:
+            files = [cmd + ext for ext in pathext]
+    else:
+        files = [cmd]
+    seen = set()
+    for directory in path:
+        norm_dir = os.path.normcase(directory)
+        if norm_dir not in seen:
+            seen.add(norm_dir)
+            for file in files:
+                name = os.path.join(directory, file)
+                if _access_check(name, mode):
+                    return name
+    return None
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class Toolchain:
+    """Paths of JS tools, looked up on `PATH` and cached on disk.
+
+    Args:
+        path: Cache file, `toolchain.json` in `settings.RENDER_CACHE_FOLDER` of the
+            working directory by default.
+
+    Attributes:
+        path: Cache file.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None) -> None:
+        self.path = Path(
+            path
+            if path
+            else Path.cwd() / settings.RENDER_CACHE_FOLDER / "toolchain.json"
+        )
+
+    def resolve(self, tools: Iterable[str]) -> dict[str, Optional[str]]:
+        """Returns the path of each tool, `None` for tools that are not installed.
+
+        Args:
+            tools: Names of tools.
+        """
+        search_path = os.environ.get("PATH", os.defpath)
+        entries = self._load(search_path)
+        directories = self._directories(search_path)
+        paths: dict[str, Optional[str]] = {}
+        for tool in dict.fromkeys(tools):
+            entry = entries.get(tool)
+            if (
+                entry is not None
+                and directories[: len(entry["directories"])] == entry["directories"]
+                and (entry["path"] is None or _mtime(entry["path"]) == entry["mtime"])
+            ):
+                paths[tool] = entry["path"]
+        missing = [tool for tool in dict.fromkeys(tools) if tool not in paths]
+        if not missing:
+            return paths
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            found = dict(
+                zip(
+                    missing,
+                    executor.map(lambda tool: which(tool, path=search_path), missing),
+                )
+            )
+        for tool, path in found.items():
+            paths[tool] = path
+            searched = len(directories)
+            if path is not None:
+                searched = self._preceding(search_path, path)
+            entries[tool] = {
+                "path": path,
+                "mtime": _mtime(path) if path is not None else None,
+                "directories": directories[:searched],
+            }
+        self._save(search_path, entries)
+        return paths
+
+    @staticmethod
+    def _preceding(search_path: str, path: str) -> int:
+        """Returns the number of directories of `PATH` before the one holding path."""
+        directories = search_path.split(os.pathsep)
+        for index, directory in enumerate(directories):
+            name = os.path.join(directory, os.path.basename(path))
+            if os.path.normcase(name) == os.path.normcase(path):
+                return index
+        return len(directories)
+
+    @staticmethod
+    def _directories(search_path: str) -> list[Optional[int]]:
+        """Returns the modification time of each directory of `PATH`."""
+        return [_mtime(directory) for directory in search_path.split(os.pathsep)]
+
+    def _load(self, search_path: str) -> dict[str, dict]:
+        """Returns the cached tools, empty if they were looked up on another `PATH`."""
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict) or cache.get("path") != search_path:
+            return {}
+        return cache.get("tools", {})
+
+    def _save(self, search_path: str, entries: dict[str, dict]) -> None:
+        """Writes the cache, replacing the previous one atomically."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.path.parent, delete=False
+            ) as file:
+                json.dump({"path": search_path, "tools": entries}, file, indent=2)
+            os.replace(file.name, self.path)
+        except OSError:
+            pass
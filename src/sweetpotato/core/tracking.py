@@ -0,0 +1,294 @@
+"""Provides containers that keep memoized component renditions up to date.
+
+Components cache their rendition and mark themselves, and every ancestor, as stale
+through `invalidate` when something they render changes. The containers below call
+`invalidate` on mutation, so in place edits of children, attributes and state values
+are picked up without any extra work from the user.
+"""
+import weakref
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+
+class _Shared:
+    """Container of interned components, which are shared and never change."""
+
+    __slots__ = ()
+
+    def __reduce__(self) -> str:
+        return "SHARED"
+
+    def __repr__(self) -> str:
+        return "SHARED"
+
+
+SHARED = _Shared()  #: Marks components shared between composites, see `interning`.
+
+
+class WatchedDict(dict):
+    """Dictionary invalidating its owner and watching components when mutated.
+
+    Args:
+        args: Positional arguments passed to `dict`.
+        owner: Component owning the dictionary, if any.
+        kwargs: Keyword arguments passed to `dict`.
+
+    Attributes:
+        _owner: Component owning the dictionary, if any.
+        _watchers: Components rendering values of the dictionary, held weakly.
+    """
+
+    __slots__ = ("_owner", "_watchers")
+
+    def __init__(self, *args, owner: Optional[Any] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._owner = owner
+        self._watchers = None
+
+    def watch(self, component: Any) -> None:
+        """Registers a component to be invalidated when the dictionary changes.
+
+        Args:
+            component: Component rendering values of the dictionary.
+        """
+        if self._watchers is None:
+            self._watchers = weakref.WeakSet()
+        self._watchers.add(component)
+
+    def adopt_watchers(self, other: "WatchedDict") -> None:
+        """Takes over the watchers of a dictionary being replaced.
+
+        Args:
+            other: Dictionary being replaced.
+        """
+        for component in list(other._watchers or ()):
+            self.watch(component)
+        self._changed()
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (dict(self),), (None, {"_owner": self._owner})
+
+    def __setstate__(self, state: tuple) -> None:
+        self._owner = state[1]["_owner"]
+        self._watchers = None
+
+    def _changed(self) -> None:
+        if self._owner is not None:
+            self._owner.invalidate()
+        if self._watchers:
+            for component in list(self._watchers):
+                component.invalidate()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other: Any) -> "WatchedDict":
+        super().__ior__(other)
+        self._changed()
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def pop(self, *args) -> Any:
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self) -> tuple:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self._changed()
+
+
+class FrozenDict(WatchedDict):
+    """Immutable, empty by default, dictionary shared between components.
+
+    Nothing is watched since it never changes, mutating it raises a `TypeError`.
+
+    Args:
+        args: Positional arguments passed to `dict`.
+        kwargs: Keyword arguments passed to `dict`.
+    """
+
+    __slots__ = ()
+
+    def watch(self, component: Any) -> None:
+        pass
+
+    def _immutable(self, *args, **kwargs) -> None:
+        raise TypeError(f"{self.__class__.__name__} is immutable.")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+class FrozenList(list):
+    """Immutable list, rendered like the list it was copied from.
+
+    Mutating it raises a `TypeError`.
+
+    Args:
+        items: Items of the list.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (list(self),)
+
+    def _immutable(self, *args, **kwargs) -> None:
+        raise TypeError(f"{self.__class__.__name__} is immutable.")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+
+
+class ChildList(list):
+    """List of child components invalidating its owner when mutated.
+
+    Added components are adopted by the owner, so changes further down the tree reach it.
+
+    Args:
+        children: Child components.
+        owner: Composite owning the list.
+
+    Attributes:
+        _owner: Composite owning the list.
+    """
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, children: Iterable[Any], owner: Any) -> None:
+        super().__init__(children)
+        self._owner = owner
+        for child in self:
+            child._adopt(owner)
+
+    def __reduce__(self) -> tuple:
+        return self.__class__, (list(self), self._owner)
+
+    def _added(self, children: Iterable[Any]) -> None:
+        for child in children:
+            child._adopt(self._owner)
+        self._owner.invalidate()
+
+    def _removed(self, children: Iterable[Any]) -> None:
+        for child in children:
+            if not any(item is child for item in self):
+                child._release(self._owner)
+        self._owner.invalidate()
+
+    def append(self, child: Any) -> None:
+        super().append(child)
+        self._added((child,))
+
+    def extend(self, children: Iterable[Any]) -> None:
+        children = list(children)
+        super().extend(children)
+        self._added(children)
+
+    def insert(self, index: int, child: Any) -> None:
+        super().insert(index, child)
+        self._added((child,))
+
+    def remove(self, child: Any) -> None:
+        super().remove(child)
+        self._removed((child,))
+
+    def pop(self, index: int = -1) -> Any:
+        child = super().pop(index)
+        self._removed((child,))
+        return child
+
+    def clear(self) -> None:
+        children = list(self)
+        super().clear()
+        self._removed(children)
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._owner.invalidate()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._owner.invalidate()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        value = list(value) if isinstance(index, slice) else value
+        super().__setitem__(index, value)
+        for child in removed:
+            if not any(item is child for item in self):
+                child._release(self._owner)
+        self._added(value if isinstance(index, slice) else (value,))
+
+    def __delitem__(self, index: Any) -> None:
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        self._removed(removed)
+
+    def __iadd__(self, children: Iterable[Any]) -> "ChildList":
+        self.extend(children)
+        return self
+
+    def __imul__(self, count: int) -> "ChildList":
+        super().__imul__(count)
+        self._owner.invalidate()
+        return self
+
+
+class LazyChildren:
+    """Child components produced on demand, while they are rendered.
+
+    Children are not held, so streaming a screen generated from a large data source
+    runs in bounded memory. Neither are they tracked, composites with lazy children
+    are rendered again every time.
+
+    Args:
+        source: Iterable of child components, or a factory returning one. Iterators
+            such as generators can only be consumed once, factories and other
+            iterables are iterated anew for every rendition.
+
+    Attributes:
+        collect: Called with each child on the first iteration, so a root component
+            collects imports from the stream, see `RootComponent._set_parent`.
+    """
+
+    __slots__ = ("_source", "_consumed", "collect")
+
+    def __init__(
+        self, source: Union[Iterable[Any], Callable[[], Iterable[Any]]]
+    ) -> None:
+        self._source = source
+        self._consumed = False
+        self.collect: Optional[Callable[[Iterable[Any]], None]] = None
+
+    def __iter__(self) -> Iterator[Any]:
+        source = self._source
+        children = iter(source() if callable(source) else source)
+        if children is source and self._consumed:
+            raise RuntimeError(
+                "Lazy children were already consumed, pass a factory to render again."
+            )
+        self._consumed = True
+        collect, self.collect = self.collect, None
+        for child in children:
+            if collect is not None:
+                collect((child,))
+            yield child
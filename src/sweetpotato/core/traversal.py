@@ -0,0 +1,63 @@
+"""Provides explicit-stack traversal utilities for component trees.
+
+The utilities keep a stack of iterators instead of recursing, so the depth of a
+component tree is bounded only by available memory and not by the recursion limit.
+"""
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+Node = TypeVar("Node")
+
+
+def preorder(
+    nodes: Iterable[Node], children: Callable[[Node], Optional[Iterable[Node]]]
+) -> Iterator[Node]:
+    """Yields nodes and their descendants depth first, parents before children.
+
+    Args:
+        nodes: Top level nodes.
+        children: Returns the children of a node, or `None` if it should not be descended.
+
+    Yields:
+        Each node, in document order.
+
+    Example:
+        for component in preorder(root._children, lambda c: c._children):
+            ...
+    """
+    stack = [iter(nodes)]
+    while stack:
+        for node in stack[-1]:
+            yield node
+            descendants = children(node)
+            if descendants:
+                stack.append(iter(descendants))
+                break
+        else:
+            stack.pop()
+
+
+def unfold(
+    items: Iterable[object], expand: Callable[[object], Iterable[object]]
+) -> Iterator[str]:
+    """Yields string items, splicing the expansion of every other item in its place.
+
+    Args:
+        items: Strings and expandable items.
+        expand: Returns the strings and expandable items an item consists of.
+
+    Yields:
+        Each string, in order.
+
+    Example:
+        "".join(unfold([component], lambda c: c._render_parts()))
+    """
+    stack = [iter(items)]
+    while stack:
+        for item in stack[-1]:
+            if item.__class__ is str:
+                yield item
+            else:
+                stack.append(iter(expand(item)))
+                break
+        else:
+            stack.pop()
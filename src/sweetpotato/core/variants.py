@@ -0,0 +1,77 @@
+"""Provides app variants, white-label builds of one app differing in a few settings and screens.
+
+A batch of variants is built in one process, one variant after the other. Each variant
+applies its settings, creates the app with a factory into an empty component registry
+and is written to its own expo project. Renditions are shared by the variants through
+one in-memory render cache, so subtrees whose structure and output settings are the
+same across variants are rendered once per batch, see
+:meth:`Build.write_variants <sweetpotato.core.build.Build.write_variants>`.
+
+Example:
+    variants = [
+        Variant("acme", "build/acme", settings={"API_URL": "https://acme.com"}),
+        Variant("globex", "build/globex", overrides={"theme": "dark"}),
+    ]
+    Build.write_variants(lambda theme="light": App(Home(), theme=theme), variants)
+"""
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional, Union
+
+from sweetpotato.config import settings
+from sweetpotato.core.base import ComponentRegistry
+
+
+class Variant:
+    """Variant of an app, its settings, keyword arguments of the app factory and project.
+
+    Args:
+        name: Name of variant.
+        output_dir: Expo project the variant is written to.
+        settings: Settings of the variant by name, the others keep their value.
+        overrides: Keyword arguments passed to the app factory.
+
+    Attributes:
+        name: Name of variant.
+        output_dir: Expo project the variant is written to.
+        settings: Settings of the variant by name.
+        overrides: Keyword arguments passed to the app factory.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        output_dir: Union[str, Path],
+        # pylint: disable-next=redefined-outer-name
+        settings: Optional[dict[str, Any]] = None,
+        overrides: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self.name = name
+        self.output_dir = Path(output_dir)
+        self.settings = dict(settings or {})
+        self.overrides = dict(overrides or {})
+
+    def __repr__(self) -> str:
+        return f"Variant({self.name!r}, {str(self.output_dir)!r})"
+
+    @contextmanager
+    def applied(self) -> Iterator[dict]:
+        """Applies the settings of the variant and gives it an empty component registry.
+
+        Previous settings and registry are restored on exit, settings derived from the
+        variant's, like the login function from `API_URL`, are derived again.
+
+        Yields:
+            Component registry of the variant.
+        """
+        previous = {key: getattr(settings, key) for key in self.settings}
+        registry = ComponentRegistry._registry
+        ComponentRegistry._registry = {}
+        try:
+            for key, value in self.settings.items():
+                setattr(settings, key, value)
+            yield ComponentRegistry._registry
+        finally:
+            ComponentRegistry._registry = registry
+            for key, value in previous.items():
+                setattr(settings, key, value)
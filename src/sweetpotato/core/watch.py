@@ -0,0 +1,288 @@
+"""Provides watch mode, rebuilding the app while a supervised Expo server serves it.
+
+The Python modules defining the app are polled for changes. On a change they are
+re-imported and the main script is run again, without its `__main__` block, into an
+empty component registry, and the app is rebuilt. Unchanged screens are served from the
+render cache and their files left untouched, so Metro fast refresh only picks up the
+screens that changed. If the new code fails, the previous registry is kept and the
+error is printed.
+
+Example:
+    server = DevServer(settings.REACT_NATIVE_PATH)
+    Watcher(Build.write_files).run(server)
+"""
+import importlib
+import os
+import runpy
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from contextlib import ExitStack
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, ClassVar, Optional, Sequence, TextIO, Union
+
+from sweetpotato.config import settings
+from sweetpotato.core.base import ComponentRegistry
+
+_PACKAGE = Path(__file__).resolve().parent.parent
+_PREFIXES = tuple(
+    Path(prefix).resolve() for prefix in {sys.prefix, sys.base_prefix, sys.exec_prefix}
+)
+
+
+class DevServer:
+    """Expo development server run as a supervised child process.
+
+    Its output is streamed, line by line, to `output` and watched for the message Expo
+    prints once Metro is ready. A server that exits is restarted by :meth:`supervise`.
+
+    Args:
+        directory: Expo project to serve.
+        args: Extra arguments of the command, like `--web`.
+        output: Stream the server log is written to, standard output by default.
+
+    Attributes:
+        command: Command starting the server, `settings.DEV_SERVER_COMMAND` and args.
+        ready: Set once the server is ready, cleared when it is restarted.
+        restarts: Number of times the server was restarted.
+    """
+
+    ready_messages: tuple[str, ...] = (
+        "Waiting on http",
+        "Metro waiting on",
+        "Logs for your project will appear below",
+    )  #: Log messages telling the server is ready.
+    max_restarts: int = 5  #: Restarts after which an exiting server is given up on.
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        args: Sequence[str] = (),
+        output: Optional[TextIO] = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.command = [*settings.DEV_SERVER_COMMAND, *args]
+        self.output = output
+        self.ready = threading.Event()
+        self.restarts = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._exits = ExitStack()  # Closes the log pipe of the process.
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    def start(self) -> None:
+        """Starts the server, its log is streamed from a background thread."""
+        self.ready.clear()
+        self._started = time.perf_counter()
+        self._process = self._exits.enter_context(
+            subprocess.Popen(
+                self.command,
+                cwd=self.directory,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                encoding="utf-8",
+                errors="replace",
+            )
+        )
+        self._thread = threading.Thread(
+            target=self._stream, args=(self._process,), daemon=True
+        )
+        self._thread.start()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Whether the server became ready within timeout seconds."""
+        return self.ready.wait(timeout)
+
+    def poll(self) -> Optional[int]:
+        """Returns the exit code of the server, `None` while it runs."""
+        return None if self._process is None else self._process.poll()
+
+    def supervise(self) -> None:
+        """Restarts the server if it exited.
+
+        Raises:
+            RuntimeError: If the server exited more than `max_restarts` times.
+        """
+        code = self.poll()
+        if code is None:
+            return
+        self._join()
+        if self.restarts >= self.max_restarts:
+            raise RuntimeError(f"Dev server exited with code {code}, giving up.")
+        self.restarts += 1
+        self._write(f"Dev server exited with code {code}, restarting.\n")
+        self.start()
+
+    def stop(self, timeout: float = 10) -> None:
+        """Terminates the server, killing it if it does not exit within timeout seconds."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+        self._join()
+
+    def _join(self) -> None:
+        """Waits for the log of an exited server to be written."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._exits.close()
+
+    def _stream(self, process: subprocess.Popen) -> None:
+        """Writes the log of the server, setting `ready` once it is ready."""
+        for line in process.stdout:
+            self._write(line)
+            if not self.ready.is_set() and any(
+                message in line for message in self.ready_messages
+            ):
+                self.ready.set()
+                self._write(
+                    f"Dev server ready in {time.perf_counter() - self._started:.1f}s.\n"
+                )
+
+    def _write(self, text: str) -> None:
+        output = self.output or sys.stdout
+        output.write(text)
+        output.flush()
+
+
+class Watcher:
+    """Rebuilds the app whenever the Python modules defining it change.
+
+    Args:
+        build: Function writing the app, called after the modules are reloaded.
+        root: Directory of the user's modules, that of the main script by default.
+        main: Main script, run again on changes, that of `__main__` by default.
+        interval: Seconds between polls of the modules.
+        output: Stream messages are written to, standard output by default.
+
+    Attributes:
+        reloading: Whether user modules are being reloaded, :meth:`Build.run
+            <sweetpotato.core.build.Build.run>` returns right away while they are.
+    """
+
+    reloading: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        build: Callable[[], object],
+        root: Optional[Union[str, Path]] = None,
+        main: Optional[Union[str, Path]] = None,
+        interval: float = 0.2,
+        output: Optional[TextIO] = None,
+    ) -> None:
+        if main is None:
+            main = getattr(sys.modules.get("__main__"), "__file__", None)
+        self.main = Path(main).resolve() if main else None
+        if root is None:
+            root = self.main.parent if self.main else os.getcwd()
+        self.root = Path(root).resolve()
+        self.build = build
+        self.interval = interval
+        self.output = output
+        self._mtimes = self.mtimes()
+
+    def modules(self) -> list[ModuleType]:
+        """Returns the user's modules, in the order they were imported."""
+        modules = []
+        for name, module in list(sys.modules.items()):
+            file = getattr(module, "__file__", None)
+            if name == "__main__" or not file:
+                continue
+            path = Path(file).resolve()
+            if (
+                self.root in path.parents
+                and _PACKAGE not in path.parents
+                and not any(prefix in path.parents for prefix in _PREFIXES)
+            ):
+                modules.append(module)
+        return modules
+
+    def mtimes(self) -> dict[str, int]:
+        """Returns the modification time of each user module and the main script."""
+        paths = [module.__file__ for module in self.modules()]
+        if self.main:
+            paths.append(str(self.main))
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                mtimes[path] = 0
+        return mtimes
+
+    def poll(self) -> Optional[bool]:
+        """Rebuilds the app if a module changed.
+
+        Returns:
+            Whether the rebuild succeeded, `None` if nothing changed.
+        """
+        mtimes = self.mtimes()
+        if mtimes == self._mtimes:
+            return None
+        rebuilt = self.rebuild()
+        self._mtimes = self.mtimes()
+        return rebuilt
+
+    def rebuild(self) -> bool:
+        """Reloads the user's modules into an empty registry and writes the app.
+
+        Modules are reloaded in reverse import order, so dependencies are reloaded
+        before the modules importing them. The previous registry is restored if the
+        reload fails.
+
+        Returns:
+            Whether the app was rebuilt.
+        """
+        started = time.perf_counter()
+        registry = ComponentRegistry._registry
+        ComponentRegistry._registry = {}
+        try:
+            Watcher.reloading = True
+            try:
+                importlib.invalidate_caches()
+                for module in reversed(self.modules()):
+                    importlib.reload(module)
+                if self.main:
+                    runpy.run_path(str(self.main), run_name="__sweetpotato_watch__")
+            finally:
+                Watcher.reloading = False
+            self.build()
+        except Exception:  # pylint: disable=broad-except
+            ComponentRegistry._registry = registry
+            self._write(traceback.format_exc())
+            self._write("Rebuild failed, serving the previous build.\n")
+            return False
+        self._write(f"Rebuilt in {time.perf_counter() - started:.2f}s.\n")
+        return True
+
+    def run(self, server: Optional[DevServer] = None) -> None:
+        """Polls the modules until interrupted, supervising the server if any."""
+        if server is not None:
+            server.start()
+        try:
+            while True:
+                time.sleep(self.interval)
+                if server is not None:
+                    server.supervise()
+                self.poll()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if server is not None:
+                server.stop()
+
+    def _write(self, text: str) -> None:
+        output = self.output or sys.stdout
+        output.write(text)
+        output.flush()
@@ -25,9 +25,12 @@ class CustomMixin:
             extra_props = {"custom_prop"}
     """
 
+    __slots__ = ()
+
     extra_props: set = set()  #: Set of extra allowed props for component, set by user.
 
-    def __init__(self) -> None:
-        if self.extra_props:
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.extra_props:
             # noinspection PyUnresolvedReferences
-            self.props.update(self.extra_props)
+            cls.props = frozenset(cls.props | cls.extra_props)
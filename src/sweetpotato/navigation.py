@@ -51,13 +51,15 @@ class RootNavigation(RootComponent):
             **kwargs,
         )
 
-    def __repr__(self):
-        return ""
+    def _render_parts(self) -> tuple:
+        return ()
 
 
 class NavigationContainer(Composite):
     """React Navigation NavigationContainer component."""
 
+    __slots__ = ()
+
     package: str = "@react-navigation/native"  #: Default package for component.
     props: set = NAVIGATION_CONTAINER_PROPS  #: Set of allowed props for component.
 
@@ -94,9 +96,9 @@ class Screen(RootComponent):
 
         self.is_functional = is_functional
 
-    def __repr__(self) -> str:
+    def _render_parts(self) -> tuple:
         children = f"{'{'}'{self.import_name}'{'}'}>{'{'}() => <{self.import_name} {self.attrs}/> {'}'}"
-        return f"<{self.component_name} name={children}</{self.component_name}>"
+        return (f"<{self.component_name} name={children}</{self.component_name}>",)
 
 
 class BaseNavigator(Composite):
@@ -113,6 +115,8 @@ class BaseNavigator(Composite):
         * Add specific props from React Navigation.
     """
 
+    __slots__ = ()
+
     props: set = BASE_NAVIGATOR_PROPS  #: Set of allowed props for component.
 
     def __init__(self, name: str = None, **kwargs) -> None:
@@ -170,6 +174,8 @@ class Stack(BaseNavigator):
     See https://reactnavigation.org/docs/stack-navigator
     """
 
+    __slots__ = ()
+
     import_name: str = "createNativeStackNavigator"  #: Name of component import.
     package: str = "@react-navigation/native-stack"  #: Default package for component.
     props: set = NATIVE_STACK_NAVIGATOR_PROPS  #: Set of allowed props for component.
@@ -181,6 +187,8 @@ class Tab(BaseNavigator):
     See https://reactnavigation.org/docs/bottom-tab-navigator
     """
 
+    __slots__ = ()
+
     import_name: str = "createBottomTabNavigator"  #: Name of component import.
     package: str = "@react-navigation/bottom-tabs"  #: Default package for component.
     props: set = BOTTOM_TAB_NAVIGATOR_PROPS  #: Set of allowed props for component.
@@ -21,6 +21,8 @@ class IconRegistry(Component):
     See `<https://akveo.github.io/react-native-ui-kitten/docs/components/icon/overview#icon>`_
     """
 
+    __slots__ = ()
+
     package: str = "@ui-kitten/components"  #: Default package for component.
     props: set = ICON_REGISTRY_PROPS  #: Set of allowed props for component.
 
@@ -34,6 +36,8 @@ class ApplicationProvider(Composite):
         kwargs: Arbitrary keyword arguments.
     """
 
+    __slots__ = ()
+
     package: str = "@ui-kitten/components"  #: Default package for component.
     props: set = APPLICATION_PROVIDER_PROPS  #: Set of allowed props for component.
 
@@ -48,8 +52,12 @@ class ApplicationProvider(Composite):
         )
         super().__init__(**kwargs)
 
-    def __repr__(self) -> str:
-        return f"<{self._import_name} {'{'}...eva{'}'}{self.attrs}>{self.children}</{self._import_name}>"
+    def _render_parts(self) -> tuple:
+        return (
+            f"<{self._import_name} {'{'}...eva{'}'}{self.attrs}>",
+            *self._children,
+            f"</{self._import_name}>",
+        )
 
 
 class Text(Component):
@@ -58,6 +66,8 @@ class Text(Component):
     See https://akveo.github.io/react-native-ui-kitten/docs/components/text.
     """
 
+    __slots__ = ()
+
     package: str = "@ui-kitten/components"  #: Default package for component.
     props: set = TEXT_PROPS  #: Set of allowed props for component.
 
@@ -71,6 +81,8 @@ class Button(Composite):
     See https://akveo.github.io/react-native-ui-kitten/docs/components/button.
     """
 
+    __slots__ = ()
+
     package: str = "@ui-kitten/components"  #: Default package for component.
     props: set = BUTTON_PROPS  #: Set of allowed props for component.
 
@@ -84,6 +96,8 @@ class Input(Component):
     See https://akveo.github.io/react-native-ui-kitten/docs/components/input.
     """
 
+    __slots__ = ()
+
     package: str = "@ui-kitten/components"  #: Default package for component.
     props: set = INPUT_PROPS  #: Set of allowed props for component.
 
@@ -94,5 +108,7 @@ class Layout(Composite):
     See https://akveo.github.io/react-native-ui-kitten/docs/components/layout.
     """
 
+    __slots__ = ()
+
     package: str = "@ui-kitten/components"  #: Default package for component.
     props: set = LAYOUT_PROPS  #: Set of allowed props for component.
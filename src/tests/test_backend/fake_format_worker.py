@@ -0,0 +1,39 @@
+"""Stand-in for format_worker.js, speaking its protocol without node or prettier.
+
+Sources are returned with a `// formatted` line prepended, the name of each file is
+appended to the log file given as the first argument. Sources containing `FAIL` are
+answered with an error, sources containing `EXIT` make the worker exit. While the
+project holds a `no_prettier` file every request is answered, unlogged, with the error
+of a missing prettier.
+"""
+import json
+import os
+import sys
+
+
+def main() -> None:
+    log = sys.argv[1]
+    for line in sys.stdin:
+        request = json.loads(line)
+        if os.path.exists("no_prettier"):
+            error = "Could not load prettier: Cannot find module 'prettier'"
+            sys.stdout.write(json.dumps({"id": request["id"], "error": error}) + "\n")
+            sys.stdout.flush()
+            continue
+        with open(log, "a", encoding="utf-8") as file:
+            file.write(f"{os.getpid()} {os.path.basename(request['path'])}\n")
+        if "EXIT" in request["source"]:
+            return
+        if "FAIL" in request["source"]:
+            response = {"id": request["id"], "error": "SyntaxError: Unexpected token"}
+        else:
+            response = {
+                "id": request["id"],
+                "source": "// formatted\n" + request["source"],
+            }
+        sys.stdout.write(json.dumps(response) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
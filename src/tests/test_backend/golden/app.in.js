@@ -0,0 +1,25 @@
+
+import React from 'react';
+import {SafeAreaProvider} from "react-native-safe-area-context";
+import {createNativeStackNavigator} from "@react-navigation/native-stack";
+import {Home} from "./src/screens/Home.js";
+import {Settings} from "./src/screens/Settings.js";
+
+
+
+const Main = createNativeStackNavigator();
+
+export default class App extends React.Component {
+    constructor(props) {
+        super(props);
+        this.state = {}    
+    }    
+    
+    
+
+    render() {
+        return (
+                <SafeAreaProvider ><Main.Navigator ><Main.Screen name={'Home'}>{() => <Home /> }</Main.Screen><Main.Screen name={'Settings'}>{() => <Settings /> }</Main.Screen></Main.Navigator></SafeAreaProvider>
+        );
+    }
+}
\ No newline at end of file
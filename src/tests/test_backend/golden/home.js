@@ -0,0 +1,31 @@
+import React from "react";
+import { Image, StyleSheet, Text, View } from "react-native";
+
+const styles = StyleSheet.create({
+  s60dcffdd208a: { flex: 1, justifyContent: "center" },
+  sd345d3f6b2a2: { width: 100, height: 100 },
+});
+
+export class Home extends React.Component {
+  constructor(props) {
+    super(props);
+    this.state = {};
+  }
+
+  render() {
+    return (
+      <View style={styles.s60dcffdd208a}>
+        <Text>
+          Welcome to the sweetpotato home screen, a long line of text that needs
+          wrapping
+        </Text>
+        <Image
+          source={{
+            uri: "https://example.com/a-very-long-image-url/that/goes/on.png",
+          }}
+          style={styles.sd345d3f6b2a2}
+        />
+      </View>
+    );
+  }
+}
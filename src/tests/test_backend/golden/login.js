@@ -0,0 +1,38 @@
+import React from "react";
+import { Text } from "react-native";
+export class Login extends React.Component {
+  constructor(props) {
+    super(props);
+    this.state = { username: "", password: "", secure: true };
+  }
+  login = async () => {
+    const { username, password } = this.state;
+    let response = await fetch("https://example.com/api/login", {
+      method: "POST",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify({ username: username, password: password }),
+    });
+    if (response.ok) {
+      this.props.navigate("Home");
+    } else alert("Failed");
+    for (let i = 0; i < 3; i++) {
+      console.log(i);
+    }
+    const x = a ? b : { c: 1 };
+    return !x && -1;
+  };
+
+  render() {
+    return (
+      <View style={styles.s}>
+        <TextInput
+          placeholder={"Username"}
+          onChangeText={(text) => this.setState({ username: text })}
+          value={this.state.username}
+        />
+        {this.state.secure && <Text>Hi {this.state.username}!</Text>}
+        <Button title={`Save`} onPress={() => this.login()} />
+      </View>
+    );
+  }
+}
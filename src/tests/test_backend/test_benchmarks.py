@@ -0,0 +1,120 @@
+"""Unittests for the benchmark suite, its results and their comparison to a baseline."""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(ROOT))
+
+# pylint: disable=wrong-import-position
+from benchmarks.suite import runner
+
+
+def suite(*args: str) -> subprocess.CompletedProcess:
+    """Runs the benchmark suite on tiny apps, timing each phase once."""
+    return subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.suite",
+            "--scale",
+            "0.02",
+            "--repeat",
+            "1",
+            *args,
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+
+class TestBenchmarks(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Run every scenario once, saving the results."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.results = os.path.join(cls.directory.name, "results.json")
+        cls.output = suite("--output", cls.results)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.directory.cleanup()
+
+    def test_results(self):
+        self.assertEqual(self.output.returncode, 0, self.output.stderr)
+        with open(self.results, encoding="utf-8") as file:
+            saved = json.load(file)
+        self.assertEqual(
+            list(saved["results"]), ["wide", "deep", "navigator", "stateful", "wrapped"]
+        )
+        for timings in saved["results"].values():
+            self.assertEqual(
+                list(timings),
+                ["construct", "set_parent", "render", "serialize", "write"],
+            )
+        self.assertEqual(saved["config"]["scale"], 0.02)
+
+    def test_load(self):
+        self.assertEqual(runner.load(self.results)["config"]["repeat"], 1)
+        path = os.path.join(self.directory.name, "unknown.json")
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"format": runner.FORMAT + 1}, file)
+        with self.assertRaises(ValueError):
+            runner.load(path)
+
+
+def report(scale: float = 1.0, **minimums: float) -> dict:
+    """Returns results of the deep scenario with the minimum time of each phase."""
+    return {
+        "format": runner.FORMAT,
+        "config": {"scale": scale, "repeat": 1, "warmup": 0},
+        "results": {
+            "deep": {
+                phase: {
+                    "min": minimum,
+                    "median": minimum,
+                    "max": minimum,
+                    "runs": [minimum],
+                }
+                for phase, minimum in minimums.items()
+            }
+        },
+    }
+
+
+class TestCompare(unittest.TestCase):
+    def test_regression(self):
+        compared = runner.compare(
+            report(render=0.012, write=0.020),
+            report(render=0.010, write=0.019),
+            threshold=0.1,
+        )
+        self.assertEqual(
+            compared,
+            [
+                ("deep", "render", 0.010, 0.012, True),
+                ("deep", "write", 0.019, 0.020, False),
+            ],
+        )
+        lines = runner.table(report(render=0.012, write=0.020), compared).splitlines()
+        self.assertEqual(lines[1].split()[-2:], ["+20.0%", "REGRESSED"])
+        self.assertEqual(lines[2].split()[-1], "+5.3%")
+
+    def test_missing_from_baseline(self):
+        compared = runner.compare(
+            report(render=0.012, write=0.020), report(render=0.012)
+        )
+        self.assertEqual(compared, [("deep", "render", 0.012, 0.012, False)])
+
+    def test_scale(self):
+        with self.assertRaises(ValueError):
+            runner.compare(report(0.5, render=0.01), report(1.0, render=0.01))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,336 @@
+"""Unittests for incremental builds."""
+import io
+import os
+import stat
+import sys
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from unittest import mock
+
+from sweetpotato.components import Text, View
+from sweetpotato.config import settings
+from sweetpotato.core.base import ComponentRegistry, RootComponent
+from sweetpotato.core.build import Build
+from sweetpotato.core.format_worker import FormatWorker
+from sweetpotato.core.manifest import Manifest
+from sweetpotato.core.output import MODE, OutputWriter
+from sweetpotato.core.pretty import FormatError, format_source
+
+FAKE_WORKER = os.path.join(os.path.dirname(__file__), "fake_format_worker.py")
+
+
+class TestIncrementalBuild(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up an empty expo project with two registered screens."""
+        self.directory = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.directory.name, "src", "components"))
+        self.path, self.cwd = settings.REACT_NATIVE_PATH, os.getcwd()
+        self.formatter, self.command = (
+            settings.FORMATTER,
+            settings.FORMAT_WORKER_COMMAND,
+        )
+        self.log = os.path.join(self.directory.name, "formatted.log")
+        settings.REACT_NATIVE_PATH = self.directory.name
+        settings.FORMATTER = "prettier"
+        settings.FORMAT_WORKER_COMMAND = [sys.executable, FAKE_WORKER, self.log]
+        self.registry = ComponentRegistry._registry
+        self.text = Text(text="first")
+        first = RootComponent(
+            component_name="First", children=[View(children=[self.text])]
+        )
+        second = RootComponent(component_name="Second", children=[View()])
+        ComponentRegistry._registry = {"First": first, "Second": second}
+
+    def tearDown(self) -> None:
+        mock.patch.stopall()
+        FormatWorker.close_all()
+        ComponentRegistry._registry = self.registry
+        settings.REACT_NATIVE_PATH = self.path
+        settings.FORMATTER, settings.FORMAT_WORKER_COMMAND = (
+            self.formatter,
+            self.command,
+        )
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def formatted(self) -> list[str]:
+        """Returns the files passed to the format worker since the last call."""
+        if not os.path.exists(self.log):
+            return []
+        with open(self.log, encoding="utf-8") as file:
+            names = sorted(line.split()[1] for line in file)
+        os.unlink(self.log)
+        return names
+
+    def build(self, **kwargs) -> list[str]:
+        """Builds the registered screens, returning the files formatted."""
+        Build.write_files(use_cache=False, **kwargs)
+        return self.formatted()
+
+    def test_unchanged_skipped(self):
+        self.assertEqual(self.build(), ["First.js", "Second.js"])
+        second = os.path.join(self.directory.name, "src", "components", "Second.js")
+        modified = os.stat(second).st_mtime_ns
+        self.assertEqual(self.build(), [])
+        self.text._attrs["testID"] = "edited"
+        self.assertEqual(self.build(), ["First.js"])
+        self.assertEqual(os.stat(second).st_mtime_ns, modified)
+        self.assertEqual(self.build(incremental=False), ["First.js", "Second.js"])
+
+    def test_removed_screen_deleted(self):
+        self.build()
+        del ComponentRegistry._registry["Second"]
+        self.build()
+        components = os.listdir(os.path.join(self.directory.name, "src", "components"))
+        self.assertEqual(components, ["First.js"])
+        manifest = Manifest(self.directory.name)
+        first = os.path.join("src", "components", "First.js")
+        self.assertEqual(list(manifest.entries), [first])
+
+    def test_missing_file_rewritten(self):
+        self.build()
+        os.unlink(os.path.join(self.directory.name, "src", "components", "First.js"))
+        self.assertEqual(self.build(), ["First.js"])
+
+    def test_prettier(self):
+        self.build()
+        path = os.path.join(self.directory.name, "src", "components", "First.js")
+        with open(path, encoding="utf-8") as file:
+            self.assertTrue(file.read().startswith("// formatted\n"))
+        self.text._attrs["testID"] = "FAIL"
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(self.build(), ["First.js"])
+        with open(path, encoding="utf-8") as file:
+            source = file.read()
+        self.assertIn("FAIL", source)
+        self.assertFalse(source.startswith("// formatted\n"))
+
+    def test_prettier_missing(self):
+        marker = os.path.join(self.directory.name, "no_prettier")
+        open(marker, "w", encoding="utf-8").close()
+        no_install = [sys.executable, "-c", "pass"]
+        with mock.patch.object(FormatWorker, "install_command", no_install):
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(self.build(), [])
+        path = os.path.join(self.directory.name, "src", "components", "First.js")
+        with open(path, encoding="utf-8") as file:
+            self.assertFalse(file.read().startswith("// formatted\n"))
+        os.unlink(marker)
+        FormatWorker.close_all()
+        self.assertEqual(self.build(), ["First.js", "Second.js"])
+        with open(path, encoding="utf-8") as file:
+            self.assertTrue(file.read().startswith("// formatted\n"))
+
+    def test_builtin_formatter(self):
+        settings.FORMATTER = "builtin"
+        self.assertEqual(self.build(), [])
+        path = os.path.join(self.directory.name, "src", "components", "First.js")
+        with open(path, encoding="utf-8") as file:
+            source = file.read()
+        self.assertIn("    return (\n      <View>\n        <Text>first</Text>", source)
+        self.assertEqual(format_source(source), source)
+
+    def test_builtin_formatter_failure(self):
+        settings.FORMATTER = "builtin"
+        self.text._attrs["testID"] = "FAIL"
+        with mock.patch(
+            "sweetpotato.core.pretty.format_source", side_effect=FormatError("bad")
+        ):
+            with redirect_stdout(io.StringIO()) as stdout:
+                Build.write_files(use_cache=False, jobs=1)
+        self.assertIn("Could not format", stdout.getvalue())
+        path = os.path.join(self.directory.name, "src", "components", "First.js")
+        with open(path, encoding="utf-8") as file:
+            self.assertIn("FAIL", file.read())
+
+
+class TestOutputWriter(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up an output writer for an empty directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.output = OutputWriter(self.directory.name, Manifest(self.directory.name))
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_replaced_atomically(self):
+        with self.output.open("./Screen.js") as file:
+            file.write("first")
+            self.assertFalse(
+                os.path.exists(os.path.join(self.directory.name, "Screen.js"))
+            )
+        self.assertTrue(file.written)
+        with self.output.open("./Screen.js") as file:
+            file.write("first")
+        self.assertFalse(file.written)
+        with self.assertRaises(RuntimeError):
+            with self.output.open("./Screen.js") as file:
+                file.write("second")
+                raise RuntimeError
+        self.assertEqual(os.listdir(self.directory.name), ["Screen.js"])
+        with open(self.output.resolve("Screen.js"), encoding="utf-8") as file:
+            self.assertEqual(file.read(), "first")
+
+    def test_permissions(self):
+        with self.output.open("./Screen.js") as file:
+            file.write("first")
+        self.output.manifest.save()
+        for path in (self.output.resolve("Screen.js"), self.output.manifest.path):
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), MODE)
+
+    def test_formatter(self):
+        formatter = mock.Mock(side_effect=lambda text, _: text.upper())
+        output = OutputWriter(
+            self.directory.name, self.output.manifest, formatter=formatter
+        )
+        with output.open("./Screen.js") as file:
+            file.write("first")
+        with open(output.resolve("Screen.js"), encoding="utf-8") as file:
+            self.assertEqual(file.read(), "FIRST")
+        with output.open("./Screen.js") as file:
+            file.write("first")
+        self.assertFalse(file.written)
+        formatter.assert_called_once_with("first", output.resolve("Screen.js"))
+
+    def test_formatter_changed(self):
+        with self.output.open("./Screen.js") as file:
+            file.write("first")
+        output = OutputWriter(
+            self.directory.name,
+            self.output.manifest,
+            formatter=lambda text, _: text.upper(),
+            formatter_name="upper",
+        )
+        with output.open("./Screen.js") as file:
+            file.write("first")
+        self.assertTrue(file.written)
+        with open(output.resolve("Screen.js"), encoding="utf-8") as file:
+            self.assertEqual(file.read(), "FIRST")
+
+    def test_concurrent_builds(self):
+        cwd = os.getcwd()
+        directories = [tempfile.TemporaryDirectory() for _ in range(4)]
+        registry = ComponentRegistry._registry
+        ComponentRegistry._registry = {
+            "Threaded": RootComponent(component_name="Threaded", children=[View()])
+        }
+        try:
+            with ThreadPoolExecutor(4) as executor:
+                builds = [
+                    executor.submit(
+                        Build.write_files, use_cache=False, output_dir=directory.name
+                    )
+                    for directory in directories
+                ]
+                for build in builds:
+                    build.result()
+            for directory in directories:
+                path = os.path.join(directory.name, "src", "components", "Threaded.js")
+                self.assertTrue(os.path.isfile(path))
+            self.assertEqual(os.getcwd(), cwd)
+        finally:
+            ComponentRegistry._registry = registry
+            for directory in directories:
+                directory.cleanup()
+
+
+class TestFormatWorker(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up a fake format worker logging the files it formats."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.log = os.path.join(self.directory.name, "formatted.log")
+        self.command = [sys.executable, FAKE_WORKER, self.log]
+        self.worker = FormatWorker.get(self.directory.name, self.command)
+
+    def tearDown(self) -> None:
+        FormatWorker.close_all()
+        self.directory.cleanup()
+
+    def processes(self) -> set[str]:
+        """Returns the process ids of the workers that formatted files."""
+        with open(self.log, encoding="utf-8") as file:
+            return {line.split()[0] for line in file}
+
+    def test_reused(self):
+        self.assertEqual(self.worker.format("first", "First.js"), "// formatted\nfirst")
+        self.assertIs(FormatWorker.get(self.directory.name, self.command), self.worker)
+        self.assertEqual(
+            self.worker.format("second", "Second.js"), "// formatted\nsecond"
+        )
+        self.assertEqual(len(self.processes()), 1)
+
+    def test_error(self):
+        with self.assertRaises(FormatError):
+            self.worker.format("FAIL", "First.js")
+        self.assertEqual(self.worker.format("first", "First.js"), "// formatted\nfirst")
+
+    def test_restarted(self):
+        with self.assertRaises(FormatError):
+            self.worker.format("EXIT", "First.js")
+        self.assertEqual(self.worker.format("first", "First.js"), "// formatted\nfirst")
+        self.assertEqual(len(self.processes()), 2)
+
+    def test_installed(self):
+        marker = os.path.join(self.directory.name, "no_prettier")
+        open(marker, "w", encoding="utf-8").close()
+        install = [sys.executable, "-c", "import os; os.remove('no_prettier')"]
+        with mock.patch.object(FormatWorker, "install_command", install):
+            with redirect_stdout(io.StringIO()) as stdout:
+                self.assertEqual(
+                    self.worker.format("first", "First.js"), "// formatted\nfirst"
+                )
+        self.assertIn("trying", stdout.getvalue())
+        self.assertFalse(os.path.exists(marker))
+
+    def test_missing_command(self):
+        worker = FormatWorker(
+            self.directory.name, [os.path.join(self.directory.name, "node")]
+        )
+        with self.assertRaises(FormatError):
+            worker.format("first", "First.js")
+
+
+class TestParallelBuild(TestIncrementalBuild):
+    def setUp(self) -> None:
+        """Set up the project with every app built in parallel."""
+        super().setUp()
+        mock.patch.object(Build, "parallel_components", 0).start()
+
+    def build(self, **kwargs) -> list[str]:
+        return super().build(jobs=2, **kwargs)
+
+    def contents(self) -> dict[str, str]:
+        """Returns the content of each written screen file."""
+        directory = os.path.join(self.directory.name, "src", "components")
+        contents = {}
+        for name in sorted(os.listdir(directory)):
+            with open(os.path.join(directory, name), encoding="utf-8") as file:
+                contents[name] = file.read()
+        return contents
+
+    def test_matches_serial(self):
+        super().build(incremental=False)
+        serial = self.contents()
+        for start_method in ("fork", "spawn"):
+            with self.subTest(start_method=start_method):
+                directory = os.path.join(self.directory.name, "src", "components")
+                for name in os.listdir(directory):
+                    os.unlink(os.path.join(directory, name))
+                with mock.patch.object(
+                    Build, "start_method", start_method
+                ), mock.patch.object(
+                    Build, "_write_parallel", wraps=Build._write_parallel
+                ) as write_parallel:
+                    self.assertEqual(
+                        self.build(incremental=False), ["First.js", "Second.js"]
+                    )
+                # Without forking, shipping screens to workers costs more than writing them.
+                self.assertEqual(write_parallel.called, start_method == "fork")
+                self.assertEqual(self.contents(), serial)
+                self.assertEqual(self.build(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
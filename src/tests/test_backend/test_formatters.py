@@ -0,0 +1,73 @@
+"""Unittests for attribute formatters."""
+import unittest
+
+from sweetpotato.components import View, Text
+
+
+class Name(str):
+    """String subclass formatted through its base."""
+
+
+class Color:
+    """Attribute type without a registered formatter."""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+
+class ColoredView(View):
+    """View with a formatter registered on the subclass only."""
+
+
+@ColoredView.register_formatter(Color)
+def format_color(_, attr: Color, key: str) -> str:
+    return f"{key}={{'{attr.value}'}}"
+
+
+class TestFormatters(unittest.TestCase):
+    def test_json_attrs(self):
+        text = Text(text="", numberOfLines=1, accessible=True)
+        self.assertEqual(text.attrs.strip(), "numberOfLines={1} accessible={true}")
+        self.assertEqual(View(style=None).attrs.strip(), "style={null}")
+
+    def test_str_subclass(self):
+        view = View(accessibilityHint=Name("hint"))
+        self.assertEqual(view.attrs.strip(), "accessibilityHint={`hint`}")
+
+    def test_unknown_type(self):
+        with self.assertRaises(AttributeError):
+            View(style=Color("red")).attrs
+
+    def test_registered_on_subclass(self):
+        self.assertEqual(ColoredView(style=Color("red")).attrs.strip(), "style={'red'}")
+        self.assertNotIn(Color, View._attr_formatters)
+
+    def test_declared_on_subclass(self):
+        class DeclaredView(View):
+            """View declaring its formatters in the class body."""
+
+            _formatters = {Color: format_color}
+
+        self.assertEqual(
+            DeclaredView(style=Color("red")).attrs.strip(), "style={'red'}"
+        )
+        self.assertEqual(DeclaredView(style=True).attrs.strip(), "style={true}")
+
+    def test_registered_on_base(self):
+        class Size(int):
+            """Integer subclass with a formatter of its own."""
+
+        class BaseView(View):
+            """View registering a formatter after its subclass is defined."""
+
+        class ChildView(BaseView):
+            """View inheriting the formatter of its base."""
+
+        self.assertEqual(ChildView(style=Size(2)).attrs.strip(), "style={2}")
+        BaseView.register_formatter(Size, lambda _, attr, key: f"{key}={{{attr}}}px")
+        self.assertEqual(ChildView(style=Size(2)).attrs.strip(), "style={2}px")
+        self.assertEqual(View(style=Size(2)).attrs.strip(), "style={2}")
+
+
+if __name__ == "__main__":
+    unittest.main()
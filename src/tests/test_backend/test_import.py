@@ -0,0 +1,47 @@
+"""Unittests for the modules imported by sweetpotato, see benchmarks/bench_import.py for timings."""
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parents[2]
+DEFERRED = (
+    "concurrent.futures",
+    "multiprocessing",
+    "pty",
+    "sweetpotato.authentication",
+    "sweetpotato.core.format_worker",
+    "sweetpotato.core.memory",
+    "sweetpotato.core.pretty",
+    "sweetpotato.core.toolchain",
+    "sweetpotato.core.watch",
+    "sweetpotato.functions.authentication_functions",
+    "sweetpotato.functions.navigation_functions",
+    "sweetpotato.navigation",
+    "sweetpotato.ui_kitten",
+)  #: Modules only imported by the steps needing them.
+
+
+def imported(module: str) -> set[str]:
+    """Returns the modules in `sys.modules` after importing module in a fresh interpreter."""
+    output = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print(*sys.modules, sep='\\n')"],
+        cwd=SOURCE,
+        env=os.environ | {"PYTHONPATH": str(SOURCE)},
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return set(output.stdout.split())
+
+
+class TestImport(unittest.TestCase):
+    def test_deferred(self):
+        modules = imported("sweetpotato.app")
+        self.assertIn("sweetpotato.app", modules)
+        self.assertEqual([module for module in DEFERRED if module in modules], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""Unittests for build instrumentation."""
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sweetpotato.components import Text, View
+from sweetpotato.config import settings
+from sweetpotato.core.base import ComponentRegistry, RootComponent
+from sweetpotato.core.build import Build
+from sweetpotato.core.context_wrappers import ContextWrapper
+from sweetpotato.core.instrumentation import TraceRecorder, Tracer, tracer
+
+
+class Hook:
+    """Hook logging the phases it is told about."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def start(self, phase, screen):
+        self.calls.append(("start", phase, screen))
+
+    def end(self, phase, screen):
+        self.calls.append(("end", phase, screen))
+
+
+class TestTracer(unittest.TestCase):
+    def test_hooks(self):
+        local, hook = Tracer(), Hook()
+        with local.phase("unreported"):
+            pass
+        local.add(hook)
+        with self.assertRaises(KeyError), local.phase("write", "Home"):
+            with local.phase("format", "Home"):
+                raise KeyError
+        local.remove(hook)
+        with local.phase("unreported"):
+            pass
+        self.assertEqual(
+            hook.calls,
+            [
+                ("start", "write", "Home"),
+                ("start", "format", "Home"),
+                ("end", "format", "Home"),
+                ("end", "write", "Home"),
+            ],
+        )
+
+
+class TestTraceRecorder(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up an empty registry and project."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.formatter = settings.FORMATTER
+        settings.FORMATTER = "builtin"
+        self.registry = mock.patch.object(ComponentRegistry, "_registry", {})
+        self.registry.start()
+
+    def tearDown(self) -> None:
+        self.registry.stop()
+        settings.FORMATTER = self.formatter
+        self.directory.cleanup()
+
+    def record(self) -> TraceRecorder:
+        """Records creating and writing an app of two screens."""
+        with TraceRecorder() as recorder:
+            RootComponent(
+                component_name="Home", children=[View(children=[Text(text="home")])]
+            )
+            ContextWrapper().wrap(View(children=[Text(text="app")]))
+            Build.write_files(use_cache=False, output_dir=self.directory.name)
+        self.assertEqual(tracer.hooks, ())
+        return recorder
+
+    def test_phases(self):
+        events = {(phase, screen) for phase, screen, *_ in self.record().events}
+        self.assertLessEqual(
+            {
+                ("collect", "Home"),
+                ("wrap", None),
+                ("write_files", None),
+                ("serialize", "Home"),
+                ("template", "Home"),
+                ("write", "Home"),
+                ("format", "Home"),
+                ("format", "App"),
+            },
+            events,
+        )
+
+    def test_chrome_trace(self):
+        path = os.path.join(self.directory.name, "trace.json")
+        recorder = self.record()
+        recorder.dump(path)
+        with open(path, encoding="utf-8") as file:
+            events = json.load(file)["traceEvents"]
+        self.assertEqual(len(events), len(recorder.events))
+        build = next(event for event in events if event["name"] == "write_files")
+        write = next(event for event in events if event["name"] == "write Home")
+        self.assertEqual((write["ph"], write["args"]), ("X", {"screen": "Home"}))
+        self.assertGreaterEqual(write["ts"], build["ts"])
+        self.assertLessEqual(write["ts"] + write["dur"], build["ts"] + build["dur"])
+
+    def test_summary(self):
+        lines = self.record().summary(screens=2).splitlines()
+        self.assertEqual(lines[0].split()[:3], ["phase", "calls", "total"])
+        self.assertEqual(lines[1].split()[:2], ["write_files", "1"])
+        self.assertEqual(lines[-3].split(), ["screen", "phase", "total", "ms"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Unittests for interned leaf components."""
+import pickle
+import unittest
+
+from sweetpotato.components import Image, Text, View
+from sweetpotato.core.base_management import State
+from sweetpotato.core.interning import LeafPool
+from sweetpotato.core.tracking import SHARED
+
+
+class TestInterning(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up leaf pool."""
+        self.pool = LeafPool()
+
+    def test_identical_leaves_shared(self):
+        dash = self.pool.intern(Text(text="—"))
+        self.assertIs(self.pool.intern(Text(text="—")), dash)
+        leaves = [self.pool.intern(Text(text="-")), self.pool.intern(Image(source={}))]
+        self.assertNotIn(dash, leaves)
+        self.assertEqual(len(self.pool), 3)
+        del dash, leaves
+        self.assertEqual(len(self.pool), 0)
+
+    def test_attrs_distinguished(self):
+        first = self.pool.intern(Text(text="1", numberOfLines=1))
+        self.assertIsNot(self.pool.intern(Text(text="1", numberOfLines=True)), first)
+        self.assertIs(self.pool.intern(Text(text="1", numberOfLines=1)), first)
+
+    def test_render(self):
+        dash = self.pool.intern(Text(text="—"))
+        rows = [View(children=[dash, Text(text="row")]) for _ in range(3)]
+        root = View(children=[*rows, dash])
+        rendition = "<View >" + "<View ><Text >—</Text><Text >row</Text></View>" * 3
+        self.assertEqual(repr(root), rendition + "<Text >—</Text></View>")
+        self.assertIs(dash._container, SHARED)
+
+    def test_mutation_rejected(self):
+        dash = self.pool.intern(Text(text="—"))
+        with self.assertRaises(TypeError):
+            dash._attrs["numberOfLines"] = 1
+        with self.assertRaises(TypeError):
+            dash.component_name = "Label"
+        with self.assertRaises(TypeError):
+            dash.invalidate()
+        self.assertEqual(repr(dash), "<Text >—</Text>")
+
+    def test_nested_mutation_rejected(self):
+        style = {"height": 1, "transform": [{"scale": 2}]}
+        separator = self.pool.intern(View(style=style))
+        rendition = repr(separator)
+        style["height"] = 2
+        for mutate in (
+            lambda: separator._attrs["style"].update(height=2),
+            lambda: separator._attrs["style"]["transform"].append({"rotate": "90deg"}),
+            lambda: separator._attrs["style"]["transform"][0].clear(),
+        ):
+            with self.assertRaises(TypeError):
+                mutate()
+        self.assertEqual(repr(View(children=[separator])), f"<View >{rendition}</View>")
+        copy = pickle.loads(pickle.dumps(separator._attrs["style"]))
+        self.assertEqual(copy, {"height": 1, "transform": [{"scale": 2}]})
+        with self.assertRaises(TypeError):
+            copy["transform"].pop()
+
+    def test_childless_composite(self):
+        separator = self.pool.intern(View(style={"height": 1}))
+        self.assertIs(self.pool.intern(View(style={"height": 1})), separator)
+        with self.assertRaises(AttributeError):
+            separator._children.append(Text(text="—"))
+        self.assertEqual(
+            repr(View(children=[separator])), f"<View >{separator!r}</View>"
+        )
+
+    def test_removed_from_composite(self):
+        dash = self.pool.intern(Text(text="—"))
+        row = View(children=[dash, dash])
+        row._children.pop()
+        self.assertEqual(repr(row), "<View ><Text >—</Text></View>")
+
+    def test_rejected(self):
+        with self.assertRaises(ValueError):
+            self.pool.intern(View(children=[Text(text="—")]))
+        with self.assertRaises(ValueError):
+            self.pool.intern(Text(text="—", state=State({"count": 0})))
+        text = Text(text="—")
+        View(children=[text])
+        with self.assertRaises(ValueError):
+            self.pool.intern(text)
+
+    def test_pickle(self):
+        dash = self.pool.intern(Text(text="—"))
+        rows = pickle.loads(pickle.dumps([dash, dash]))
+        self.assertIs(rows[0], rows[1])
+        with self.assertRaises(TypeError):
+            rows[0].invalidate()
+
+
+if __name__ == "__main__":
+    unittest.main()
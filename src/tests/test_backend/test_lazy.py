@@ -0,0 +1,85 @@
+"""Unittests for lazy children."""
+import gc
+import os
+import tempfile
+import tracemalloc
+import unittest
+
+from sweetpotato.components import Image, Text, View
+from sweetpotato.core.base import RootComponent
+from sweetpotato.core.build import Build
+from sweetpotato.core.output import OutputWriter
+from sweetpotato.core.renderer import Renderer
+
+
+def rows(count: int):
+    """Yields Text components, as a data source would."""
+    for index in range(count):
+        yield Text(text=f"row {index}")
+
+
+class TestLazyChildren(unittest.TestCase):
+    def test_generator(self):
+        view = View(children=rows(2))
+        self.assertEqual(
+            repr(view), "<View ><Text >row 0</Text><Text >row 1</Text></View>"
+        )
+        self.assertIsNone(view._render_cache)
+        with self.assertRaises(RuntimeError):
+            repr(view)
+
+    def test_factory(self):
+        data = ["a"]
+        view = View(children=lambda: (Text(text=text) for text in data))
+        parent = View(children=[view])
+        self.assertEqual(repr(parent), "<View ><View ><Text >a</Text></View></View>")
+        data.append("b")
+        self.assertIn("<Text >b</Text>", repr(parent))
+        self.assertIsNone(parent._render_cache)
+
+    def test_streamed(self):
+        buffer = []
+        Renderer(buffer).render(View(children=rows(3)))
+        self.assertEqual(len(buffer), 5)
+
+    def test_imports_collected_while_streaming(self):
+        lazy = View(children=lambda: [Image(source={"uri": "a.png"})])
+        children = [View(children=[lazy])]
+        root = RootComponent(component_name="LazyImports", children=children)
+        self.assertTrue(root.is_lazy)
+        self.assertEqual(root._imports["react-native"], {"View"})
+        repr(root._children[0])
+        self.assertEqual(root._imports["react-native"], {"View", "Image"})
+        repr(root._children[0])
+        self.assertEqual(len(root._variables), 2)
+
+    def test_bounded_memory(self):
+        with open(os.devnull, "w", encoding="utf-8") as sink:
+            peaks = []
+            for count in (5_000, 50_000):
+                root = RootComponent(
+                    component_name=f"Lazy{count}", children=[View(children=rows(count))]
+                )
+                gc.collect()
+                tracemalloc.start()
+                try:
+                    Renderer(sink).render_children(root._children)
+                    peaks.append(tracemalloc.get_traced_memory()[1])
+                finally:
+                    tracemalloc.stop()
+        self.assertLess(peaks[1], 2 * peaks[0])
+
+    def test_write_screen(self):
+        with tempfile.TemporaryDirectory() as directory:
+            os.makedirs(os.path.join(directory, "src", "components"))
+            children = (Image(source={"uri": f"{index}.png"}) for index in range(3))
+            root = RootComponent(component_name="LazyScreen", children=children)
+            Build._write_lazy_screen("LazyScreen", root, OutputWriter(directory))
+            with open(os.path.join(directory, root.package), encoding="utf-8") as file:
+                screen = file.read()
+        self.assertIn('import {Image} from "react-native"', screen)
+        self.assertEqual(screen.count("<Image "), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Unittests for the memory footprint of component trees."""
+import gc
+import pickle
+import tracemalloc
+import unittest
+
+from sweetpotato.components import View, Text
+from sweetpotato.core.base import RootComponent
+from sweetpotato.core.base_management import EMPTY_PROPS, EMPTY_STATE, State
+from sweetpotato.mixins import CustomMixin
+from sweetpotato.navigation import create_native_stack_navigator
+
+
+def catalogue(nodes: int) -> View:
+    """Returns a tree of rows holding nine Text components each."""
+    rows = []
+    for _ in range(nodes // 10):
+        rows.append(View(children=[Text(text="leaf") for _ in range(9)]))
+    return View(children=rows)
+
+
+class CustomComponent(RootComponent, CustomMixin):
+    """Custom component setting an attribute of its own."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.screen_count = 1
+
+
+class TestMemory(unittest.TestCase):
+    nodes: int = 20_000
+    #: Allocated bytes per node of :func:`catalogue`, around 410 before memoization,
+    #: 640 with memoization and an instance dictionary per node and 350 once slotted.
+    bytes_per_node: int = 400
+
+    def test_bytes_per_node(self):
+        catalogue(100)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            tree = catalogue(self.nodes)
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+        self.assertLess(allocated / self.nodes, self.bytes_per_node)
+        self.assertEqual(len(tree._children), self.nodes // 10)
+
+    def test_slotted(self):
+        for component in (View(), Text(text="leaf")):
+            self.assertFalse(hasattr(component, "__dict__"))
+            with self.assertRaises(AttributeError):
+                component.undeclared = True
+
+    def test_shared_defaults(self):
+        text = Text(text="leaf")
+        self.assertIs(text._state, EMPTY_STATE)
+        self.assertIs(text._props, EMPTY_PROPS)
+        with self.assertRaises(TypeError):
+            text._state.values["count"] = 1
+        with self.assertRaises(TypeError):
+            text._state.values = {"count": 1}
+        self.assertIs(pickle.loads(pickle.dumps(text))._state, EMPTY_STATE)
+
+    def test_custom_component(self):
+        component = CustomComponent(component_name="Custom", children=[View()])
+        self.assertEqual(component.screen_count, 1)
+        self.assertEqual(repr(component), "<Custom />")
+
+    def test_screen_without_state(self):
+        stack = create_native_stack_navigator()
+        stack.screen("Home", children=[View()])
+        self.assertIs(stack._children[-1]._state, EMPTY_STATE)
+        self.assertIn("Stack.Screen", repr(stack))
+
+    def test_own_state(self):
+        state = State({"count": 0})
+        text = Text(text="leaf", state=state)
+        state.values["count"] = 1
+        self.assertIn("count={this.state.count}", repr(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
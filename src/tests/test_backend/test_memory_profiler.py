@@ -0,0 +1,109 @@
+"""Unittests for memory profiling of builds."""
+import io
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from unittest import mock
+
+from sweetpotato.components import Text, View
+from sweetpotato.config import settings
+from sweetpotato.core.base import ComponentRegistry, RootComponent
+from sweetpotato.core.build import Build
+from sweetpotato.core.context_wrappers import ContextWrapper
+from sweetpotato.core.instrumentation import tracer
+from sweetpotato.core.memory import MemoryProfiler
+
+
+class TestMemoryProfiler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Profile creating and writing an app of a catalogue screen, in an empty registry."""
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.formatter, cls.folder = settings.FORMATTER, settings.RENDER_CACHE_FOLDER
+        settings.FORMATTER = "builtin"
+        settings.RENDER_CACHE_FOLDER = cls.directory.name
+        with mock.patch.object(ComponentRegistry, "_registry", {}):
+            with MemoryProfiler() as cls.profiler:
+                catalogue = [
+                    View(children=[Text(text=f"item {index}")]) for index in range(50)
+                ]
+                RootComponent(component_name="Catalogue", children=catalogue)
+                ContextWrapper().wrap(View(children=[Text(text="app")]))
+                Build.write_files(use_cache=False, output_dir=cls.directory.name)
+            cls.components = cls.profiler.components()
+            cls.report = json.loads(json.dumps(cls.profiler.report(limit=3)))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        settings.FORMATTER, settings.RENDER_CACHE_FOLDER = cls.formatter, cls.folder
+        cls.directory.cleanup()
+
+    def test_stopped(self):
+        self.assertEqual(tracer.hooks, ())
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_phases(self):
+        profiler = self.profiler
+        calls, peak, retained = profiler.phases["write_files"]
+        self.assertEqual(calls, 1)
+        self.assertGreater(peak, 0)
+        self.assertGreaterEqual(peak, retained)
+        self.assertGreaterEqual(peak, profiler.phases["write"][1])
+        self.assertIn(("collect", "Catalogue"), profiler.screens)
+        self.assertIn(("write", "Catalogue"), profiler.screens)
+        self.assertLessEqual(
+            {"start", "wrap", "write_files", "end"}, set(profiler.snapshots)
+        )
+
+    def test_components(self):
+        components = self.components
+        self.assertEqual(components["components.Text"]["count"], 51)
+        self.assertEqual(components["components.View"]["count"], 51)
+        self.assertEqual(components["core.base.RootComponent"]["count"], 1)
+        self.assertGreater(components["components.View"]["rendered"], 0)
+
+    def test_sites(self):
+        sites = self.profiler.sites(limit=5)
+        self.assertLessEqual(len(sites), 5)
+        self.assertTrue(sites)
+        for site in sites:
+            self.assertTrue(site["file"].startswith("sweetpotato"), site)
+        self.assertEqual(sites, sorted(sites, key=lambda site: -site["bytes"]))
+
+    def test_report(self):
+        report = self.report
+        self.assertEqual(report["registry"]["screens"], 2)
+        self.assertEqual(report["registry"]["components"], 105)
+        self.assertLessEqual(len(report["screens"]), 3)
+        self.assertLessEqual(report["traced"]["end"], report["traced"]["peak"])
+        self.assertIn("write_files", report["sites"])
+
+    def test_write_files(self):
+        registry = mock.patch.object(ComponentRegistry, "_registry", {})
+        with registry, mock.patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            catalogue = [
+                View(children=[Text(text=f"item {index}")]) for index in range(20)
+            ]
+            RootComponent(component_name="Catalogue", children=catalogue)
+            Build.write_files(
+                use_cache=False, output_dir=self.directory.name, profile_memory=True
+            )
+        path = os.path.join(self.directory.name, "memory.json")
+        with open(path, encoding="utf-8") as file:
+            self.assertEqual(json.load(file)["phases"]["write_files"]["calls"], 1)
+        lines = stdout.getvalue().splitlines()
+        self.assertEqual(
+            lines[2].split(), ["phase", "calls", "peak", "MB", "retained", "MB"]
+        )
+        self.assertEqual(lines[-1], f"Memory profile written to {path}.")
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(self.directory.name, "src", "components", "Catalogue.js")
+            )
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Unittests for the built-in formatter, against golden files written by hand from prettier's rules."""
+import os
+import unittest
+
+from sweetpotato.core.doc import (
+    LINE,
+    SOFTLINE,
+    Fill,
+    Group,
+    IfBreak,
+    Indent,
+    join,
+    print_doc,
+)
+from sweetpotato.core.pretty import FormatError, format_source
+
+GOLDEN = os.path.join(os.path.dirname(__file__), "golden")
+
+
+class TestDoc(unittest.TestCase):
+    def array(self, items: list[str]) -> Group:
+        return Group(
+            [
+                "[",
+                Indent([SOFTLINE, join([",", LINE], items)]),
+                IfBreak(","),
+                SOFTLINE,
+                "]",
+            ]
+        )
+
+    def test_group(self):
+        self.assertEqual(print_doc(self.array(["a", "b"])), "[a, b]")
+        self.assertEqual(
+            print_doc(self.array(["a" * 40, "b" * 40])),
+            f"[\n  {'a' * 40},\n  {'b' * 40},\n]",
+        )
+
+    def test_fill(self):
+        words = join(LINE, ["word"] * 20)
+        self.assertEqual(
+            print_doc(Fill(words), width=20),
+            "word word word word\n" * 4 + "word word word word",
+        )
+
+
+class TestPretty(unittest.TestCase):
+    def test_golden(self):
+        """Generated screens are formatted as the golden files, formatting twice changes nothing."""
+        for name in sorted(os.listdir(GOLDEN)):
+            if not name.endswith(".in.js"):
+                continue
+            with self.subTest(name=name):
+                with open(os.path.join(GOLDEN, name), encoding="utf-8") as file:
+                    source = file.read()
+                with open(
+                    os.path.join(GOLDEN, name.replace(".in.js", ".js")),
+                    encoding="utf-8",
+                ) as file:
+                    golden = file.read()
+                self.assertEqual(format_source(source), golden)
+                self.assertEqual(format_source(golden), golden)
+
+    def test_strings(self):
+        self.assertEqual(format_source("a = 'it\\'s'"), 'a = "it\'s";\n')
+        self.assertEqual(format_source("a = 'say \"hi\"'"), "a = 'say \"hi\"';\n")
+        self.assertEqual(
+            format_source("a = {'b-c': 1.50, 'd': .5}"), 'a = { "b-c": 1.5, d: 0.5 };\n'
+        )
+
+    def test_jsx_text(self):
+        self.assertEqual(
+            format_source("<Text >Hi {name}!</Text>"), "<Text>Hi {name}!</Text>;\n"
+        )
+        self.assertEqual(
+            format_source("<Text >{a} and {b}</Text>"),
+            "<Text>\n  {a} and {b}\n</Text>;\n",
+        )
+
+    def test_statements(self):
+        self.assertEqual(
+            format_source("f(i => i, async x=>x)"), "f((i) => i, async (x) => x);\n"
+        )
+        self.assertEqual(
+            format_source("outer: for (const a of b) { break outer; }"),
+            "outer: for (const a of b) {\n  break outer;\n}\n",
+        )
+
+    def test_invalid(self):
+        for source in ("f(", "<View>", "a = 'b", "}"):
+            with self.subTest(source=source), self.assertRaises(FormatError):
+                format_source(source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,166 @@
+"""Unittests for RenderCache class."""
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from sweetpotato.components import View, Text
+from sweetpotato.config import settings
+from sweetpotato.core.render_cache import RenderCache, structural_hash
+
+
+class Color:
+    """Attribute type with the default repr, holding a memory address."""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+
+class ColoredView(View):
+    """View formatting colors."""
+
+
+@ColoredView.register_formatter(Color)
+def format_color(_, attr: Color, key: str) -> str:
+    return f"{key}={{'{attr.value}'}}"
+
+
+def screen(text: str = "leaf", rows: int = 20) -> View:
+    """Returns a screen with a large subtree."""
+    return View(
+        children=[
+            View(children=[Text(text=text) for _ in range(rows)]),
+            Text(text="footer"),
+        ]
+    )
+
+
+class TestStructuralHash(unittest.TestCase):
+    def test_equal_structure(self):
+        self.assertEqual(structural_hash(screen()), structural_hash(screen()))
+        self.assertEqual(structural_hash(screen())[1], 23)
+
+    def test_different_structure(self):
+        self.assertNotEqual(structural_hash(screen()), structural_hash(screen("other")))
+        component = screen()
+        digest = structural_hash(component)
+        component._children[0]._children[0]._attrs["testID"] = "leaf"
+        self.assertNotEqual(structural_hash(component), digest)
+
+    def test_unstable_repr(self):
+        component = screen()
+        component._children[0]._attrs["testID"] = {"color": Color("red")}
+        with self.assertRaises(ValueError):
+            structural_hash(component)
+        component._children[0]._attrs["testID"] = {"color": ("red", 1.5, None)}
+        self.assertEqual(structural_hash(component)[1], 23)
+
+    def test_class_code(self):
+        def card(label: str) -> type:
+            class Card(View):
+                """View rendering a label before its children."""
+
+                def _render_parts(self) -> list:
+                    return [label, *super()._render_parts()]
+
+            return Card
+
+        first, second = card("first"), card("first")
+        self.assertEqual(structural_hash(first()), structural_hash(second()))
+        edited = type("Card", (View,), {"_render_parts": lambda self: ["edited"]})
+        edited.__qualname__ = first.__qualname__
+        self.assertNotEqual(structural_hash(first()), structural_hash(edited()))
+
+    def test_stable_across_processes(self):
+        code = (
+            "from tests.test_backend.test_render_cache import screen;"
+            "from sweetpotato.core.render_cache import structural_hash;"
+            "print(structural_hash(screen())[0])"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[2],
+            env=os.environ | {"PYTHONHASHSEED": "1"},
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(output.stdout.strip(), structural_hash(screen())[0])
+
+
+class TestRenderCache(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up cache in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = RenderCache(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        self.assertIsNone(self.cache.get("ab" * 32))
+        self.cache.put("ab" * 32, "<View />")
+        self.assertEqual(self.cache.get("ab" * 32), "<View />")
+
+    def test_render(self):
+        component = screen()
+        self.assertEqual(self.cache.render([component]), repr(screen()))
+        self.assertEqual(self.cache.get(self.cache.key(screen())), repr(component))
+        self.assertIsNone(self.cache.get(self.cache.key(component._children[0])))
+
+    def test_stream(self):
+        buffer = []
+        self.cache.stream([screen()], buffer)
+        self.assertGreater(len(buffer), 1)
+        self.assertEqual("".join(buffer), repr(screen()))
+        self.assertEqual(self.cache.get(self.cache.key(screen())), repr(screen()))
+        buffer = []
+        self.cache.stream([screen()], buffer)
+        self.assertEqual(buffer, [repr(screen())])
+
+    def test_served_from_cache(self):
+        self.cache.put(self.cache.key(screen()), "<Cached/>")
+        self.assertEqual(self.cache.render([screen()]), "<Cached/>")
+
+    def test_deep_tree_stored_once(self):
+        component = Text(text="leaf")
+        for _ in range(2000):
+            component = View(children=[component])
+        buffer = []
+        self.cache.stream([component], buffer)
+        self.assertEqual(len(list(self.cache._entries())), 1)
+        self.assertEqual("".join(buffer), self.cache.get(self.cache.key(component)))
+
+    def test_unstable_repr_not_cached(self):
+        component = ColoredView(style=Color("red"), children=[screen()])
+        self.assertEqual(self.cache.render([component]), repr(component))
+        self.assertEqual(list(self.cache._entries()), [])
+
+    def test_key_includes_settings(self):
+        key = self.cache.key(screen())
+        settings.USE_NAVIGATION = True
+        try:
+            self.assertNotEqual(RenderCache(self.directory.name).key(screen()), key)
+        finally:
+            settings.USE_NAVIGATION = False
+
+    def test_eviction(self):
+        cache = RenderCache(self.directory.name, max_bytes=1000)
+        for index in range(20):
+            cache.put(f"{index:064x}", "x" * 100)
+            os.utime(cache._path(f"{index:064x}"), ns=(index, index))
+        self.assertLessEqual(sum(e.stat().st_size for e in cache._entries()), 1000)
+        self.assertIsNone(cache.get(f"{0:064x}"))
+        self.assertIsNotNone(cache.get(f"{19:064x}"))
+
+    def test_no_cache(self):
+        self.assertTrue(RenderCache.enabled())
+        with mock.patch.object(sys, "argv", ["app.py", "--no-cache"]):
+            self.assertFalse(RenderCache.enabled())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+"""Unittests for Renderer class."""
+import io
+import tempfile
+import unittest
+
+from sweetpotato.components import View, Text, Image
+from sweetpotato.core.renderer import Renderer, render
+
+
+class TestRenderer(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up component tree."""
+        self.component = View(
+            style={"flex": 1},
+            children=[
+                Text(text="Hello"),
+                View(children=[Image(source={"uri": "a.png"}), Text(text="World")]),
+            ],
+        )
+        self.component_repr = (
+            "<View style={{'flex': 1}} ><Text >Hello</Text><View >"
+            "<Image source={{'uri': 'a.png'}} /><Text >World</Text></View></View>"
+        )
+
+    def test_repr(self):
+        self.assertEqual(repr(self.component), self.component_repr)
+
+    def test_children(self):
+        self.assertEqual(
+            self.component.children,
+            self.component_repr[len("<View style={{'flex': 1}} >") : -len("</View>")],
+        )
+
+    def test_list_sink(self):
+        buffer = []
+        Renderer(buffer).render(self.component)
+        self.assertGreater(len(buffer), 1)
+        self.assertEqual("".join(buffer), self.component_repr)
+
+    def test_string_io_sink(self):
+        sink = io.StringIO()
+        render(self.component, sink)
+        self.assertEqual(sink.getvalue(), self.component_repr)
+
+    def test_file_sink(self):
+        with tempfile.TemporaryFile("w+", encoding="utf-8") as file:
+            Renderer(file).render(self.component)
+            file.seek(0)
+            self.assertEqual(file.read(), self.component_repr)
+
+    def test_custom_repr(self):
+        class Custom(View):
+            def __repr__(self) -> str:
+                return "<Custom/>"
+
+        component = View(children=[Custom(children=[Text(text="ignored")])])
+        self.assertEqual(render(component), "<View ><Custom/></View>")
+
+    def test_custom_repr_extending_base(self):
+        class Fancy(View):
+            def __repr__(self) -> str:
+                return "{/*x*/}" + super().__repr__()
+
+        fancy = Fancy(children=[Text(text="a")])
+        self.assertEqual(repr(fancy), "{/*x*/}<Fancy ><Text >a</Text></Fancy>")
+        component = View(children=[fancy])
+        for _ in range(2):
+            self.assertEqual(
+                repr(component), "<View >{/*x*/}<Fancy ><Text >a</Text></Fancy></View>"
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
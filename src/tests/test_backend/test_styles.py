@@ -0,0 +1,94 @@
+"""Unittests for hoisted styles."""
+import unittest
+
+from sweetpotato.components import StyleSheet, Text, View
+from sweetpotato.config import settings
+from sweetpotato.core.base import RootComponent
+from sweetpotato.core.styles import declare, style_name
+
+
+class TestStyles(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up style sheet, with styles hoisted."""
+        self.hoist, settings.HOIST_STYLES = settings.HOIST_STYLES, True
+        self.styles = StyleSheet.create(
+            {"row": {"flexDirection": "row"}, "title": {"fontSize": 20}}
+        )
+
+    def tearDown(self) -> None:
+        settings.HOIST_STYLES = self.hoist
+
+    def test_referenced_by_name(self):
+        view = View(style=self.styles.row)
+        name = style_name({"flexDirection": "row"})
+        self.assertEqual(view.attrs.strip(), f"style={{styles.{name}}}")
+        self.assertEqual(style_name({"b": 1, "a": 2}), style_name({"a": 2, "b": 1}))
+
+    def test_declared_once_per_screen(self):
+        rows = [
+            View(
+                style={"flexDirection": "row"},
+                children=[Text(text=str(index), style=self.styles.title)],
+            )
+            for index in range(3)
+        ]
+        root = RootComponent(component_name="StyledScreen", children=rows)
+        variables = root.serialize(rendered=False)["variables"]
+        self.assertEqual(variables.count("StyleSheet.create"), 1)
+        self.assertEqual(variables.count(style_name(self.styles.row)), 1)
+        self.assertIn('"fontSize": 20', variables)
+        self.assertIn("StyleSheet", root._imports["react-native"])
+
+    def test_unhoisted(self):
+        self.assertEqual(declare([]), "")
+        self.assertIsNone(style_name({"transform": {1, 2}}))
+        view = View(style={"transform": {1, 2}})
+        self.assertEqual(view.attrs.strip(), "style={{'transform': {1, 2}}}")
+        settings.HOIST_STYLES = False
+        children = [View(style={"flex": 1})]
+        root = RootComponent(component_name="Unstyled", children=children)
+        self.assertIn("style={{'flex': 1}}", root.children)
+        self.assertNotIn("StyleSheet", root.serialize()["variables"])
+
+    def test_flatten(self):
+        base = self.styles.row
+        nested = [base, None, [{"flexDirection": "column"}, False], {"margin": 1}]
+        self.assertEqual(
+            StyleSheet.flatten(nested), {"flexDirection": "column", "margin": 1}
+        )
+        self.assertIs(StyleSheet.flatten(base), base)
+        self.assertEqual(StyleSheet.flatten(None), {})
+        with self.assertRaises(TypeError):
+            StyleSheet.flatten([1])
+
+    def test_compose_memoized(self):
+        override = {"flexDirection": "column"}
+        composed = StyleSheet.compose(self.styles.row, override)
+        self.assertEqual(composed, override)
+        self.assertIs(StyleSheet.compose(self.styles.row, override), composed)
+        self.assertIsNot(StyleSheet.compose(self.styles.row, dict(override)), composed)
+
+    def test_list_style_hoisted(self):
+        items = [
+            Text(text=str(index), style=[self.styles.title, {"color": "red"}])
+            for index in range(2)
+        ]
+        root = RootComponent(component_name="ListStyled", children=items)
+        name = style_name({"fontSize": 20, "color": "red"})
+        self.assertEqual(root.children.count(f"style={{styles.{name}}}"), 2)
+        self.assertEqual(root.serialize()["variables"].count(name), 1)
+        with self.assertRaises(AttributeError):
+            View(testID=["a"]).attrs
+
+    def test_lazy_collected(self):
+        rows = lambda: (View(style={"flex": index}) for index in range(2))
+        root = RootComponent(
+            component_name="LazyStyled", children=[View(children=rows)]
+        )
+        content = root.serialize()
+        self.assertIn(style_name({"flex": 1}), content["children"])
+        self.assertIn(style_name({"flex": 1}), root.serialize()["variables"])
+
+
+if __name__ == "__main__":
+    unittest.main()
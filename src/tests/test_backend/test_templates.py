@@ -0,0 +1,44 @@
+"""Unittests for compiled templates."""
+import unittest
+
+from sweetpotato.config import settings
+from sweetpotato.core.templates import Template, compile_template
+
+
+class TestTemplate(unittest.TestCase):
+    def test_fill(self):
+        template = Template("export default function <NAME>() { return (<CHILDREN>); }")
+        self.assertEqual(template.slots, ("NAME", "CHILDREN"))
+        self.assertEqual(
+            template.fill({"NAME": "App", "CHILDREN": "<View />"}),
+            "export default function App() { return (<View />); }",
+        )
+
+    def test_values_not_substituted(self):
+        template = Template("<STATE>;<CHILDREN>")
+        values = {"STATE": "{}", "CHILDREN": "<Text><STATE></Text>"}
+        self.assertEqual(template.fill(values), "{};<Text><STATE></Text>")
+
+    def test_unknown_placeholders_kept(self):
+        template = Template("<View><CHILDREN></View>")
+        self.assertEqual(template.fill({"CHILDREN": "<FOO>"}), "<View><FOO></View>")
+        self.assertEqual(template.fill({}), "<View><CHILDREN></View>")
+
+    def test_not_exported(self):
+        template = Template("export default class <NAME>", exported=False)
+        self.assertEqual(template.fill({"NAME": "default"}), "export  class default")
+
+    def test_parts(self):
+        children = [object()]
+        template = Template("<NAME><CHILDREN>;")
+        parts = list(template.parts({"NAME": "App", "CHILDREN": children}))
+        self.assertEqual(parts, ["App", children, ";"])
+
+    def test_cached(self):
+        template = compile_template(settings.APP_REPR)
+        self.assertIs(compile_template(settings.APP_REPR), template)
+        self.assertIsNot(compile_template(settings.APP_REPR, False), template)
+
+
+if __name__ == "__main__":
+    unittest.main()
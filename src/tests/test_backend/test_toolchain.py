@@ -0,0 +1,97 @@
+"""Unittests for toolchain detection."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from sweetpotato.components import Text
+from sweetpotato.core import toolchain
+from sweetpotato.core.base import ComponentRegistry, RootComponent
+from sweetpotato.core.build import Build
+from sweetpotato.core.toolchain import Toolchain
+
+
+class TestToolchain(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up a `PATH` holding a fake npm."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.bin = os.path.join(self.directory.name, "bin")
+        os.mkdir(self.bin)
+        self.npm = self.install("npm")
+        self.environ = mock.patch.dict(os.environ, {"PATH": self.bin})
+        self.environ.start()
+        self.cache = os.path.join(self.directory.name, "cache", "toolchain.json")
+
+    def tearDown(self) -> None:
+        self.environ.stop()
+        self.directory.cleanup()
+
+    def install(self, name: str) -> str:
+        """Creates an executable in the `PATH` directory, changing its modification time."""
+        path = os.path.join(self.bin, name)
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("#!/bin/sh\n")
+        os.chmod(path, 0o755)
+        mtime = os.stat(self.bin).st_mtime_ns + 10**9
+        os.utime(self.bin, ns=(mtime, mtime))
+        return path
+
+    def resolve(self) -> tuple[dict, list]:
+        """Resolves npm and expo, returning the paths and the tools looked up on `PATH`."""
+        with mock.patch.object(toolchain, "which", wraps=toolchain.which) as which:
+            paths = Toolchain(self.cache).resolve(["npm", "expo"])
+        return paths, sorted(call.args[0] for call in which.call_args_list)
+
+    def test_cached(self):
+        self.assertEqual(
+            self.resolve(), ({"npm": self.npm, "expo": None}, ["expo", "npm"])
+        )
+        self.assertEqual(self.resolve(), ({"npm": self.npm, "expo": None}, []))
+
+    def test_invalidated(self):
+        self.resolve()
+        mtime = os.stat(self.npm).st_mtime_ns + 10**9
+        os.utime(self.npm, ns=(mtime, mtime))
+        self.assertEqual(self.resolve()[1], ["npm"])
+        expo = self.install("expo")
+        self.assertEqual(self.resolve(), ({"npm": self.npm, "expo": expo}, ["expo"]))
+        with mock.patch.dict(
+            os.environ, {"PATH": os.pathsep.join([self.bin, os.curdir])}
+        ):
+            self.assertEqual(self.resolve()[1], ["expo", "npm"])
+
+    def test_shadowed(self):
+        self.resolve()
+        first = os.path.join(self.directory.name, "first")
+        os.mkdir(first)
+        with mock.patch.dict(os.environ, {"PATH": os.pathsep.join([first, self.bin])}):
+            self.assertEqual(self.resolve()[0]["npm"], self.npm)
+            self.bin, shadowed = first, self.npm
+            npm = self.install("npm")
+            self.assertEqual(
+                self.resolve(), ({"npm": npm, "expo": None}, ["expo", "npm"])
+            )
+            self.assertNotEqual(npm, shadowed)
+
+    def test_write_files_skips_detection(self):
+        with mock.patch.object(ComponentRegistry, "_registry", {}), mock.patch.object(
+            toolchain, "which"
+        ) as which:
+            RootComponent(component_name="Detected", children=[Text(text="detected")])
+            build = Build()
+            with tempfile.TemporaryDirectory() as project:
+                build.write_files(use_cache=False, output_dir=project)
+        which.assert_not_called()
+
+    def test_require(self):
+        build = Build(["npm", "expo"])
+        with mock.patch(
+            "sweetpotato.core.toolchain.Toolchain", lambda: Toolchain(self.cache)
+        ), mock.patch.object(Build, "_install_dependency", return_value=False):
+            with self.assertRaisesRegex(ImportError, "expo"):
+                build.require()
+            self.assertEqual(build.require(["npm"]), {"npm": self.npm})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Unittests for memoized renditions and their invalidation."""
+import pickle
+import unittest
+
+from sweetpotato.components import View, Text
+from sweetpotato.core.base_management import State
+
+
+class TestMemoization(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up component tree."""
+        self.state = State({"count": 0})
+        self.leaf = Text(text="leaf", state=self.state)
+        self.sibling = Text(text="sibling")
+        self.branch = View(children=[self.leaf])
+        self.root = View(children=[self.branch, self.sibling])
+        self.root_repr = (
+            "<View ><View ><Text count={this.state.count}>leaf</Text></View>"
+            "<Text >sibling</Text></View>"
+        )
+        self.assertEqual(repr(self.root), self.root_repr)
+
+    def test_memoized(self):
+        for component in (self.root, self.branch, self.leaf, self.sibling):
+            self.assertIsNotNone(component._render_cache)
+
+    def test_path_invalidated(self):
+        self.leaf._attrs["testID"] = "leaf"
+        for component in (self.root, self.branch, self.leaf):
+            self.assertIsNone(component._render_cache)
+        self.assertIsNotNone(self.sibling._render_cache)
+        self.assertIn("testID={`leaf`}", repr(self.root))
+
+    def test_children_changed(self):
+        self.branch._children.append(Text(text="new"))
+        self.assertEqual(
+            repr(self.root),
+            self.root_repr.replace(
+                "</Text></View>", "</Text><Text >new</Text></View>", 1
+            ),
+        )
+        self.branch._children.pop()
+        self.assertEqual(repr(self.root), self.root_repr)
+
+    def test_state_changed(self):
+        self.state.values["total"] = 1
+        self.assertIn("total={this.state.total}", repr(self.root))
+
+    def test_names_changed(self):
+        self.branch.component_name = "Layout"
+        self.assertTrue(repr(self.root).startswith("<View ><Layout >"))
+
+    def test_shared_child(self):
+        other = View(children=[self.branch])
+        self.assertEqual(repr(other), f"<View >{repr(self.branch)}</View>")
+        self.leaf._attrs["testID"] = "leaf"
+        self.assertIsNone(self.root._render_cache)
+        self.assertIsNone(other._render_cache)
+
+    def test_invalidate(self):
+        style = {"flex": 1}
+        self.sibling._attrs["style"] = style
+        repr(self.root)
+        style["flex"] = 2
+        self.sibling.invalidate()
+        self.assertIn("{'flex': 2}", repr(self.root))
+
+    def test_pickle(self):
+        root = pickle.loads(pickle.dumps(self.root))
+        self.assertEqual(repr(root), self.root_repr)
+        root._children[1]._attrs["testID"] = "copy"
+        self.assertIn("testID={`copy`}", repr(root))
+        root._children[0]._children[0]._state.values["total"] = 1
+        self.assertIn("total={this.state.total}", repr(root))
+
+
+if __name__ == "__main__":
+    unittest.main()
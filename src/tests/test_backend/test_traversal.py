@@ -0,0 +1,51 @@
+"""Unittests for traversal utilities."""
+import sys
+import unittest
+
+from sweetpotato.components import View, Text
+from sweetpotato.core.base import RootComponent
+from sweetpotato.core.traversal import preorder, unfold
+
+
+class TestTraversal(unittest.TestCase):
+    def test_preorder(self):
+        tree = [(1, [(2, [(3, [])]), (4, [])]), (5, [])]
+        nodes = preorder(tree, lambda node: node[1])
+        self.assertEqual([node[0] for node in nodes], [1, 2, 3, 4, 5])
+
+    def test_preorder_skips_undescended(self):
+        tree = [(1, [(2, [])]), (3, [(4, [])])]
+        nodes = preorder(tree, lambda node: node[1] if node[0] != 1 else None)
+        self.assertEqual([node[0] for node in nodes], [1, 3, 4])
+
+    def test_unfold(self):
+        items = ["a", ["b", ["c"], "d"], "e"]
+        self.assertEqual("".join(unfold(items, lambda item: item)), "abcde")
+
+
+class TestDeepTree(unittest.TestCase):
+    depth: int = 50_000
+
+    def setUp(self) -> None:
+        """Set up component tree deeper than the recursion limit."""
+        self.assertGreater(self.depth, sys.getrecursionlimit())
+        self.leaf = Text(text="leaf")
+        component = View(children=[self.leaf])
+        for _ in range(self.depth - 1):
+            component = View(children=[component])
+        self.component = component
+
+    def test_render(self):
+        rendition = repr(self.component)
+        self.assertTrue(rendition.startswith("<View >" * self.depth))
+        self.assertTrue(rendition.endswith("</View>" * self.depth))
+        self.assertIn("<Text >leaf</Text>", rendition)
+
+    def test_set_parent(self):
+        root = RootComponent(component_name="Deep", children=[self.component])
+        self.assertEqual(self.leaf.parent, "Deep")
+        self.assertEqual(root._imports["react-native"], {"View", "Text"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+"""Unittests for prop validation."""
+import threading
+import unittest
+
+from sweetpotato.components import Text, View
+from sweetpotato.config import settings
+from sweetpotato.core.base import Component, RootComponent, no_validation
+from sweetpotato.mixins import CustomMixin
+from sweetpotato.props.components_props import VIEW_PROPS
+
+
+class TestValidation(unittest.TestCase):
+    def test_unknown_props_rejected(self):
+        with self.assertRaises(AttributeError) as context:
+            View(style={}, bogus=1)
+        self.assertIn("bogus", str(context.exception))
+
+    def test_frozen_per_class(self):
+        self.assertIsInstance(Component.props, frozenset)
+        self.assertIsInstance(View.props, frozenset)
+        self.assertEqual(View.props, VIEW_PROPS)
+
+    def test_custom_mixin(self):
+        class Custom(RootComponent, CustomMixin):
+            extra_props = {"custom"}
+
+        self.assertIn("custom", Custom.props)
+        self.assertNotIn("custom", RootComponent.props)
+        self.assertNotIn("custom", VIEW_PROPS)
+        Custom(component_name="CustomValidated", custom=1)
+
+    def test_no_validation(self):
+        with no_validation():
+            text = Text(text="trusted", bogus=1)
+        self.assertIn("bogus={1}", repr(text))
+        with self.assertRaises(AttributeError):
+            Text(text="untrusted", bogus=1)
+
+    def test_context_scoped(self):
+        errors = []
+
+        def construct() -> None:
+            try:
+                View(bogus=1)
+            except AttributeError as error:
+                errors.append(error)
+
+        with no_validation():
+            thread = threading.Thread(target=construct)
+            thread.start()
+            thread.join()
+        self.assertEqual(len(errors), 1)
+
+    def test_setting(self):
+        settings.VALIDATE_PROPS = False
+        try:
+            View(bogus=1)
+        finally:
+            settings.VALIDATE_PROPS = True
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Unittests for batch builds of app variants."""
+import os
+import tempfile
+import unittest
+
+from sweetpotato.components import Text, View
+from sweetpotato.config import settings
+from sweetpotato.core.base import ComponentRegistry, RootComponent
+from sweetpotato.core.build import Build
+from sweetpotato.core.render_cache import MemoryRenderCache
+from sweetpotato.core.variants import Variant
+
+
+def factory(title: str = "Welcome") -> None:
+    """Creates a home screen with a title and a catalog shared by every variant."""
+    catalog = View(children=[Text(text=f"item {index}") for index in range(20)])
+    RootComponent(component_name="Home", children=[Text(text=title), catalog])
+
+
+class TestVariants(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up two variants differing in their title and API URL."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = MemoryRenderCache(self.directory.name, disk=False)
+        self.variants = [
+            Variant(
+                name,
+                os.path.join(self.directory.name, name),
+                settings={"API_URL": f"https://{name}.example.com"},
+                overrides={"title": f"Welcome to {name}"},
+            )
+            for name in ("acme", "globex")
+        ]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def screen(self, variant: Variant) -> str:
+        with open(
+            variant.output_dir / "src" / "components" / "Home.js", encoding="utf-8"
+        ) as file:
+            return file.read()
+
+    def test_written(self):
+        registry, api_url = ComponentRegistry._registry, settings.API_URL
+        Build.write_variants(factory, self.variants, cache=self.cache)
+        for variant in self.variants:
+            self.assertIn(f"Welcome to {variant.name}", self.screen(variant))
+            self.assertIn("item 19", self.screen(variant))
+        self.assertIs(ComponentRegistry._registry, registry)
+        self.assertEqual(settings.API_URL, api_url)
+        self.assertIn(api_url, settings.LOGIN_FUNCTION)
+
+    def test_shared_subtrees(self):
+        Build.write_variants(factory, self.variants[:1], cache=self.cache)
+        self.assertEqual(self.cache.hits, 0)
+        Build.write_variants(factory, self.variants[1:], cache=self.cache)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_output_settings_not_shared(self):
+        variant = self.variants[0]
+        variant.settings["HOIST_STYLES"] = not settings.HOIST_STYLES
+        Build.write_variants(factory, self.variants, cache=self.cache)
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_settings_applied(self):
+        urls = []
+        Build.write_variants(
+            lambda title: urls.append(settings.LOGIN_FUNCTION),
+            self.variants,
+            cache=self.cache,
+        )
+        self.assertIn("https://acme.example.com", urls[0])
+        self.assertIn("https://globex.example.com", urls[1])
+
+
+class TestMemoryRenderCache(unittest.TestCase):
+    def test_bounded(self):
+        cache = MemoryRenderCache(max_bytes=250, disk=False)
+        for index in range(5):
+            cache.put(f"{index:064x}", "x" * 100)
+        self.assertEqual(len(cache._renditions), 2)
+        self.assertIsNone(cache.get(f"{0:064x}"))
+        self.assertEqual(cache.get(f"{4:064x}"), "x" * 100)
+        self.assertEqual(cache.hits, 1)
+
+    def test_disk(self):
+        with tempfile.TemporaryDirectory() as directory:
+            MemoryRenderCache(directory).put("ab" * 32, "<View />")
+            cache = MemoryRenderCache(directory)
+            self.assertEqual(cache.get("ab" * 32), "<View />")
+            self.assertEqual((cache.hits, len(cache._renditions)), (0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
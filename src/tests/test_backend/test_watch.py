@@ -0,0 +1,147 @@
+"""Unittests for watch mode."""
+import io
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import mock
+
+from sweetpotato.config import settings
+from sweetpotato.core.base import ComponentRegistry
+from sweetpotato.core.build import Build
+from sweetpotato.core.watch import DevServer, Watcher
+
+SCREENS = """
+from sweetpotato.components import Text
+from sweetpotato.core.base import RootComponent
+
+RootComponent(component_name="Watched", children=[Text(text={text!r})])
+"""
+MAIN = """
+import watched_screens
+from sweetpotato.core.build import Build
+
+Build.run()
+"""
+SERVER = """
+import sys, time
+print("Starting Metro Bundler", flush=True)
+print("Waiting on http://localhost:8081", flush=True)
+time.sleep(float(sys.argv[1]))
+"""
+
+
+class TestWatcher(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up a project whose main script imports a module of screens."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = self.directory.name
+        self.write("watched_screens.py", SCREENS.format(text="first"))
+        self.write("main.py", MAIN)
+        sys.path.insert(0, self.root)
+        self.registry = ComponentRegistry._registry
+        ComponentRegistry._registry = {}
+        import watched_screens  # pylint: disable=import-outside-toplevel,unused-import
+
+        self.build = mock.Mock()
+        self.output = io.StringIO()
+        self.watcher = Watcher(
+            self.build,
+            main=os.path.join(self.root, "main.py"),
+            interval=0,
+            output=self.output,
+        )
+
+    def tearDown(self) -> None:
+        sys.path.remove(self.root)
+        sys.modules.pop("watched_screens", None)
+        ComponentRegistry._registry = self.registry
+        self.directory.cleanup()
+
+    def write(self, name: str, source: str) -> None:
+        """Writes a module, making sure its modification time changes."""
+        path = os.path.join(self.root, name)
+        mtime = os.stat(path).st_mtime_ns + 10**9 if os.path.exists(path) else None
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(textwrap.dedent(source))
+        if mtime:
+            os.utime(path, ns=(mtime, mtime))
+
+    def text(self) -> str:
+        return ComponentRegistry._registry["Watched"]._children[0]._children
+
+    def test_modules(self):
+        modules = [module.__name__ for module in self.watcher.modules()]
+        self.assertEqual(modules, ["watched_screens"])
+
+    def test_rebuilt(self):
+        self.assertIsNone(self.watcher.poll())
+        self.write("watched_screens.py", SCREENS.format(text="second"))
+        with mock.patch.object(Build, "write_files") as write_files:
+            self.assertTrue(self.watcher.poll())
+        write_files.assert_not_called()
+        self.build.assert_called_once_with()
+        self.assertEqual(self.text(), "second")
+        self.assertIsNone(self.watcher.poll())
+
+    def test_failed_reload(self):
+        registry = ComponentRegistry._registry
+        self.write("watched_screens.py", "RootComponent(")
+        self.assertFalse(self.watcher.poll())
+        self.assertIs(ComponentRegistry._registry, registry)
+        self.assertIn("SyntaxError", self.output.getvalue())
+        self.build.assert_not_called()
+
+    def test_unchanged_screens_skipped(self):
+        # Files prettier can not format, with no project installed, are written again.
+        formatter, settings.FORMATTER = settings.FORMATTER, None
+        self.addCleanup(setattr, settings, "FORMATTER", formatter)
+        with tempfile.TemporaryDirectory() as project:
+            self.watcher.build = lambda: Build.write_files(
+                use_cache=False, output_dir=project
+            )
+            self.watcher.rebuild()
+            path = os.path.join(project, "src", "components", "Watched.js")
+            modified = os.stat(path).st_mtime_ns
+            self.write("main.py", MAIN + "\n# Edited.\n")
+            self.assertTrue(self.watcher.poll())
+            self.assertEqual(os.stat(path).st_mtime_ns, modified)
+
+
+class TestDevServer(unittest.TestCase):
+    def setUp(self) -> None:
+        """Set up a dev server running a fake expo command."""
+        self.command = settings.DEV_SERVER_COMMAND
+        settings.DEV_SERVER_COMMAND = [sys.executable, "-c", SERVER]
+        self.output = io.StringIO()
+        self.server = DevServer(os.getcwd(), ["30"], output=self.output)
+
+    def tearDown(self) -> None:
+        self.server.stop()
+        settings.DEV_SERVER_COMMAND = self.command
+
+    def test_ready(self):
+        self.server.start()
+        self.assertTrue(self.server.wait_ready(10))
+        self.assertIn("Starting Metro Bundler\n", self.output.getvalue())
+        self.assertIsNone(self.server.poll())
+        self.server.stop()
+        self.assertIsNone(self.server.poll())
+
+    def test_restarted(self):
+        self.server.command[-1] = "0"
+        self.server.max_restarts = 1
+        self.server.start()
+        self.assertTrue(self.server.wait_ready(10))
+        self.server._process.wait()
+        self.server.supervise()
+        self.assertEqual(self.server.restarts, 1)
+        self.assertTrue(self.server.wait_ready(10))
+        self.server._process.wait()
+        with self.assertRaises(RuntimeError):
+            self.server.supervise()
+
+
+if __name__ == "__main__":
+    unittest.main()